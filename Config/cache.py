@@ -0,0 +1,7 @@
+import os
+
+# Caché en memoria de las respuestas de lectura (Servicios/CacheRespuestas.py).
+# Las mutaciones la invalidan al instante; el TTL solo acota cuánto puede quedar desactualizada
+# por cambios hechos desde otro proceso. Con 0 en cualquiera de los dos la caché no guarda nada.
+CACHE_MAX_ENTRADAS = int(os.getenv("AEROPUERTO_CACHE_MAX_ENTRADAS") or 256)
+CACHE_TTL_SEGUNDOS = float(os.getenv("AEROPUERTO_CACHE_TTL") or 30)
@@ -1,11 +1,132 @@
-from sqlalchemy import create_engine
+import os
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
-DATABASE_URL = "sqlite:///./aeropuerto.db"  # Puedes cambiar a PostgreSQL/MySQL si lo deseas
+# Configuración de la base de datos, tomada de variables de entorno.
+# AEROPUERTO_DB_URL permite cambiar a PostgreSQL/MySQL; los PRAGMA solo se aplican con SQLite.
+DATABASE_URL = os.getenv("AEROPUERTO_DB_URL", "sqlite:///./aeropuerto.db")
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _entero_de_entorno(nombre: str, por_defecto: int) -> int:
+    valor = os.getenv(nombre)
+    return int(valor) if valor not in (None, "") else por_defecto
+
+def _booleano_de_entorno(nombre: str, por_defecto: bool) -> bool:
+    valor = os.getenv(nombre)
+    if valor in (None, ""):
+        return por_defecto
+    return valor.strip().lower() in ("1", "true", "si", "sí", "yes")
+
+# PRAGMA que se ejecutan en cada conexión nueva a SQLite:
+# - journal_mode=WAL: los lectores no se bloquean mientras alguien escribe.
+# - synchronous=NORMAL: con WAL no se pierde consistencia y solo se sincroniza en los checkpoints.
+# - cache_size negativo: tamaño de la caché de páginas en KiB.
+# - mmap_size: bytes de la base que se leen por memoria mapeada.
+# - busy_timeout: milisegundos que se espera un bloqueo antes de fallar con "database is locked".
+PRAGMAS_SQLITE = {
+    "journal_mode": os.getenv("AEROPUERTO_SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("AEROPUERTO_SQLITE_SYNCHRONOUS", "NORMAL"),
+    "cache_size": _entero_de_entorno("AEROPUERTO_SQLITE_CACHE_SIZE", -64000),
+    "mmap_size": _entero_de_entorno("AEROPUERTO_SQLITE_MMAP_SIZE", 256 * 1024 * 1024),
+    "busy_timeout": _entero_de_entorno("AEROPUERTO_SQLITE_BUSY_TIMEOUT", 5000),
+}
+
+# Pool de conexiones (no aplica a SQLite en memoria, que usa una sola conexión)
+POOL_SIZE = _entero_de_entorno("AEROPUERTO_DB_POOL_SIZE", 10)
+MAX_OVERFLOW = _entero_de_entorno("AEROPUERTO_DB_MAX_OVERFLOW", 20)
+POOL_TIMEOUT = _entero_de_entorno("AEROPUERTO_DB_POOL_TIMEOUT", 30)
+
+# Si es False, los objetos conservan sus atributos tras el commit y leerlos no vuelve a consultar
+EXPIRE_ON_COMMIT = _booleano_de_entorno("AEROPUERTO_DB_EXPIRE_ON_COMMIT", True)
+
+# Con AEROPUERTO_DB_ASYNC las rutas de lectura usan un engine asyncio (aiosqlite con SQLite)
+# y AsyncSession; el resto de la aplicación sigue usando el engine síncrono.
+USAR_ASYNC = _booleano_de_entorno("AEROPUERTO_DB_ASYNC", False)
+
+# Drivers asyncio equivalentes a los drivers síncronos por defecto de cada base de datos
+DRIVERS_ASYNC = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+def crear_engine(url: str = None, pragmas: dict = None, pool_size: int = None,
+                 max_overflow: int = None, pool_timeout: int = None) -> Engine:
+    """
+    Crea el engine de la aplicación. Los parámetros que no se reciben se toman de la
+    configuración del módulo; con SQLite se registran los PRAGMA para cada conexión nueva.
+    """
+    url = make_url(url or DATABASE_URL)
+    opciones = {}
+    es_sqlite = url.get_backend_name() == "sqlite"
+    en_memoria = es_sqlite and url.database in (None, "", ":memory:")
+    if es_sqlite:
+        opciones["connect_args"] = {"check_same_thread": False}
+    if not en_memoria:
+        opciones["pool_size"] = POOL_SIZE if pool_size is None else pool_size
+        opciones["max_overflow"] = MAX_OVERFLOW if max_overflow is None else max_overflow
+        opciones["pool_timeout"] = POOL_TIMEOUT if pool_timeout is None else pool_timeout
+
+    nuevo_engine = create_engine(url, **opciones)
+    if es_sqlite:
+        _registrar_pragmas(nuevo_engine, PRAGMAS_SQLITE if pragmas is None else pragmas)
+    return nuevo_engine
+
+def crear_engine_async(url: str = None, pragmas: dict = None) -> AsyncEngine:
+    """
+    Crea el engine asyncio equivalente a crear_engine: misma base de datos, mismos PRAGMA
+    y mismo tamaño de pool, con el driver asyncio del motor (aiosqlite para SQLite).
+    Si ese driver no está instalado falla con un RuntimeError que lo nombra.
+    """
+    url = make_url(url or DATABASE_URL)
+    if url.get_backend_name() in DRIVERS_ASYNC and url.drivername == url.get_backend_name():
+        url = url.set(drivername=DRIVERS_ASYNC[url.get_backend_name()])
+    opciones = {}
+    es_sqlite = url.get_backend_name() == "sqlite"
+    if not (es_sqlite and url.database in (None, "", ":memory:")):
+        opciones.update(pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW, pool_timeout=POOL_TIMEOUT)
+
+    try:
+        nuevo_engine = create_async_engine(url, **opciones)
+    except ImportError as error:
+        raise RuntimeError(
+            f"AEROPUERTO_DB_ASYNC requiere el driver asyncio '{url.get_driver_name()}': "
+            f"instálelo (pip install {url.get_driver_name()}) o desactive AEROPUERTO_DB_ASYNC"
+        ) from error
+    if es_sqlite:
+        _registrar_pragmas(nuevo_engine.sync_engine, PRAGMAS_SQLITE if pragmas is None else pragmas)
+    return nuevo_engine
+
+def _registrar_pragmas(engine_sqlite: Engine, pragmas: dict):
+    """Ejecuta los PRAGMA recibidos en cada conexión nueva del engine"""
+    @event.listens_for(engine_sqlite, "connect")
+    def _aplicar_pragmas(conexion_dbapi, registro_conexion):
+        cursor = conexion_dbapi.cursor()
+        try:
+            for nombre, valor in pragmas.items():
+                if valor is not None:
+                    cursor.execute(f"PRAGMA {nombre}={valor}")
+        finally:
+            cursor.close()
+
+def crear_sessionmaker(bind: Engine, expire_on_commit: bool = None) -> sessionmaker:
+    """Crea la fábrica de sesiones para un engine"""
+    return sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=bind,
+        expire_on_commit=EXPIRE_ON_COMMIT if expire_on_commit is None else expire_on_commit
+    )
+
+engine = crear_engine()
+SessionLocal = crear_sessionmaker(engine)
+
+# El engine asyncio solo se crea si está activado, así su driver no es obligatorio.
+# Las sesiones async no expiran en el commit: leer un atributo expirado requeriría I/O implícito.
+engine_async = crear_engine_async() if USAR_ASYNC else None
+AsyncSessionLocal = async_sessionmaker(bind=engine_async, expire_on_commit=False) if USAR_ASYNC else None
 
 def get_db():
     db: Session = SessionLocal()
@@ -13,3 +134,10 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_db_async():
+    db: AsyncSession = AsyncSessionLocal()
+    try:
+        yield db
+    finally:
+        await db.close()
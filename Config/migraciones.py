@@ -0,0 +1,155 @@
+from sqlalchemy import Column, Integer, MetaData, Table, inspect, select, text, update
+from sqlalchemy.engine import Connection, Engine
+from Dominio.Modelos.Vuelo import PRIORIDAD_MAXIMA, PRIORIDAD_MINIMA, Vuelo
+from Repositorios.ListaDobleEnlazadaCentinelasRepo import ESPACIO_POSICIONES
+
+# Tabla con la versión de esquema aplicada a la base de datos.
+# create_all crea las tablas nuevas pero no modifica las existentes, así que los
+# cambios sobre tablas que ya existen en aeropuerto.db se aplican como migraciones.
+_metadata = MetaData()
+version_esquema = Table(
+    "version_esquema", _metadata,
+    Column("version", Integer, nullable=False)
+)
+
+def _columnas(conexion: Connection, tabla: str) -> set:
+    return {columna["name"] for columna in inspect(conexion).get_columns(tabla)}
+
+def _acotar_prioridades(conexion: Connection):
+    """
+    Lleva al rango PRIORIDAD_MINIMA..PRIORIDAD_MAXIMA las prioridades guardadas antes de que la API
+    lo validara. Su clave de orden no cambia: ya se calculaba con la prioridad acotada.
+    """
+    vuelos = Vuelo.__table__
+    conexion.execute(
+        update(vuelos).where(vuelos.c.prioridad < PRIORIDAD_MINIMA).values(prioridad=PRIORIDAD_MINIMA)
+    )
+    conexion.execute(
+        update(vuelos).where(vuelos.c.prioridad > PRIORIDAD_MAXIMA).values(prioridad=PRIORIDAD_MAXIMA)
+    )
+
+def _agregar_clave_orden_a_vuelos(conexion: Connection):
+    """Agrega vuelos.clave_orden con su índice y la calcula para los vuelos existentes"""
+    _acotar_prioridades(conexion)
+    if "clave_orden" not in _columnas(conexion, "vuelos"):
+        conexion.execute(text("ALTER TABLE vuelos ADD COLUMN clave_orden VARCHAR"))
+    conexion.execute(text("CREATE INDEX IF NOT EXISTS ix_vuelos_clave_orden ON vuelos (clave_orden)"))
+
+    vuelos = Vuelo.__table__
+    pendientes = conexion.execute(
+        select(vuelos.c.id, vuelos.c.emergencia, vuelos.c.prioridad, vuelos.c.hora_salida)
+        .where(vuelos.c.clave_orden.is_(None))
+    ).all()
+    for fila in pendientes:
+        conexion.execute(
+            update(vuelos).where(vuelos.c.id == fila.id).values(
+                clave_orden=Vuelo.calcular_clave_orden(fila.emergencia, fila.prioridad, fila.hora_salida)
+            )
+        )
+
+def _agregar_ultimos_validos_a_listas(conexion: Connection):
+    """Agrega ListaDobleEnlazadaCentinelas.ultimos_validos (la tabla de últimos nodos se crea con create_all)"""
+    if "ultimos_validos" not in _columnas(conexion, "ListaDobleEnlazadaCentinelas"):
+        conexion.execute(text(
+            'ALTER TABLE "ListaDobleEnlazadaCentinelas" ADD COLUMN ultimos_validos BOOLEAN NOT NULL DEFAULT 0'
+        ))
+
+def _agregar_lista_a_nodos(conexion: Connection):
+    """
+    Agrega NodoDobleVuelos.lista_id con el índice (lista_id, posicion), la asigna recorriendo
+    los enlaces de cada lista y recalcula tamanio contando los nodos, por si se había desfasado.
+    Las bases anteriores pueden tener posiciones densas o repetidas, así que el mismo recorrido
+    renumera los nodos regulares con posiciones dispersas en el orden de sus enlaces.
+    """
+    if "lista_id" not in _columnas(conexion, "NodoDobleVuelos"):
+        conexion.execute(text(
+            'ALTER TABLE "NodoDobleVuelos" ADD COLUMN lista_id INTEGER REFERENCES "ListaDobleEnlazadaCentinelas" (id)'
+        ))
+    conexion.execute(text(
+        'CREATE INDEX IF NOT EXISTS "ix_NodoDobleVuelos_lista_posicion" ON "NodoDobleVuelos" (lista_id, posicion)'
+    ))
+
+    listas = conexion.execute(text('SELECT id, cabezon_id FROM "ListaDobleEnlazadaCentinelas"')).all()
+    for lista_id, cabezon_id in listas:
+        # orden: 0 para el cabezon y 1, 2, ... para los nodos siguientes. El tope por la cantidad
+        # de nodos corta el recorrido si los enlaces de una base dañada forman un ciclo.
+        conexion.execute(text('''
+            WITH RECURSIVE recorrido(id, siguiente_id, orden) AS (
+                SELECT id, siguiente_id, 0 FROM "NodoDobleVuelos" WHERE id = :cabezon_id
+                UNION ALL
+                SELECT nodo.id, nodo.siguiente_id, recorrido.orden + 1
+                FROM "NodoDobleVuelos" AS nodo JOIN recorrido ON nodo.id = recorrido.siguiente_id
+                WHERE recorrido.orden < (SELECT count(*) FROM "NodoDobleVuelos")
+            )
+            UPDATE "NodoDobleVuelos" SET
+                lista_id = :lista_id,
+                posicion = CASE WHEN centinela IS NULL THEN (
+                    SELECT (min(recorrido.orden) - 1) * :espacio FROM recorrido
+                    WHERE recorrido.id = "NodoDobleVuelos".id
+                ) ELSE posicion END
+            WHERE id IN (SELECT id FROM recorrido)
+        '''), {"lista_id": lista_id, "cabezon_id": cabezon_id, "espacio": ESPACIO_POSICIONES})
+        conexion.execute(text('''
+            UPDATE "ListaDobleEnlazadaCentinelas" SET tamanio = (
+                SELECT count(*) FROM "NodoDobleVuelos"
+                WHERE lista_id = :lista_id AND centinela IS NULL
+            ) WHERE id = :lista_id
+        '''), {"lista_id": lista_id})
+
+# Índices sobre las columnas por las que se filtra en cada petición: los enlaces que recorren
+# el reordenamiento y las cargas de relaciones (anterior_id, siguiente_id, vuelo_id) y los
+# centinelas de cada lista, que el ORM consulta al eliminar nodos. ListaDobleEnlazadaCentinelas.nombre
+# ya tiene el índice de su restricción UNIQUE; activo y centinela casi no discriminan filas
+# (todos los nodos están activos y solo hay dos centinelas por lista), así que no se indexan.
+INDICES_DE_CONSULTA = [
+    ("ix_NodoDobleVuelos_anterior_id", "NodoDobleVuelos", "anterior_id"),
+    ("ix_NodoDobleVuelos_siguiente_id", "NodoDobleVuelos", "siguiente_id"),
+    ("ix_NodoDobleVuelos_vuelo_id", "NodoDobleVuelos", "vuelo_id"),
+    ("ix_ListaDobleEnlazadaCentinelas_cabezon_id", "ListaDobleEnlazadaCentinelas", "cabezon_id"),
+    ("ix_ListaDobleEnlazadaCentinelas_colon_id", "ListaDobleEnlazadaCentinelas", "colon_id"),
+]
+
+def _crear_indices_de_consulta(conexion: Connection):
+    """Crea los índices de INDICES_DE_CONSULTA (create_all ya los crea en las bases nuevas)"""
+    for nombre, tabla, columna in INDICES_DE_CONSULTA:
+        conexion.execute(text(f'CREATE INDEX IF NOT EXISTS "{nombre}" ON "{tabla}" ({columna})'))
+
+def _indexar_paginas_de_vuelos(conexion: Connection):
+    """Crea el índice (hora_salida, id) sobre el que se paginan los vuelos"""
+    conexion.execute(text(
+        'CREATE INDEX IF NOT EXISTS "ix_vuelos_hora_salida_id" ON "vuelos" (hora_salida, id)'
+    ))
+
+def _indexar_estados_de_vuelos(conexion: Connection):
+    """Crea el índice (estado, emergencia) sobre el que se cuentan los vuelos de cada estado"""
+    conexion.execute(text(
+        'CREATE INDEX IF NOT EXISTS "ix_vuelos_estado_emergencia" ON "vuelos" (estado, emergencia)'
+    ))
+
+# Migraciones en orden: (versión, descripción, función que la aplica).
+# Cada paso debe poder ejecutarse sobre una base recién creada por create_all.
+MIGRACIONES = [
+    (1, "Clave de orden indexada en vuelos", _agregar_clave_orden_a_vuelos),
+    (2, "Últimos nodos por cubeta de prioridad", _agregar_ultimos_validos_a_listas),
+    (3, "Lista de cada nodo indexada con su posición", _agregar_lista_a_nodos),
+    (4, "Índices para los filtros de las consultas frecuentes", _crear_indices_de_consulta),
+    (5, "Índice de paginación de vuelos por hora de salida", _indexar_paginas_de_vuelos),
+    (6, "Prioridades de vuelos dentro de su rango", _acotar_prioridades),
+    (7, "Índice de vuelos por estado", _indexar_estados_de_vuelos),
+]
+
+def aplicar_migraciones(engine: Engine):
+    """Aplica, en una transacción cada una, las migraciones pendientes de la base de datos"""
+    _metadata.create_all(bind=engine)
+    with engine.begin() as conexion:
+        version = conexion.execute(select(version_esquema.c.version)).scalar()
+        if version is None:
+            conexion.execute(version_esquema.insert().values(version=0))
+            version = 0
+
+    for numero, descripcion, paso in MIGRACIONES:
+        if numero <= version:
+            continue
+        with engine.begin() as conexion:
+            paso(conexion)
+            conexion.execute(update(version_esquema).values(version=numero))
@@ -0,0 +1,24 @@
+import os
+from Dominio.Estructuras.TDA_Lista_doblemente_enlazada import ListaDoblementeEnlazadaCentinela
+from Dominio.Estructuras.TDA_Lista_con_saltos import ListaIndexadaConSaltos
+from Dominio.Estructuras.TDA_Lista_por_cubetas import ListaPorCubetasDePrioridad
+
+# Motores disponibles para la lista de vuelos en memoria
+MOTORES = {
+    "enlazada": ListaDoblementeEnlazadaCentinela,
+    "saltos": ListaIndexadaConSaltos,
+    "cubetas": ListaPorCubetasDePrioridad,
+}
+
+# Motor por defecto, seleccionable con la variable de entorno AEROPUERTO_MOTOR_LISTA
+MOTOR_POR_DEFECTO = os.getenv("AEROPUERTO_MOTOR_LISTA", "enlazada")
+
+def crear_lista_vuelos(motor: str = None):
+    """
+    Crea una lista de vuelos vacía con el motor indicado ("enlazada", "saltos" o "cubetas").
+    Todos los motores exponen la misma interfaz pública.
+    """
+    motor = motor or MOTOR_POR_DEFECTO
+    if motor not in MOTORES:
+        raise ValueError(f"Motor de lista desconocido: {motor}. Opciones: {', '.join(MOTORES)}")
+    return MOTORES[motor]()
@@ -0,0 +1,7 @@
+from Dominio.Estructuras.NodoDoble import NodoDoble
+
+class NodoCubeta(NodoDoble):
+    __slots__ = '_clave',
+    def __init__(self, elemento=None, anterior=None, siguiente=None, clave=None):
+        super().__init__(elemento, anterior, siguiente)
+        self._clave = clave  # Clave de orden del vuelo al momento de insertarlo
@@ -0,0 +1,7 @@
+class NodoSalto:
+    __slots__ = '_elemento', '_anteriores', '_siguientes', '_anchos'
+    def __init__(self, elemento=None, nivel=1):
+        self._elemento = elemento
+        self._anteriores = [None] * nivel  # Enlace al nodo anterior en cada nivel (el cabezon si no hay otro)
+        self._siguientes = [None] * nivel  # Enlace al siguiente nodo en cada nivel
+        self._anchos = [0] * nivel         # Cantidad de posiciones que salta cada enlace
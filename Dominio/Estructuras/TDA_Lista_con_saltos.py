@@ -0,0 +1,268 @@
+import random
+from Dominio.Estructuras.NodoSalto import NodoSalto
+
+class ListaIndexadaConSaltos:
+    """
+    Lista indexable con saltos (skip list) con la misma interfaz pública que
+    ListaDoblementeEnlazadaCentinela.
+
+    Cada enlace guarda cuántas posiciones avanza, de modo que el acceso por
+    posición y la búsqueda del lugar según (emergencia, prioridad, hora_salida)
+    bajan por los niveles en O(log n) esperado en lugar de recorrer la lista.
+    Cada nivel está doblemente enlazado, con el cabezon como centinela: desde un
+    nodo ubicado por su id se retrocede hasta el cabezon por los enlaces más altos,
+    así que su posición y sus predecesores también salen en O(log n) esperado.
+
+    Las alturas de los nodos se sortean con un generador propio (`semilla`), así que
+    la estructura no depende del estado global de `random` ni lo altera.
+    """
+    MAX_NIVEL = 32
+
+    def __init__(self, semilla=None):
+        self._aleatorio = random.Random(semilla)
+        self._cabezon = NodoSalto(nivel=self.MAX_NIVEL)
+        self._ultimo = None
+        self._nivel = 1
+        self._tamanio = 0
+        self._cabezon._anchos[0] = 1
+        self._nodos = {}  # id de vuelo -> nodo
+
+    def __contains__(self, vuelo):
+        return vuelo.id in self._nodos
+
+    def __len__(self):
+        return self._tamanio
+
+    def esta_vacia(self):
+        return self._tamanio == 0
+
+    def insertar_al_frente(self, vuelo):
+        """Inserta un vuelo al inicio de la lista"""
+        self._insertar_en_rango(vuelo, 0)
+
+    def insertar_al_final(self, vuelo):
+        """Inserta un vuelo al final de la lista"""
+        self._insertar_en_rango(vuelo, self._tamanio)
+
+    def insertar_en_posicion(self, vuelo, posicion):
+        """Inserta un vuelo en una posición específica de la lista"""
+        if posicion <= 0:
+            self.insertar_al_frente(vuelo)
+        elif posicion >= self._tamanio:
+            self.insertar_al_final(vuelo)
+        else:
+            self._insertar_en_rango(vuelo, posicion)
+
+    def insertar_ordenado_por_prioridad(self, vuelo):
+        """
+        Inserta un vuelo en la posición correcta según su prioridad y emergencia.
+
+        Los vuelos de emergencia van al frente de la lista.
+        Los vuelos regulares se ordenan por prioridad (mayor prioridad primero)
+        y en caso de igual prioridad, por hora de salida.
+        """
+        if vuelo.emergencia:
+            self.insertar_al_frente(vuelo)
+            return
+
+        def va_antes(elemento):
+            return (
+                elemento.emergencia or
+                elemento.prioridad > vuelo.prioridad or
+                (elemento.prioridad == vuelo.prioridad and elemento.hora_salida <= vuelo.hora_salida)
+            )
+
+        # Bajar por los niveles saltando todos los vuelos que van antes del nuevo
+        _, posiciones = self._buscar_predecesores(lambda indice, nodo: va_antes(nodo._elemento))
+        self._insertar_en_rango(vuelo, posiciones[0] + 1)
+
+    def _nivel_aleatorio(self):
+        """Sortea la altura de un nodo nuevo (distribución geométrica con p = 1/2)"""
+        nivel = 1
+        while nivel < self.MAX_NIVEL and self._aleatorio.random() < 0.5:
+            nivel += 1
+        return nivel
+
+    def _buscar_predecesores(self, avanzar):
+        """
+        Desciende desde el nivel más alto y devuelve, por cada nivel, el último nodo
+        alcanzado y su posición (-1 para el cabezon). `avanzar(indice, nodo)` decide
+        si se puede saltar al nodo siguiente, que está en la posición `indice`.
+        """
+        predecesores = [self._cabezon] * self.MAX_NIVEL
+        posiciones = [-1] * self.MAX_NIVEL
+        actual = self._cabezon
+        indice = -1
+        for nivel in range(self._nivel - 1, -1, -1):
+            siguiente = actual._siguientes[nivel]
+            while siguiente is not None and avanzar(indice + actual._anchos[nivel], siguiente):
+                indice += actual._anchos[nivel]
+                actual = siguiente
+                siguiente = actual._siguientes[nivel]
+            predecesores[nivel] = actual
+            posiciones[nivel] = indice
+        return predecesores, posiciones
+
+    def _predecesores_de_posicion(self, posicion):
+        """Predecesores del nodo que ocupa (o va a ocupar) la posición indicada"""
+        return self._buscar_predecesores(lambda indice, nodo: indice < posicion)
+
+    def _insertar_en_rango(self, vuelo, posicion):
+        """Inserta un vuelo para que quede exactamente en la posición indicada"""
+        nivel = self._nivel_aleatorio()
+        if nivel > self._nivel:
+            # Los niveles nuevos del cabezon saltan hasta el final de la lista
+            for i in range(self._nivel, nivel):
+                self._cabezon._siguientes[i] = None
+                self._cabezon._anchos[i] = self._tamanio + 1
+            self._nivel = nivel
+
+        predecesores, posiciones = self._predecesores_de_posicion(posicion)
+        nuevo = NodoSalto(vuelo, nivel)
+        self._nodos[vuelo.id] = nuevo
+        for i in range(nivel):
+            previo = predecesores[i]
+            siguiente = previo._siguientes[i]
+            nuevo._anteriores[i] = previo
+            nuevo._siguientes[i] = siguiente
+            nuevo._anchos[i] = posiciones[i] + previo._anchos[i] + 1 - posicion
+            previo._siguientes[i] = nuevo
+            previo._anchos[i] = posicion - posiciones[i]
+            if siguiente is not None:
+                siguiente._anteriores[i] = nuevo
+        for i in range(nivel, self._nivel):
+            predecesores[i]._anchos[i] += 1
+
+        if nuevo._siguientes[0] is None:
+            self._ultimo = nuevo
+        self._tamanio += 1
+        return nuevo
+
+    def extraer_de_posicion(self, posicion):
+        """Elimina y devuelve el vuelo en la posición especificada"""
+        if self.esta_vacia() or posicion < 0 or posicion >= self._tamanio:
+            return None
+        predecesores, _ = self._predecesores_de_posicion(posicion)
+        return self._eliminar_nodo(predecesores[0]._siguientes[0], predecesores)
+
+    def _eliminar_nodo(self, nodo, predecesores):
+        """Desenlaza un nodo de todos los niveles y devuelve su elemento"""
+        nivel_nodo = len(nodo._siguientes)
+        if nodo._siguientes[0] is None:
+            self._ultimo = predecesores[0] if predecesores[0] is not self._cabezon else None
+        for i in range(nivel_nodo):
+            previo = predecesores[i]
+            siguiente = nodo._siguientes[i]
+            previo._anchos[i] += nodo._anchos[i] - 1
+            previo._siguientes[i] = siguiente
+            if siguiente is not None:
+                siguiente._anteriores[i] = previo
+        for i in range(nivel_nodo, self._nivel):
+            predecesores[i]._anchos[i] -= 1
+
+        self._tamanio -= 1
+        elemento = nodo._elemento
+        if self._nodos.get(elemento.id) is nodo:
+            del self._nodos[elemento.id]
+        nodo._elemento = None
+        nodo._anteriores = nodo._siguientes = nodo._anchos = None
+        return elemento
+
+    def obtener_primero(self):
+        """Devuelve el primer vuelo de la lista sin eliminarlo"""
+        if self.esta_vacia():
+            return None
+        return self._cabezon._siguientes[0]._elemento
+
+    def obtener_ultimo(self):
+        """Devuelve el último vuelo de la lista sin eliminarlo"""
+        if self.esta_vacia():
+            return None
+        return self._ultimo._elemento
+
+    def obtener_en_posicion(self, posicion):
+        """Devuelve el vuelo en la posición especificada sin eliminarlo"""
+        if self.esta_vacia() or posicion < 0 or posicion >= self._tamanio:
+            return None
+        predecesores, _ = self._predecesores_de_posicion(posicion)
+        return predecesores[0]._siguientes[0]._elemento
+
+    def obtener_por_id(self, vuelo_id):
+        """Devuelve el vuelo con el id indicado sin eliminarlo, o None si no está en la lista"""
+        nodo = self._nodos.get(vuelo_id)
+        return nodo._elemento if nodo else None
+
+    def extraer_por_id(self, vuelo_id):
+        """Elimina y devuelve el vuelo con el id indicado, o None si no está en la lista"""
+        nodo = self._nodos.get(vuelo_id)
+        if not nodo:
+            return None
+        predecesores, _ = self._predecesores_de_nodo(nodo)
+        return self._eliminar_nodo(nodo, predecesores)
+
+    def posicion_de_id(self, vuelo_id):
+        """Posición del vuelo con el id indicado, o None si no está en la lista"""
+        nodo = self._nodos.get(vuelo_id)
+        if not nodo:
+            return None
+        _, posicion = self._predecesores_de_nodo(nodo)
+        return posicion
+
+    def _predecesores_de_nodo(self, nodo):
+        """
+        Predecesores de un nodo en cada nivel y su posición, retrocediendo hasta el
+        cabezon siempre por el enlace más alto del nodo actual: es el camino de
+        _buscar_predecesores recorrido al revés, O(log n) esperado.
+        """
+        predecesores = [self._cabezon] * self.MAX_NIVEL
+        alto = len(nodo._anteriores)
+        predecesores[:alto] = nodo._anteriores
+        posicion = -1
+        actual = nodo
+        while actual is not self._cabezon:
+            nivel = len(actual._anteriores) - 1
+            previo = actual._anteriores[nivel]
+            posicion += previo._anchos[nivel]
+            actual = previo
+            # Los nodos que se saltaron son más bajos que `alto`: el primero más alto
+            # que se alcanza es el predecesor del nodo en los niveles que le faltan
+            if actual is not self._cabezon and len(actual._anteriores) > alto:
+                predecesores[alto:len(actual._anteriores)] = [actual] * (len(actual._anteriores) - alto)
+                alto = len(actual._anteriores)
+        return predecesores, posicion
+
+    def actualizar_posicion_por_prioridad(self, vuelo):
+        """
+        Actualiza la posición de un vuelo existente basado en su nueva prioridad o estado de emergencia.
+        Este método se llama después de cambiar la prioridad o el estado de emergencia de un vuelo.
+        """
+        vuelo_extraido = self.extraer_por_id(vuelo.id)
+        if vuelo_extraido is None:
+            return False
+
+        self.insertar_ordenado_por_prioridad(vuelo_extraido)
+        return True
+
+    def mover_vuelo(self, posicion_origen, posicion_destino):
+        """Mueve un vuelo de una posición a otra en la lista"""
+        if (
+            posicion_origen < 0 or posicion_origen >= self._tamanio or
+            posicion_destino < 0 or posicion_destino >= self._tamanio or
+            posicion_origen == posicion_destino
+        ):
+            return False
+        vuelo = self.extraer_de_posicion(posicion_origen)
+        if posicion_destino > posicion_origen:
+            posicion_destino -= 1
+        self.insertar_en_posicion(vuelo, posicion_destino)
+        return True
+
+    def __iter__(self):
+        """Permite iterar sobre los vuelos de la lista"""
+        actual = self._cabezon._siguientes[0]
+        while actual is not None:
+            yield actual._elemento
+            actual = actual._siguientes[0]
+
+    def __str__(self):
+        return ' <-> '.join(str(v) for v in self)
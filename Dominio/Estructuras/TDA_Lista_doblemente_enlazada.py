@@ -1,4 +1,4 @@
-from Estructuras.NodoDoble import NodoDoble
+from Dominio.Estructuras.NodoDoble import NodoDoble
 
 class ListaDoblementeEnlazadaCentinela:
     """Lista doblemente enlazada con nodos centinela (cabezon y colon)."""
@@ -8,6 +8,7 @@ class ListaDoblementeEnlazadaCentinela:
         self._cabezon._siguiente = self._colon
         self._colon._anterior = self._cabezon
         self._tamanio = 0
+        self._nodos = {}  # id de vuelo -> nodo, para ubicar un vuelo sin recorrer la lista
 
     def __len__(self):
         return self._tamanio
@@ -15,6 +16,9 @@ class ListaDoblementeEnlazadaCentinela:
     def esta_vacia(self):
         return self._tamanio == 0
 
+    def __contains__(self, vuelo):
+        return vuelo.id in self._nodos
+
     def insertar_al_frente(self, vuelo):
         """Inserta un vuelo al inicio de la lista (después del cabezon)"""
         self._insertar_entre(vuelo, self._cabezon, self._cabezon._siguiente)
@@ -63,7 +67,7 @@ class ListaDoblementeEnlazadaCentinela:
             posicion += 1
             
         # Luego insertamos según prioridad (descendente)
-        while actual != self._colon and not actual._elemento.emergencia and actual._elemento.prioridad >= vuelo.prioridad:
+        while actual != self._colon and not actual._elemento.emergencia and actual._elemento.prioridad > vuelo.prioridad:
             actual = actual._siguiente
             posicion += 1
             
@@ -81,6 +85,7 @@ class ListaDoblementeEnlazadaCentinela:
         anterior._siguiente = nuevo
         siguiente._anterior = nuevo
         self._tamanio += 1
+        self._nodos[vuelo.id] = nuevo
         return nuevo
 
     def extraer_de_posicion(self, posicion):
@@ -100,9 +105,40 @@ class ListaDoblementeEnlazadaCentinela:
         siguiente._anterior = anterior
         self._tamanio -= 1
         elemento = nodo._elemento
+        if self._nodos.get(elemento.id) is nodo:
+            del self._nodos[elemento.id]
         nodo._anterior = nodo._siguiente = nodo._elemento = None
         return elemento
 
+    def obtener_por_id(self, vuelo_id):
+        """Devuelve el vuelo con el id indicado sin eliminarlo, o None si no está en la lista"""
+        nodo = self._nodos.get(vuelo_id)
+        return nodo._elemento if nodo else None
+
+    def extraer_por_id(self, vuelo_id):
+        """Elimina y devuelve el vuelo con el id indicado, o None si no está en la lista"""
+        nodo = self._nodos.get(vuelo_id)
+        return self._eliminar_nodo(nodo) if nodo else None
+
+    def posicion_de_id(self, vuelo_id):
+        """
+        Posición del vuelo con el id indicado, o None si no está en la lista. Avanza desde
+        el nodo hacia ambos extremos a la vez, así que recorre min(posición, n - posición) nodos.
+        """
+        nodo = self._nodos.get(vuelo_id)
+        if not nodo:
+            return None
+        hacia_atras = hacia_adelante = nodo
+        pasos = 0
+        while True:
+            hacia_atras = hacia_atras._anterior
+            if hacia_atras is self._cabezon:
+                return pasos
+            hacia_adelante = hacia_adelante._siguiente
+            if hacia_adelante is self._colon:
+                return self._tamanio - 1 - pasos
+            pasos += 1
+
     def obtener_primero(self):
         """Devuelve el primer vuelo de la lista sin eliminarlo"""
         if self.esta_vacia():
@@ -115,22 +151,22 @@ class ListaDoblementeEnlazadaCentinela:
             return None
         return self._colon._anterior._elemento
         
+    def obtener_en_posicion(self, posicion):
+        """Devuelve el vuelo en la posición especificada sin eliminarlo"""
+        if self.esta_vacia() or posicion < 0 or posicion >= self._tamanio:
+            return None
+        actual = self._cabezon._siguiente
+        for _ in range(posicion):
+            actual = actual._siguiente
+        return actual._elemento
+        
     def actualizar_posicion_por_prioridad(self, vuelo):
         """
         Actualiza la posición de un vuelo existente basado en su nueva prioridad o estado de emergencia.
         Este método se llama después de cambiar la prioridad o el estado de emergencia de un vuelo.
         """
         # Buscar el nodo que contiene el vuelo
-        nodo_actual = self._cabezon._siguiente
-        posicion_actual = 0
-        nodo_vuelo = None
-        
-        while nodo_actual != self._colon:
-            if nodo_actual._elemento.id == vuelo.id:
-                nodo_vuelo = nodo_actual
-                break
-            nodo_actual = nodo_actual._siguiente
-            posicion_actual += 1
+        nodo_vuelo = self._nodos.get(vuelo.id)
             
         # Si no encontramos el vuelo, no hay nada que hacer
         if not nodo_vuelo:
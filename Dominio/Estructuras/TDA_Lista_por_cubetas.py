@@ -0,0 +1,128 @@
+from bisect import bisect_right, insort
+from Dominio.Estructuras.NodoCubeta import NodoCubeta
+from Dominio.Estructuras.TDA_Lista_doblemente_enlazada import ListaDoblementeEnlazadaCentinela
+
+class ListaPorCubetasDePrioridad(ListaDoblementeEnlazadaCentinela):
+    """
+    Lista doblemente enlazada con centinelas que además agrupa los vuelos en cubetas
+    de prioridad (bucket queue).
+
+    Cada cubeta es una sublista contigua dentro de la lista, delimitada por su primer y
+    su último nodo: una cubeta por prioridad para los vuelos regulares y una para todos
+    los de emergencia, que el TDA siempre inserta al frente sin importar su prioridad.
+    Para insertar en orden basta ubicar la cubeta siguiente a la del vuelo y retroceder
+    solo sobre los vuelos de su misma cubeta con hora de salida posterior.
+
+    Las cubetas se mantienen mientras la lista esté ordenada. Si una inserción por
+    posición o un movimiento la desordena se descartan, y la siguiente inserción
+    ordenada las reconstruye (o, si la lista sigue desordenada, busca de forma lineal
+    como ListaDoblementeEnlazadaCentinela).
+    """
+    def __init__(self):
+        super().__init__()
+        self._cubetas = {}         # cubeta -> [primer nodo, último nodo]; None si no son válidas
+        self._orden_cubetas = []   # cubetas no vacías, en el orden de la lista
+
+    @staticmethod
+    def _clave_de(vuelo):
+        """Clave de orden del TDA: emergencias primero y luego mayor prioridad y menor hora de salida"""
+        if vuelo.emergencia:
+            return (0,)
+        return (1, -vuelo.prioridad, vuelo.hora_salida)
+
+    @staticmethod
+    def _cubeta_de(clave):
+        return clave[:2]
+
+    def insertar_ordenado_por_prioridad(self, vuelo):
+        """
+        Inserta un vuelo en la posición correcta según su prioridad y emergencia.
+
+        Los vuelos de emergencia van al frente de la lista.
+        Los vuelos regulares se ordenan por prioridad (mayor prioridad primero)
+        y en caso de igual prioridad, por hora de salida.
+        """
+        if self._cubetas is None and not self._reconstruir_cubetas():
+            super().insertar_ordenado_por_prioridad(vuelo)
+            return
+
+        if vuelo.emergencia:
+            self.insertar_al_frente(vuelo)
+            return
+
+        # El vuelo va antes del primer nodo de la cubeta siguiente a la suya...
+        clave = self._clave_de(vuelo)
+        indice = bisect_right(self._orden_cubetas, self._cubeta_de(clave))
+        siguiente = self._cubetas[self._orden_cubetas[indice]][0] if indice < len(self._orden_cubetas) else self._colon
+
+        # ...y detrás de los vuelos de su cubeta con la misma o menor hora de salida
+        anterior = siguiente._anterior
+        while anterior is not self._cabezon and anterior._clave > clave:
+            anterior = anterior._anterior
+        self._insertar_entre(vuelo, anterior, anterior._siguiente)
+
+    def _insertar_entre(self, vuelo, anterior, siguiente):
+        """Inserta un vuelo entre dos nodos existentes y lo agrega a su cubeta"""
+        nuevo = NodoCubeta(vuelo, anterior, siguiente, self._clave_de(vuelo))
+        anterior._siguiente = nuevo
+        siguiente._anterior = nuevo
+        self._tamanio += 1
+        self._nodos[vuelo.id] = nuevo
+
+        if self._cubetas is not None:
+            if (anterior is not self._cabezon and anterior._clave > nuevo._clave) or \
+                    (siguiente is not self._colon and nuevo._clave > siguiente._clave):
+                # La inserción desordena la lista
+                self._cubetas = None
+            else:
+                self._agregar_a_cubeta(nuevo)
+        return nuevo
+
+    def _eliminar_nodo(self, nodo):
+        """Elimina un nodo de la lista y de su cubeta y devuelve su elemento"""
+        if self._cubetas is not None:
+            cubeta = self._cubeta_de(nodo._clave)
+            rango = self._cubetas[cubeta]
+            if rango[0] is nodo and rango[1] is nodo:
+                del self._cubetas[cubeta]
+                self._orden_cubetas.remove(cubeta)
+            elif rango[0] is nodo:
+                rango[0] = nodo._siguiente
+            elif rango[1] is nodo:
+                rango[1] = nodo._anterior
+        return super()._eliminar_nodo(nodo)
+
+    def _agregar_a_cubeta(self, nodo):
+        """Extiende la cubeta del nodo (ya enlazado en orden) para que lo incluya"""
+        cubeta = self._cubeta_de(nodo._clave)
+        rango = self._cubetas.get(cubeta)
+        if rango is None:
+            self._cubetas[cubeta] = [nodo, nodo]
+            insort(self._orden_cubetas, cubeta)
+            return
+        if nodo._siguiente is rango[0]:
+            rango[0] = nodo
+        if nodo._anterior is rango[1]:
+            rango[1] = nodo
+
+    def _reconstruir_cubetas(self):
+        """
+        Recorre la lista y vuelve a armar las cubetas.
+        Devuelve False (y las deja sin armar) si la lista no está ordenada.
+        """
+        cubetas = {}
+        anterior = None
+        actual = self._cabezon._siguiente
+        while actual is not self._colon:
+            if anterior is not None and anterior._clave > actual._clave:
+                return False
+            cubeta = self._cubeta_de(actual._clave)
+            if cubeta in cubetas:
+                cubetas[cubeta][1] = actual
+            else:
+                cubetas[cubeta] = [actual, actual]
+            anterior = actual
+            actual = actual._siguiente
+        self._cubetas = cubetas
+        self._orden_cubetas = sorted(cubetas)
+        return True
@@ -13,8 +13,8 @@ class ListaDobleEnlazadaCentinelas(Base):
     nombre = Column(String, unique=True, nullable=False, default="principal")  # Nombre identificador de la lista
     
     # Referencias a los nodos centinela
-    cabezon_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=False)
-    colon_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=False)
+    cabezon_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=False, index=True)
+    colon_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=False, index=True)
     
     # Relaciones con los centinelas
     header = relationship("NodoDobleVuelos", foreign_keys=[cabezon_id], back_populates="estado_header")   # Cabezon
@@ -22,6 +22,10 @@ class ListaDobleEnlazadaCentinelas(Base):
     
     # Tamaño de la lista (excluyendo centinelas)
     tamanio = Column(Integer, default=0)
+    
+    # Indica si la tabla UltimoNodoPorPrioridad refleja el estado actual de la lista.
+    # Las operaciones que no respetan el orden de prioridad la invalidan.
+    ultimos_validos = Column(Boolean, default=False, nullable=False)
 
     def __repr__(self):
         return f"<ListaDobleEnlazadaCentinelas nombre={self.nombre} tamanio={self.tamanio}>"
\ No newline at end of file
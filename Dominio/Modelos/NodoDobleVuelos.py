@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .Base import Base
@@ -9,16 +9,23 @@ class NodoDobleVuelos(Base):
     Puede ser un nodo regular (con un vuelo asociado) o un nodo centinela (cabezon/colon).
     """
     __tablename__ = "NodoDobleVuelos"
+    __table_args__ = (
+        # Recorre los nodos de una lista en orden sin seguir los enlaces (posición, conteo, limpieza)
+        Index("ix_NodoDobleVuelos_lista_posicion", "lista_id", "posicion"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    posicion = Column(Integer, nullable=True)  # Posición en la lista (nulos para centinelas)
+    posicion = Column(Integer, nullable=True)  # Clave de orden dispersa en la lista (nulos para centinelas)
+    
+    # Lista a la que pertenece el nodo (también los centinelas)
+    lista_id = Column(Integer, ForeignKey('ListaDobleEnlazadaCentinelas.id', use_alter=True), nullable=True)
     
     # Relaciones con otros nodos
-    anterior_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=True)
-    siguiente_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=True)
+    anterior_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=True, index=True)
+    siguiente_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=True, index=True)
     
     # Relación con vuelo (nula para centinelas)
-    vuelo_id = Column(Integer, ForeignKey('vuelos.id'), nullable=True)
+    vuelo_id = Column(Integer, ForeignKey('vuelos.id'), nullable=True, index=True)
     vuelo = relationship("Vuelo", back_populates="lista_item")
     
     # Campo único para indicar si es un centinela y de qué tipo
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
+from .Base import Base
+
+class UltimoNodoPorPrioridad(Base):
+    """
+    Último nodo de cada cubeta de prioridad de una lista.
+
+    Una cubeta agrupa los vuelos con la misma emergencia y prioridad, es decir, el mismo
+    prefijo de Vuelo.clave_orden (a lo sumo 2 x 101 cubetas). Con el último nodo de cada
+    cubeta a mano, una inserción ordenada se enlaza detrás de él sin recorrer la lista.
+    """
+    __tablename__ = "UltimoNodoPorPrioridad"
+    __table_args__ = (UniqueConstraint("lista_id", "cubeta"),)
+
+    # Largo del prefijo de clave_orden que identifica la cubeta (emergencia + prioridad)
+    LARGO_CUBETA = 4
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    lista_id = Column(Integer, ForeignKey('ListaDobleEnlazadaCentinelas.id'), nullable=False)
+    cubeta = Column(String, nullable=False)
+    nodo_id = Column(Integer, ForeignKey('NodoDobleVuelos.id'), nullable=False, index=True)
+
+    @staticmethod
+    def cubeta_de(clave_orden: str) -> str:
+        """Cubeta a la que pertenece un vuelo según su clave de orden"""
+        return clave_orden[:UltimoNodoPorPrioridad.LARGO_CUBETA]
+
+    def __repr__(self):
+        return f"<UltimoNodoPorPrioridad lista_id={self.lista_id} cubeta={self.cubeta} nodo_id={self.nodo_id}>"
@@ -1,9 +1,19 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .Base import Base
 
+# Rango de Vuelo.prioridad; 100 es la mayor prioridad
+PRIORIDAD_MINIMA = 0
+PRIORIDAD_MAXIMA = 100
+
 class Vuelo(Base):
     __tablename__ = 'vuelos'
+    __table_args__ = (
+        # Clave de las páginas de GET /vuelos/pagina: cada página es un rango de este índice
+        Index("ix_vuelos_hora_salida_id", "hora_salida", "id"),
+        # Conteos por estado del resumen: cada estado es un rango del índice, que ya trae la emergencia
+        Index("ix_vuelos_estado_emergencia", "estado", "emergencia"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     numero_vuelo = Column(String, unique=True, nullable=False)
     origen = Column(String, nullable=False)
@@ -14,8 +24,28 @@ class Vuelo(Base):
     estado = Column(Enum('programado', 'retrasado', 'cancelado'), default='programado')  # Estado del vuelo
     emergencia = Column(Boolean, default=False)  # Indica si el vuelo es una emergencia
     
+    # Clave de orden de la cola (desnormalizada e indexada): emergencia, prioridad descendente y hora de salida.
+    # Se recalcula con actualizar_clave_orden() cada vez que cambia alguno de esos campos.
+    clave_orden = Column(String, index=True, nullable=True)
+    
     # Relación con la estructura de lista doblemente enlazada
     lista_item = relationship("NodoDobleVuelos", back_populates="vuelo", uselist=False)
 
+    @staticmethod
+    def calcular_clave_orden(emergencia, prioridad, hora_salida) -> str:
+        """
+        Codifica (emergencia, prioridad, hora_salida) en un texto cuyo orden lexicográfico es
+        el orden de la cola: emergencias primero, luego mayor prioridad y luego menor hora de salida.
+        La prioridad debe estar entre PRIORIDAD_MINIMA y PRIORIDAD_MAXIMA (None cuenta como 0).
+        """
+        prioridad = prioridad or 0
+        if not PRIORIDAD_MINIMA <= prioridad <= PRIORIDAD_MAXIMA:
+            raise ValueError(f"Prioridad fuera de rango ({PRIORIDAD_MINIMA} a {PRIORIDAD_MAXIMA}): {prioridad}")
+        return f"{0 if emergencia else 1}{100 - prioridad:03d}{hora_salida:%Y%m%d%H%M%S%f}"
+
+    def actualizar_clave_orden(self):
+        """Recalcula clave_orden a partir de los campos actuales del vuelo"""
+        self.clave_orden = Vuelo.calcular_clave_orden(self.emergencia, self.prioridad, self.hora_salida)
+
     def __repr__(self):
         return f"<Vuelo {self.numero_vuelo} {self.origen}->{self.destino} {self.estado}>"
@@ -0,0 +1,67 @@
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from typing import Any, Awaitable, Callable, Hashable, Optional, Tuple
+from Presentacion.API.RespuestaJSON import serializar_json
+from Servicios.CacheRespuestas import cache_respuestas
+from Servicios.VersionesDatos import versiones_datos
+
+def coincide_etag(request: Request, etag: str) -> bool:
+    """
+    Indica si el cliente ya tiene la versión `etag` según su cabecera If-None-Match,
+    que puede traer varios ETag separados por comas, ETag débiles (W/"...") o "*".
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    for candidato in if_none_match.split(","):
+        candidato = candidato.strip()
+        if candidato == "*" or candidato.removeprefix("W/") == etag:
+            return True
+    return False
+
+def respuesta_no_modificada(etag: str) -> Response:
+    """Respuesta 304 sin cuerpo para un cliente que ya tiene la versión actual"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+def _serializar(contenido: Any) -> bytes:
+    if isinstance(contenido, BaseModel):
+        contenido = contenido.model_dump(mode="json")
+    return serializar_json(contenido)
+
+def _respuesta_de_cache(request: Request, recurso: str, clave: Hashable) -> Tuple[str, Optional[Response]]:
+    etag = versiones_datos.etag(recurso)
+    if coincide_etag(request, etag):
+        return etag, respuesta_no_modificada(etag)
+    cuerpo = cache_respuestas.obtener((recurso, clave), etag)
+    if cuerpo is None:
+        return etag, None
+    return etag, Response(content=cuerpo, media_type="application/json", headers={"ETag": etag})
+
+def _guardar_en_cache(recurso: str, clave: Hashable, etag: str, contenido: Any) -> Optional[Response]:
+    if contenido is None:
+        return None
+    cuerpo = _serializar(contenido)
+    cache_respuestas.guardar((recurso, clave), recurso, etag, cuerpo)
+    return Response(content=cuerpo, media_type="application/json", headers={"ETag": etag})
+
+def respuesta_condicional(request: Request, recurso: str, clave: Hashable,
+                          calcular: Callable[[], Any]) -> Optional[Response]:
+    """
+    Responde una lectura que depende de la versión de `recurso` (VersionesDatos):
+    304 si el cliente ya la tiene, el cuerpo guardado en la caché si se calculó con esa
+    versión o, si no, el resultado de calcular() serializado, que queda en la caché bajo
+    `clave`. Todas llevan el ETag de la versión, tomado antes de calcular. Devuelve None si
+    calcular() devuelve None (no encontrado), para que la ruta responda el error.
+    """
+    etag, respuesta = _respuesta_de_cache(request, recurso, clave)
+    if respuesta is not None:
+        return respuesta
+    return _guardar_en_cache(recurso, clave, etag, calcular())
+
+async def respuesta_condicional_async(request: Request, recurso: str, clave: Hashable,
+                                      calcular: Callable[[], Awaitable[Any]]) -> Optional[Response]:
+    """Igual que respuesta_condicional, para rutas async cuyo cálculo es una corrutina"""
+    etag, respuesta = _respuesta_de_cache(request, recurso, clave)
+    if respuesta is not None:
+        return respuesta
+    return _guardar_en_cache(recurso, clave, etag, await calcular())
@@ -0,0 +1,76 @@
+import json
+from datetime import datetime
+from typing import Any, AsyncIterable, Iterable, List, Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional: sin él se usa el módulo json de la biblioteca estándar
+    orjson = None
+
+def _por_defecto(valor: Any):
+    if isinstance(valor, datetime):
+        return valor.isoformat()
+    raise TypeError(f"No se puede serializar {type(valor).__name__} a JSON")
+
+def serializar_json(contenido: Any) -> bytes:
+    """Serializa dicts, listas y tuplas con valores simples o datetime al mismo JSON que generan los DTOs"""
+    if orjson is not None:
+        return orjson.dumps(contenido)
+    return json.dumps(contenido, ensure_ascii=False, separators=(",", ":"), default=_por_defecto).encode("utf-8")
+
+class RespuestaJSONRapida(JSONResponse):
+    """
+    Respuesta JSON para datos que ya tienen la forma de un DTO (filas de la base de datos
+    o DTOs ya validados). Devolverla desde una ruta evita que FastAPI vuelva a validar
+    el contenido contra response_model, que se sigue declarando para la documentación.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return serializar_json(content)
+
+
+# Filas que se leen de la base de datos y se escriben de una vez en las respuestas NDJSON
+BLOQUE_STREAMING = 500
+
+class RespuestaNDJSON(StreamingResponse):
+    """
+    Respuesta en JSON por líneas (un objeto por línea) que se escribe a medida que llegan
+    los bloques de filas, sin juntar todo el contenido en memoria. Cada bloque recibido se
+    envía como un solo fragmento. Starlette recorre los iterables síncronos en el threadpool,
+    así que los bloques pueden salir de una consulta con la sesión de la petición.
+    """
+    media_type = "application/x-ndjson"
+
+    def __init__(self, bloques: Iterable[List[Any]], **kwargs):
+        super().__init__(
+            (b"".join(serializar_json(fila) + b"\n" for fila in bloque) for bloque in bloques),
+            **kwargs
+        )
+
+# Segundos sin eventos tras los que se envía un comentario, para que los proxies no corten la conexión
+INTERVALO_LATIDO_SSE = 15
+
+class RespuestaSSE(StreamingResponse):
+    """
+    Respuesta Server-Sent Events (text/event-stream) que no termina mientras el cliente siga
+    conectado. Cada evento recibido (un dict con "tipo") se escribe con `event:` igual a su
+    tipo, `id:` igual a su versión si la tiene y el dict completo en JSON como `data:`. Un None
+    se escribe como comentario de latido.
+    """
+    media_type = "text/event-stream"
+
+    def __init__(self, eventos: AsyncIterable[Optional[dict]], **kwargs):
+        kwargs.setdefault("headers", {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+        super().__init__(self._formatear(eventos), **kwargs)
+
+    @staticmethod
+    async def _formatear(eventos: AsyncIterable[Optional[dict]]):
+        async for evento in eventos:
+            if evento is None:
+                yield b": latido\n\n"
+                continue
+            mensaje = b"event: " + evento["tipo"].encode("utf-8") + b"\n"
+            if "version" in evento:
+                mensaje += b"id: " + str(evento["version"]).encode("ascii") + b"\n"
+            yield mensaje + b"data: " + serializar_json(evento) + b"\n\n"
@@ -1,10 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from Config.db import get_db
+from typing import List, Literal, Optional
+from Config.db import USAR_ASYNC, get_db
+from Presentacion.API.Condicional import respuesta_condicional
+from Presentacion.API.RespuestaJSON import (
+    BLOQUE_STREAMING, INTERVALO_LATIDO_SSE, RespuestaJSONRapida, RespuestaNDJSON, RespuestaSSE
+)
+from Presentacion.DTOs.CambiosListaDTO import CambiosListaDTO
 from Presentacion.DTOs.ListaDobleEnlazadaCentinelasDTO import ListaDobleEnlazadaCentinelasDTO, ListaConNodosDTO
 from Presentacion.DTOs.NodoDobleVueloDTO import NodoDobleVueloDTO
+from Presentacion.DTOs.PaginaDTO import PaginaNodosDTO
 from Presentacion.DTOs.VueloDTO import VueloDTO
+from Servicios.CursorPaginacion import LIMITE_PAGINA_MAXIMO, LIMITE_PAGINA_POR_DEFECTO
+from Servicios.EventosDatos import SuscripcionEventos, eventos_datos
 from Servicios.ListaDobleEnlazadaServicio import ListaDobleEnlazadaServicio
 
 router = APIRouter(
@@ -13,12 +22,70 @@ router = APIRouter(
     responses={404: {"description": "No encontrado"}},
 )
 
-@router.get("/", response_model=ListaConNodosDTO)
-def obtener_lista_con_nodos(db: Session = Depends(get_db)):
+# Con AEROPUERTO_DB_ASYNC, las rutas marcadas con include_in_schema=not USAR_ASYNC las atienden
+# sus versiones async (Rutas/*_Async.py) y aquí solo quedan ocultas en la documentación.
+
+@router.get("/", response_model=ListaConNodosDTO, response_class=RespuestaJSONRapida)
+def obtener_lista_con_nodos(request: Request, db: Session = Depends(get_db)):
     """Obtener la lista principal con todos sus nodos"""
     servicio = ListaDobleEnlazadaServicio(db)
-    lista_con_nodos = servicio.obtener_lista_con_nodos()
-    return lista_con_nodos
+    # 304 si el cliente ya tiene esta versión de la lista, o el JSON de la caché si sigue vigente.
+    # Se serializa directamente, sin construir ni validar un DTO por nodo
+    return respuesta_condicional(request, servicio.recurso_de_lista(), "lista", servicio.obtener_lista_con_nodos_plana)
+
+@router.get("/ndjson", response_class=RespuestaNDJSON,
+            responses={200: {"description": "Un NodoDobleVueloDTO por línea, en orden", "content": {"application/x-ndjson": {}}}})
+def obtener_nodos_ndjson(db: Session = Depends(get_db)):
+    """Obtiene los nodos de la lista principal en JSON por líneas, escritos a medida que se leen de la base de datos"""
+    servicio = ListaDobleEnlazadaServicio(db)
+    return RespuestaNDJSON(servicio.iterar_nodos_planos(BLOQUE_STREAMING))
+
+@router.get("/eventos", response_class=RespuestaSSE,
+            responses={200: {"description": "Un evento por cambio en la lista o en los vuelos", "content": {"text/event-stream": {}}}})
+async def obtener_eventos():
+    """
+    Publica como Server-Sent Events cada cambio en la lista principal (insertado, extraido,
+    movido, reordenado) y en los vuelos (vuelo_creado, vuelo_actualizado, vuelo_eliminado),
+    con los datos para aplicarlo sobre una copia local. El primer evento es "conectado";
+    "recargar" indica que hay que volver a leer la lista completa.
+    """
+    async def eventos():
+        suscripcion = SuscripcionEventos(asyncio.get_running_loop())
+        eventos_datos.suscribir(suscripcion)
+        try:
+            yield {"tipo": "conectado"}
+            while True:
+                yield await suscripcion.siguiente(INTERVALO_LATIDO_SSE)
+        finally:
+            eventos_datos.cancelar(suscripcion)
+    return RespuestaSSE(eventos())
+
+@router.get("/cambios", response_model=CambiosListaDTO, response_class=RespuestaJSONRapida)
+def obtener_cambios(desde_version: int = Query(..., ge=0), epoca: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Devuelve solo los cambios de la lista principal posteriores a desde_version, para poner al
+    día una copia local sin volver a descargarla. Con recargar=true hay que leer GET /lista/.
+    """
+    servicio = ListaDobleEnlazadaServicio(db)
+    return RespuestaJSONRapida(servicio.obtener_cambios_desde(desde_version, epoca))
+
+@router.get("/pagina", response_model=PaginaNodosDTO, response_class=RespuestaJSONRapida)
+def obtener_pagina_de_lista(
+    limite: int = Query(LIMITE_PAGINA_POR_DEFECTO, ge=1, le=LIMITE_PAGINA_MAXIMO),
+    cursor: Optional[str] = None,
+    direccion: Literal["adelante", "atras"] = "adelante",
+    db: Session = Depends(get_db)
+):
+    """
+    Obtiene los nodos de la lista principal por páginas, siguiendo los enlaces desde el
+    cabezon (direccion=adelante) o desde el colon (direccion=atras). Para pedir la página
+    siguiente se envía el siguiente_cursor de la respuesta anterior, que ya incluye la dirección.
+    """
+    servicio = ListaDobleEnlazadaServicio(db)
+    try:
+        return RespuestaJSONRapida(servicio.obtener_pagina_de_lista(limite, cursor, direccion))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/insertar-al-frente", response_model=NodoDobleVueloDTO)
 def insertar_vuelo_al_frente(vuelo_id: int, db: Session = Depends(get_db)):
@@ -74,29 +141,29 @@ def reordenar_lista(db: Session = Depends(get_db)):
     servicio.reordenar_lista_por_prioridad()
     return {"message": "Lista reordenada correctamente"}
 
-@router.get("/cantidad", response_model=int)
-def obtener_cantidad_nodos(db: Session = Depends(get_db)):
+@router.get("/cantidad", response_model=int, include_in_schema=not USAR_ASYNC)
+def obtener_cantidad_nodos(request: Request, db: Session = Depends(get_db)):
     """Obtiene la cantidad de nodos en la lista principal"""
     servicio = ListaDobleEnlazadaServicio(db)
-    return servicio.obtener_cantidad_nodos()
+    return respuesta_condicional(request, servicio.recurso_de_lista(), "cantidad", servicio.obtener_cantidad_nodos)
 
-@router.get("/primer-vuelo", response_model=VueloDTO)
-def obtener_primer_vuelo(db: Session = Depends(get_db)):
+@router.get("/primer-vuelo", response_model=VueloDTO, include_in_schema=not USAR_ASYNC)
+def obtener_primer_vuelo(request: Request, db: Session = Depends(get_db)):
     """Obtiene el primer vuelo de la lista principal"""
     servicio = ListaDobleEnlazadaServicio(db)
-    vuelo = servicio.obtener_primer_vuelo()
-    if not vuelo:
+    respuesta = respuesta_condicional(request, servicio.recurso_de_lista(), "primer-vuelo", servicio.obtener_primer_vuelo)
+    if respuesta is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No hay vuelos en la lista")
-    return vuelo
+    return respuesta
 
-@router.get("/ultimo-vuelo", response_model=VueloDTO)
-def obtener_ultimo_vuelo(db: Session = Depends(get_db)):
+@router.get("/ultimo-vuelo", response_model=VueloDTO, include_in_schema=not USAR_ASYNC)
+def obtener_ultimo_vuelo(request: Request, db: Session = Depends(get_db)):
     """Obtiene el último vuelo de la lista principal"""
     servicio = ListaDobleEnlazadaServicio(db)
-    vuelo = servicio.obtener_ultimo_vuelo()
-    if not vuelo:
+    respuesta = respuesta_condicional(request, servicio.recurso_de_lista(), "ultimo-vuelo", servicio.obtener_ultimo_vuelo)
+    if respuesta is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No hay vuelos en la lista")
-    return vuelo
+    return respuesta
 
 @router.post("/mover-nodo", status_code=status.HTTP_200_OK)
 def mover_nodo_entre_posiciones(posicion_origen: int, posicion_destino: int, db: Session = Depends(get_db)):
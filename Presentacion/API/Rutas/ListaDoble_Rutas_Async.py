@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from Config.db import get_db_async
+from Presentacion.API.Condicional import respuesta_condicional_async
+from Presentacion.DTOs.VueloDTO import VueloDTO
+from Servicios.ListaDobleEnlazadaServicioAsync import ListaDobleEnlazadaServicioAsync
+
+# Rutas de lectura de ListaDoble_Rutas sobre el engine asyncio. main.py las registra antes que
+# las síncronas cuando AEROPUERTO_DB_ASYNC está activado, así que atienden esas peticiones.
+router = APIRouter(
+    prefix="/lista",
+    tags=["lista"],
+    responses={404: {"description": "No encontrado"}},
+)
+
+@router.get("/cantidad", response_model=int)
+async def obtener_cantidad_nodos(request: Request, db: AsyncSession = Depends(get_db_async)):
+    """Obtiene la cantidad de nodos en la lista principal"""
+    servicio = ListaDobleEnlazadaServicioAsync(db)
+    return await respuesta_condicional_async(
+        request, await servicio.recurso_de_lista(), "cantidad", servicio.obtener_cantidad_nodos
+    )
+
+@router.get("/primer-vuelo", response_model=VueloDTO)
+async def obtener_primer_vuelo(request: Request, db: AsyncSession = Depends(get_db_async)):
+    """Obtiene el primer vuelo de la lista principal"""
+    servicio = ListaDobleEnlazadaServicioAsync(db)
+    respuesta = await respuesta_condicional_async(
+        request, await servicio.recurso_de_lista(), "primer-vuelo", servicio.obtener_primer_vuelo
+    )
+    if respuesta is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No hay vuelos en la lista")
+    return respuesta
+
+@router.get("/ultimo-vuelo", response_model=VueloDTO)
+async def obtener_ultimo_vuelo(request: Request, db: AsyncSession = Depends(get_db_async)):
+    """Obtiene el último vuelo de la lista principal"""
+    servicio = ListaDobleEnlazadaServicioAsync(db)
+    respuesta = await respuesta_condicional_async(
+        request, await servicio.recurso_de_lista(), "ultimo-vuelo", servicio.obtener_ultimo_vuelo
+    )
+    if respuesta is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No hay vuelos en la lista")
+    return respuesta
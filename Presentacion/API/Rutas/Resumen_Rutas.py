@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from Config.db import get_db
+from Presentacion.DTOs.ResumenDTO import ResumenDTO
+from Servicios.ResumenServicio import ResumenServicio
+
+router = APIRouter(
+    prefix="/resumen",
+    tags=["resumen"],
+)
+
+@router.get("/", response_model=ResumenDTO)
+def obtener_resumen(db: Session = Depends(get_db)):
+    """Totales de vuelos (por estado y emergencias) y tamaño, primer y último vuelo de la lista principal"""
+    servicio = ResumenServicio(db)
+    return servicio.obtener_resumen()
@@ -1,9 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List
-from Config.db import get_db
+from typing import List, Optional
+from Config.db import USAR_ASYNC, get_db
+from Presentacion.API.Condicional import respuesta_condicional
+from Presentacion.API.RespuestaJSON import BLOQUE_STREAMING, RespuestaJSONRapida, RespuestaNDJSON
 from Presentacion.DTOs.VueloDTO import VueloDTO
 from Presentacion.DTOs.VueloCreadoDTO import VueloCreadoDTO
+from Presentacion.DTOs.PaginaDTO import PaginaVuelosDTO
+from Servicios.CursorPaginacion import LIMITE_PAGINA_MAXIMO, LIMITE_PAGINA_POR_DEFECTO
+from Servicios.VersionesDatos import RECURSO_VUELOS, recurso_vuelo
 from Servicios.VueloServicio import VueloServicio
 
 router = APIRouter(
@@ -12,6 +17,9 @@ router = APIRouter(
     responses={404: {"description": "No encontrado"}},
 )
 
+# Con AEROPUERTO_DB_ASYNC, las rutas marcadas con include_in_schema=not USAR_ASYNC las atienden
+# sus versiones async (Rutas/*_Async.py) y aquí solo quedan ocultas en la documentación.
+
 @router.post("/", response_model=VueloDTO, status_code=status.HTTP_201_CREATED)
 def crear_vuelo(vuelo: VueloCreadoDTO, db: Session = Depends(get_db)):
     servicio = VueloServicio(db)
@@ -20,18 +28,45 @@ def crear_vuelo(vuelo: VueloCreadoDTO, db: Session = Depends(get_db)):
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/", response_model=List[VueloDTO])
-def obtener_vuelos(db: Session = Depends(get_db)):
+@router.get("/", response_model=List[VueloDTO], response_class=RespuestaJSONRapida, include_in_schema=not USAR_ASYNC)
+def obtener_vuelos(request: Request, db: Session = Depends(get_db)):
+    servicio = VueloServicio(db)
+    # 304 si el cliente ya tiene esta versión de los vuelos, o el JSON de la caché si sigue vigente.
+    # Las filas ya tienen la forma de VueloDTO: se serializan directamente, sin validarlas otra vez
+    return respuesta_condicional(request, RECURSO_VUELOS, "vuelos", servicio.obtener_vuelos_planos)
+
+@router.get("/ndjson", response_class=RespuestaNDJSON,
+            responses={200: {"description": "Un VueloDTO por línea", "content": {"application/x-ndjson": {}}}})
+def obtener_vuelos_ndjson(db: Session = Depends(get_db)):
+    """Obtiene todos los vuelos en JSON por líneas, escritos a medida que se leen de la base de datos"""
     servicio = VueloServicio(db)
-    return servicio.obtener_vuelos()
+    return RespuestaNDJSON(servicio.iterar_vuelos_planos(BLOQUE_STREAMING))
+
+@router.get("/pagina", response_model=PaginaVuelosDTO, response_class=RespuestaJSONRapida)
+def obtener_pagina_de_vuelos(
+    limite: int = Query(LIMITE_PAGINA_POR_DEFECTO, ge=1, le=LIMITE_PAGINA_MAXIMO),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Obtiene los vuelos por páginas, ordenados por hora de salida.
+    Para pedir la página siguiente se envía el siguiente_cursor de la respuesta anterior.
+    """
+    servicio = VueloServicio(db)
+    try:
+        return RespuestaJSONRapida(servicio.obtener_pagina_de_vuelos(limite, cursor))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-@router.get("/{vuelo_id}", response_model=VueloDTO)
-def obtener_vuelo(vuelo_id: int, db: Session = Depends(get_db)):
+@router.get("/{vuelo_id}", response_model=VueloDTO, include_in_schema=not USAR_ASYNC)
+def obtener_vuelo(vuelo_id: int, request: Request, db: Session = Depends(get_db)):
     servicio = VueloServicio(db)
-    vuelo = servicio.obtener_vuelo_por_id(vuelo_id)
-    if not vuelo:
+    respuesta = respuesta_condicional(
+        request, recurso_vuelo(vuelo_id), "vuelo", lambda: servicio.obtener_vuelo_por_id(vuelo_id)
+    )
+    if respuesta is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vuelo no encontrado")
-    return vuelo
+    return respuesta
 
 @router.put("/{vuelo_id}", response_model=VueloDTO)
 def actualizar_vuelo(vuelo_id: int, vuelo: VueloDTO, db: Session = Depends(get_db)):
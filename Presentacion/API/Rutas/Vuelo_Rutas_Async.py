@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+from Config.db import get_db_async
+from Presentacion.API.Condicional import respuesta_condicional_async
+from Presentacion.API.RespuestaJSON import RespuestaJSONRapida
+from Presentacion.DTOs.VueloDTO import VueloDTO
+from Servicios.VersionesDatos import RECURSO_VUELOS, recurso_vuelo
+from Servicios.VueloServicioAsync import VueloServicioAsync
+
+# Rutas de lectura de Vuelo_Rutas sobre el engine asyncio. main.py las registra antes que
+# las síncronas cuando AEROPUERTO_DB_ASYNC está activado, así que atienden esas peticiones.
+router = APIRouter(
+    prefix="/vuelos",
+    tags=["vuelos"],
+    responses={404: {"description": "No encontrado"}},
+)
+
+@router.get("/", response_model=List[VueloDTO], response_class=RespuestaJSONRapida)
+async def obtener_vuelos(request: Request, db: AsyncSession = Depends(get_db_async)):
+    servicio = VueloServicioAsync(db)
+    return await respuesta_condicional_async(request, RECURSO_VUELOS, "vuelos", servicio.obtener_vuelos_planos)
+
+# Solo ids enteros: las demás rutas bajo /vuelos (como /vuelos/pagina) siguen en Vuelo_Rutas
+@router.get("/{vuelo_id:int}", response_model=VueloDTO)
+async def obtener_vuelo(vuelo_id: int, request: Request, db: AsyncSession = Depends(get_db_async)):
+    servicio = VueloServicioAsync(db)
+    respuesta = await respuesta_condicional_async(
+        request, recurso_vuelo(vuelo_id), "vuelo", lambda: servicio.obtener_vuelo_por_id(vuelo_id)
+    )
+    if respuesta is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Vuelo no encontrado")
+    return respuesta
@@ -1,6 +1,8 @@
+import copy
+import json
 import requests
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import Iterator, List, Dict, Any, Optional, Union
 from utils.logger import get_logger
 
 class ClienteAPI:
@@ -9,16 +11,37 @@ class ClienteAPI:
     def __init__(self, base_url: str = "http://localhost:8000"):
         self.base_url = base_url
         self.logger = get_logger(self.__class__.__name__)
+        # Última respuesta de cada lectura con ETag: url -> (etag, datos)
+        self._respuestas_con_etag = {}
         self.logger.info(f"Cliente API inicializado con URL base: {base_url}")
         
+    def _get_condicional(self, url: str) -> Any:
+        """
+        GET que envía el ETag de la última respuesta de la misma URL (If-None-Match). Si el
+        servidor responde 304 los datos no cambiaron y se devuelve una copia de los guardados
+        sin volver a descargarlos. Los errores HTTP se lanzan igual que con raise_for_status.
+        """
+        guardada = self._respuestas_con_etag.get(url)
+        headers = {"If-None-Match": guardada[0]} if guardada else {}
+        response = requests.get(url, headers=headers)
+        if response.status_code == 304 and guardada:
+            self.logger.debug(f"Sin cambios en {url}")
+            return copy.deepcopy(guardada[1])
+        
+        self._respuestas_con_etag.pop(url, None)
+        response.raise_for_status()
+        datos = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._respuestas_con_etag[url] = (etag, copy.deepcopy(datos))
+        return datos
+        
     # ===== Métodos para gestionar vuelos =====
     def obtener_vuelos(self) -> List[Dict[str, Any]]:
         """Obtiene todos los vuelos"""
         self.logger.debug("Solicitando lista de vuelos")
         try:
-            response = requests.get(f"{self.base_url}/vuelos/")
-            response.raise_for_status()
-            vuelos = response.json()
+            vuelos = self._get_condicional(f"{self.base_url}/vuelos/")
             self.logger.debug(f"Obtenidos {len(vuelos)} vuelos")
             return vuelos
         except Exception as e:
@@ -29,9 +52,7 @@ class ClienteAPI:
         """Obtiene un vuelo específico por ID"""
         self.logger.debug(f"Solicitando vuelo con ID: {vuelo_id}")
         try:
-            response = requests.get(f"{self.base_url}/vuelos/{vuelo_id}")
-            response.raise_for_status()
-            vuelo = response.json()
+            vuelo = self._get_condicional(f"{self.base_url}/vuelos/{vuelo_id}")
             self.logger.debug(f"Obtenido vuelo: {vuelo.get('numero_vuelo')}")
             return vuelo
         except Exception as e:
@@ -107,9 +128,7 @@ class ClienteAPI:
         """Obtiene la lista principal con todos sus nodos"""
         self.logger.debug("Solicitando lista principal de nodos")
         try:
-            response = requests.get(f"{self.base_url}/lista/")
-            response.raise_for_status()
-            lista = response.json()
+            lista = self._get_condicional(f"{self.base_url}/lista/")
             self.logger.debug("Lista obtenida")
             return lista
         except Exception as e:
@@ -188,9 +207,7 @@ class ClienteAPI:
         """Obtiene la cantidad de nodos en la lista"""
         self.logger.debug("Solicitando cantidad de nodos en la lista")
         try:
-            response = requests.get(f"{self.base_url}/lista/cantidad")
-            response.raise_for_status()
-            cantidad = response.json()
+            cantidad = self._get_condicional(f"{self.base_url}/lista/cantidad")
             self.logger.debug(f"Cantidad de nodos: {cantidad}")
             return cantidad
         except Exception as e:
@@ -201,9 +218,7 @@ class ClienteAPI:
         """Obtiene el primer vuelo de la lista"""
         self.logger.debug("Solicitando primer vuelo de la lista")
         try:
-            response = requests.get(f"{self.base_url}/lista/primer-vuelo")
-            response.raise_for_status()
-            vuelo = response.json()
+            vuelo = self._get_condicional(f"{self.base_url}/lista/primer-vuelo")
             self.logger.debug("Primer vuelo obtenido")
             return vuelo
         except requests.exceptions.HTTPError as e:
@@ -251,6 +266,49 @@ class ClienteAPI:
         except Exception as e:
             self.logger.error(f"Error al mover nodo de {posicion_origen} a {posicion_destino}: {str(e)}")
             raise
+
+    def obtener_cambios(self, desde_version: int, epoca: Optional[str] = None) -> Dict[str, Any]:
+        """Obtiene los cambios de la lista posteriores a desde_version (recargar=True si hay que leerla completa)"""
+        self.logger.debug(f"Solicitando cambios de la lista desde la versión {desde_version}")
+        try:
+            params = {"desde_version": desde_version}
+            if epoca:
+                params["epoca"] = epoca
+            response = requests.get(f"{self.base_url}/lista/cambios", params=params)
+            response.raise_for_status()
+            cambios = response.json()
+            self.logger.debug(f"Obtenidos {len(cambios['cambios'])} cambios")
+            return cambios
+        except Exception as e:
+            self.logger.error(f"Error al obtener cambios de la lista: {str(e)}")
+            raise
+
+    def escuchar_eventos(self) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre los eventos de GET /lista/eventos (Server-Sent Events) a medida que llegan.
+        No termina mientras la conexión siga abierta, así que debe usarse desde un hilo aparte.
+        """
+        self.logger.debug("Escuchando eventos de la lista")
+        with requests.get(f"{self.base_url}/lista/eventos", stream=True, timeout=(5, None)) as response:
+            response.raise_for_status()
+            for linea in response.iter_lines(decode_unicode=True):
+                # Solo interesan los datos: el tipo y la versión también viajan dentro del JSON
+                if linea and linea.startswith("data: "):
+                    yield json.loads(linea[len("data: "):])
+
+    # ===== Resumen =====
+    def obtener_resumen(self) -> Dict[str, Any]:
+        """Obtiene los totales de vuelos y el tamaño, primer y último vuelo de la lista en una sola petición"""
+        self.logger.debug("Solicitando resumen")
+        try:
+            response = requests.get(f"{self.base_url}/resumen/")
+            response.raise_for_status()
+            resumen = response.json()
+            self.logger.debug(f"Resumen obtenido: {resumen['total_vuelos']} vuelos, {resumen['tamanio_lista']} en lista")
+            return resumen
+        except Exception as e:
+            self.logger.error(f"Error al obtener resumen: {str(e)}")
+            raise
     
     def manejar_respuesta_error(self, response):
         """Registra información detallada sobre errores de la API"""
@@ -203,40 +203,36 @@ class DashboardView(BaseView):
     def actualizar_dashboard(self):
         """Actualiza todos los datos del dashboard"""
         try:
+            # Una sola petición con los totales y los extremos de la lista
+            resumen = self.cliente_api.obtener_resumen()
+            
             # Actualizar contadores
-            self.actualizar_contadores()
+            self.actualizar_contadores(resumen)
             
             # Actualizar próximo vuelo
-            self.actualizar_proximo_vuelo()
+            self.actualizar_proximo_vuelo(resumen.get('primer_vuelo'))
             
         except Exception as e:
             self.manejar_error_api(e, "Error al cargar los datos del dashboard")
     
-    def actualizar_contadores(self):
+    def actualizar_contadores(self, resumen):
         """Actualiza los contadores de las tarjetas resumen"""
         try:
             # Total de vuelos
-            vuelos = self.cliente_api.obtener_vuelos()
-            self.label_total_valor.configure(text=str(len(vuelos)))
+            self.label_total_valor.configure(text=str(resumen.get('total_vuelos', 0)))
             
-            # Contar vuelos de emergencia
-            emergencias = sum(1 for v in vuelos if v.get('emergencia', False))
-            self.label_emergencia_valor.configure(text=str(emergencias))
+            # Vuelos de emergencia
+            self.label_emergencia_valor.configure(text=str(resumen.get('emergencias', 0)))
             
             # Vuelos en lista
-            try:
-                cantidad_lista = self.cliente_api.obtener_cantidad_nodos()
-                self.label_lista_valor.configure(text=str(cantidad_lista))
-            except:
-                self.label_lista_valor.configure(text="0")
+            self.label_lista_valor.configure(text=str(resumen.get('tamanio_lista', 0)))
                 
         except Exception as e:
             self.manejar_error_api(e, "Error al actualizar contadores")
     
-    def actualizar_proximo_vuelo(self):
+    def actualizar_proximo_vuelo(self, primer_vuelo):
         """Actualiza la información del próximo vuelo en la lista"""
         try:
-            primer_vuelo = self.cliente_api.obtener_primer_vuelo()
             if primer_vuelo:
                 # Formatear la información del vuelo
                 numero_vuelo = primer_vuelo.get('numero_vuelo', 'N/A')
@@ -238,8 +238,11 @@ class GestionListaView(BaseView):
     def actualizar_estadisticas(self):
         """Actualiza las estadísticas mostradas en el panel superior"""
         try:
+            # Tamaño, primer y último vuelo en una sola petición
+            resumen = self.cliente_api.obtener_resumen()
+            
             # Obtener tamaño de la lista
-            tamanio = self.cliente_api.obtener_cantidad_nodos()
+            tamanio = resumen.get('tamanio_lista', 0)
             self.label_tamanio.configure(text=f"Tamaño de la lista: {tamanio}")
             
             # Habilitar/deshabilitar botones según tamaño
@@ -251,7 +254,7 @@ class GestionListaView(BaseView):
                 self.btn_extraer_ultimo.configure(state="disabled")
             
             # Obtener primer vuelo
-            primer_vuelo = self.cliente_api.obtener_primer_vuelo()
+            primer_vuelo = resumen.get('primer_vuelo')
             if primer_vuelo:
                 self.label_primer_vuelo.configure(
                     text=f"Primer vuelo: {primer_vuelo.get('numero_vuelo')} ({primer_vuelo.get('origen')} → {primer_vuelo.get('destino')})"
@@ -261,7 +264,7 @@ class GestionListaView(BaseView):
                 self.label_primer_vuelo.configure(text="Primer vuelo: No hay vuelos en la lista")
             
             # Obtener último vuelo
-            ultimo_vuelo = self.cliente_api.obtener_ultimo_vuelo()
+            ultimo_vuelo = resumen.get('ultimo_vuelo')
             if ultimo_vuelo:
                 self.label_ultimo_vuelo.configure(
                     text=f"Último vuelo: {ultimo_vuelo.get('numero_vuelo')} ({ultimo_vuelo.get('origen')} → {ultimo_vuelo.get('destino')})"
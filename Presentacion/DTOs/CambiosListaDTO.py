@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List
+
+class CambiosListaDTO(BaseModel):
+    lista_id: int
+    epoca: str
+    version: int  # Versión de la lista después de aplicar los cambios
+    recargar: bool  # True si los cambios ya no están en el registro: hay que leer GET /lista/
+    cambios: List[Dict[str, Any]] = []  # Los mismos eventos que publica GET /lista/eventos, en orden
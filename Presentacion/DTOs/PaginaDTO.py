@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+from Presentacion.DTOs.NodoDobleVueloDTO import NodoDobleVueloDTO
+from Presentacion.DTOs.VueloDTO import VueloDTO
+
+class PaginaVuelosDTO(BaseModel):
+    vuelos: List[VueloDTO] = []
+    siguiente_cursor: Optional[str] = None  # None cuando es la última página
+
+class PaginaNodosDTO(BaseModel):
+    lista_id: int
+    direccion: Literal["adelante", "atras"]
+    nodos: List[NodoDobleVueloDTO] = []
+    siguiente_cursor: Optional[str] = None  # None cuando se llegó al centinela
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+from typing import Dict, Optional
+from Presentacion.DTOs.VueloDTO import VueloDTO
+
+class ResumenDTO(BaseModel):
+    total_vuelos: int
+    vuelos_por_estado: Dict[str, int]  # Todos los estados, también los que no tienen vuelos
+    emergencias: int
+    tamanio_lista: int
+    primer_vuelo: Optional[VueloDTO] = None
+    ultimo_vuelo: Optional[VueloDTO] = None
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -9,7 +9,7 @@ class VueloCreadoDTO(BaseModel):
     destino: str
     hora_salida: datetime
     hora_llegada: datetime
-    prioridad: Optional[int] = 0
+    prioridad: Optional[int] = Field(0, ge=0, le=100)
     estado: Optional[str] = 'programado'
     emergencia: Optional[bool] = False
 
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional
 from datetime import datetime
 
@@ -9,7 +9,7 @@ class VueloDTO(BaseModel):
     destino: str
     hora_salida: datetime
     hora_llegada: datetime
-    prioridad: Optional[int] = 0  # Prioridad del vuelo (0 por defecto) desde el 0 hasta el 100, siendo 100 la mayor prioridad
+    prioridad: Optional[int] = Field(0, ge=0, le=100)  # Prioridad del vuelo (0 por defecto) desde el 0 hasta el 100, siendo 100 la mayor prioridad
     estado: Optional[str] = 'programado'  # Estado del vuelo
     emergencia: Optional[bool] = False
 
@@ -1,14 +1,215 @@
-from sqlalchemy.orm import Session
-from typing import List, Optional, Tuple
+from sqlalchemy import and_, bindparam, case, delete, exists, func, insert, literal, or_, select, update
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy.orm.util import identity_key
+from typing import Iterator, List, Optional, Tuple
 from sqlalchemy.exc import SQLAlchemyError
 from Dominio.Modelos.Vuelo import Vuelo
 from Dominio.Modelos.ListaDobleEnlCent import ListaDobleEnlazadaCentinelas
 from Dominio.Modelos.NodoDobleVuelos import NodoDobleVuelos
+from Dominio.Modelos.UltimoNodoPorPrioridad import UltimoNodoPorPrioridad
 from datetime import datetime
 
+# Separación entre las claves de orden (posicion) de nodos consecutivos.
+# Las posiciones persistidas son dispersas: insertar entre dos nodos toma el
+# punto medio del hueco y solo se renumera la lista cuando el hueco se agota.
+ESPACIO_POSICIONES = 1024
+
+# Sentencias Core con las que se enlazan y desenlazan nodos (ver ListaDobleEnlazadaCentinelasRepo.usar_core).
+# Se construyen una sola vez y se ejecutan con parámetros, así no se vuelven a armar en cada operación.
+_nodos = NodoDobleVuelos.__table__
+_vecinos = _nodos.alias("vecinos")
+_listas = ListaDobleEnlazadaCentinelas.__table__
+_ultimos = UltimoNodoPorPrioridad.__table__
+_vuelos = Vuelo.__table__
+
+_ENLACES = select(
+    _nodos.c.id,
+    _nodos.c.posicion,
+    _nodos.c.centinela,
+    _nodos.c.anterior_id,
+    _nodos.c.siguiente_id,
+    _nodos.c.vuelo_id,
+    _nodos.c.lista_id,
+    _nodos.c.creado_en
+)
+_ENLACES_POR_ID = _ENLACES.where(_nodos.c.id.in_(bindparam("ids", expanding=True)))
+
+def _enlaces_de_centinela(columna_centinela, columna_vecino):
+    """Consulta el centinela de una lista y el nodo que tiene al lado"""
+    centinela = select(columna_centinela).where(_listas.c.id == bindparam("lista_id")).scalar_subquery()
+    vecino = select(columna_vecino).where(_vecinos.c.id == centinela).scalar_subquery()
+    return _ENLACES.where(or_(_nodos.c.id == centinela, _nodos.c.id == vecino))
+
+_ENLACES_DEL_CABEZON = _enlaces_de_centinela(_listas.c.cabezon_id, _vecinos.c.siguiente_id)
+_ENLACES_DEL_COLON = _enlaces_de_centinela(_listas.c.colon_id, _vecinos.c.anterior_id)
+
+_INSERTAR_NODO = insert(_nodos).returning(_nodos.c.id)
+
+# Apunta el siguiente de p_anterior y el anterior de p_siguiente a los nodos recibidos
+_ENLAZAR_VECINOS = update(_nodos).where(
+    _nodos.c.id.in_([bindparam("p_anterior"), bindparam("p_siguiente")])
+).values(
+    siguiente_id=case(
+        (_nodos.c.id == bindparam("p_anterior"), bindparam("p_nuevo_siguiente")),
+        else_=_nodos.c.siguiente_id
+    ),
+    anterior_id=case(
+        (_nodos.c.id == bindparam("p_siguiente"), bindparam("p_nuevo_anterior")),
+        else_=_nodos.c.anterior_id
+    )
+)
+
+_AJUSTAR_TAMANIO = update(_listas).where(_listas.c.id == bindparam("lista_id")).values(
+    tamanio=_listas.c.tamanio + bindparam("p_delta")
+)
+
+# Cuenta un nodo insertado entre p_anterior y p_siguiente. La tabla UltimoNodoPorPrioridad solo sigue
+# vigente si el vuelo queda entre las claves de orden de sus vecinos (los centinelas no tienen clave)
+def _clave_del_nodo(parametro: str):
+    return select(_vuelos.c.clave_orden).select_from(
+        _vecinos.join(_vuelos, _vuelos.c.id == _vecinos.c.vuelo_id)
+    ).where(_vecinos.c.id == bindparam(parametro)).scalar_subquery()
+
+_clave_nueva = select(_vuelos.c.clave_orden).where(_vuelos.c.id == bindparam("p_vuelo")).scalar_subquery()
+_SUMAR_NODO = update(_listas).where(_listas.c.id == bindparam("lista_id")).values(
+    tamanio=_listas.c.tamanio + 1,
+    ultimos_validos=case(
+        (and_(
+            _clave_nueva >= func.coalesce(_clave_del_nodo("p_anterior"), ""),
+            _clave_nueva <= func.coalesce(_clave_del_nodo("p_siguiente"), _clave_nueva)
+        ), _listas.c.ultimos_validos),
+        else_=False
+    )
+)
+
+def _cubeta(clave_orden):
+    """Expresión SQL de la cubeta de una clave de orden (ver UltimoNodoPorPrioridad.cubeta_de)"""
+    return func.substr(clave_orden, 1, UltimoNodoPorPrioridad.LARGO_CUBETA)
+
+# Mantenimiento de UltimoNodoPorPrioridad al insertar un nodo: pasa a ser el último de la cubeta
+# de su vuelo si la cubeta no tenía último o si el que tenía está antes en la lista
+_cubeta_del_vuelo = select(_cubeta(_vuelos.c.clave_orden)).where(_vuelos.c.id == bindparam("p_vuelo")).scalar_subquery()
+_AVANZAR_ULTIMO = update(_ultimos).where(
+    _ultimos.c.lista_id == bindparam("p_lista"),
+    _ultimos.c.cubeta == _cubeta_del_vuelo,
+    select(_vecinos.c.posicion).where(_vecinos.c.id == _ultimos.c.nodo_id).scalar_subquery() < bindparam("p_posicion")
+).values(nodo_id=bindparam("p_nodo"))
+_ABRIR_ULTIMO = insert(_ultimos).from_select(
+    ["lista_id", "cubeta", "nodo_id"],
+    select(bindparam("p_lista"), _cubeta(_vuelos.c.clave_orden), bindparam("p_nodo")).where(
+        _vuelos.c.id == bindparam("p_vuelo"),
+        ~exists().where(
+            _ultimos.c.lista_id == bindparam("p_lista"),
+            _ultimos.c.cubeta == _cubeta(_vuelos.c.clave_orden)
+        )
+    )
+)
+
+# Lugar de una inserción ordenada: el nodo de la lista detrás del cual va el vuelo. Es el último
+# nodo de su cubeta con clave menor o igual (un rango del índice de vuelos.clave_orden); si no
+# hay, el último de la cubeta anterior no vacía y, si tampoco hay, el cabezon.
+_previo_en_cubeta = select(_nodos.c.id).select_from(
+    _vuelos.join(_nodos, _nodos.c.vuelo_id == _vuelos.c.id)
+).where(
+    _vuelos.c.clave_orden >= bindparam("p_cubeta"),
+    _vuelos.c.clave_orden <= bindparam("p_clave"),
+    # lista_id + 0: que no se use ix_NodoDobleVuelos_lista_posicion, que recorrería toda la lista
+    _nodos.c.lista_id + 0 == bindparam("lista_id")
+).order_by(_vuelos.c.clave_orden.desc(), _nodos.c.posicion.desc()).limit(1).scalar_subquery()
+_ultimo_de_cubeta_anterior = select(_ultimos.c.nodo_id).where(
+    _ultimos.c.lista_id == bindparam("lista_id"),
+    _ultimos.c.cubeta < bindparam("p_cubeta")
+).order_by(_ultimos.c.cubeta.desc()).limit(1).scalar_subquery()
+_cabezon = select(_listas.c.cabezon_id).where(_listas.c.id == bindparam("lista_id")).scalar_subquery()
+_previo_en_orden = func.coalesce(_previo_en_cubeta, _ultimo_de_cubeta_anterior, _cabezon)
+_ENLACES_DEL_LUGAR_ORDENADO = _ENLACES.where(or_(
+    _nodos.c.id == _previo_en_orden,
+    _nodos.c.id == select(_vecinos.c.siguiente_id).where(_vecinos.c.id == _previo_en_orden).scalar_subquery()
+))
+
+_CEDER_ULTIMO_AL_ANTERIOR = update(_ultimos).where(
+    _ultimos.c.nodo_id == bindparam("p_nodo"),
+    _ultimos.c.cubeta == select(_cubeta(_vuelos.c.clave_orden)).select_from(
+        _vecinos.join(_vuelos, _vuelos.c.id == _vecinos.c.vuelo_id)
+    ).where(_vecinos.c.id == bindparam("p_anterior")).scalar_subquery()
+).values(nodo_id=bindparam("p_anterior"))
+_BORRAR_ULTIMO = delete(_ultimos).where(_ultimos.c.nodo_id == bindparam("p_nodo"))
+_BORRAR_NODO = delete(_nodos).where(_nodos.c.id == bindparam("p_nodo"))
+
+# Columnas de VueloDTO que acompañan a cada nodo en las páginas de la lista
+_COLUMNAS_VUELO = (
+    _vuelos.c.id,
+    _vuelos.c.numero_vuelo,
+    _vuelos.c.origen,
+    _vuelos.c.destino,
+    _vuelos.c.hora_salida,
+    _vuelos.c.hora_llegada,
+    _vuelos.c.prioridad,
+    _vuelos.c.estado,
+    _vuelos.c.emergencia
+)
+
+_CAMPOS_VUELO = tuple(columna.name for columna in _COLUMNAS_VUELO)
+
+def _columnas_de_nodo_con_vuelo(orden):
+    """Columnas de las lecturas de nodos con su vuelo: orden, nodo, enlaces y luego el vuelo"""
+    return (
+        orden,
+        _nodos.c.id.label("nodo_id"),
+        _nodos.c.posicion.label("clave"),
+        _nodos.c.anterior_id,
+        _nodos.c.siguiente_id,
+        *_COLUMNAS_VUELO
+    )
+
+def _fila_a_nodo(fila) -> dict:
+    """Convierte una fila con _columnas_de_nodo_con_vuelo en el diccionario del nodo y su vuelo"""
+    return {
+        "id": fila.nodo_id,
+        "posicion": fila.clave,
+        "anterior_id": fila.anterior_id,
+        "siguiente_id": fila.siguiente_id,
+        "vuelo": dict(zip(_CAMPOS_VUELO, fila[5:]))
+    }
+
+def _pagina_de_nodos(columna_enlace: str):
+    """
+    Consulta una página de la lista: sigue el enlace indicado (siguiente_id o anterior_id)
+    desde el nodo desde_id, que debe pertenecer a la lista, hasta juntar `limite` nodos o
+    llegar a un centinela. Devuelve el nodo de partida con orden 0 y los de la página
+    con orden 1..limite, cada uno con los datos de su vuelo.
+    """
+    pagina = select(
+        _nodos.c.id,
+        _nodos.c[columna_enlace].label("enlace"),
+        literal(0).label("orden")
+    ).where(
+        _nodos.c.id == bindparam("desde_id"),
+        _nodos.c.lista_id == bindparam("lista_id")
+    ).cte(f"pagina_{columna_enlace}", recursive=True)
+
+    nodo = _nodos.alias("nodo")
+    pagina = pagina.union_all(
+        select(nodo.c.id, nodo.c[columna_enlace], pagina.c.orden + 1).where(
+            nodo.c.id == pagina.c.enlace,
+            nodo.c.centinela.is_(None),
+            nodo.c.activo == True,
+            pagina.c.orden < bindparam("limite")
+        )
+    )
+    return select(*_columnas_de_nodo_con_vuelo(pagina.c.orden)).select_from(
+        pagina.join(_nodos, _nodos.c.id == pagina.c.id).outerjoin(_vuelos, _vuelos.c.id == _nodos.c.vuelo_id)
+    ).order_by(pagina.c.orden)
+
+_PAGINA_HACIA_ADELANTE = _pagina_de_nodos("siguiente_id")
+_PAGINA_HACIA_ATRAS = _pagina_de_nodos("anterior_id")
+
 class ListaDobleEnlazadaCentinelasRepo:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, usar_core: bool = True):
         self.db = db
+        # Enlazar y desenlazar nodos con sentencias Core (INSERT ... RETURNING y UPDATE ... WHERE id IN)
+        # en lugar de cargar y modificar objetos ORM. Si el motor no soporta RETURNING se usa el ORM.
+        self.usar_core = usar_core and db.get_bind().dialect.insert_returning
         
     def crear_lista(self, nombre: str = "principal") -> Optional[ListaDobleEnlazadaCentinelas]:
         """Crea una nueva lista con sus nodos centinela"""
@@ -43,6 +244,12 @@ class ListaDobleEnlazadaCentinelasRepo:
             )
             
             self.db.add(lista)
+            self.db.flush()
+            
+            # Los centinelas también pertenecen a la lista
+            cabezon.lista_id = lista.id
+            colon.lista_id = lista.id
+            
             self.db.commit()
             self.db.refresh(lista)
             return lista
@@ -52,10 +259,36 @@ class ListaDobleEnlazadaCentinelasRepo:
             raise e
     
     def obtener_lista_por_id(self, lista_id: int) -> Optional[ListaDobleEnlazadaCentinelas]:
-        """Obtiene una lista por su ID"""
-        return self.db.query(ListaDobleEnlazadaCentinelas).filter(
-            ListaDobleEnlazadaCentinelas.id == lista_id
-        ).first()
+        """Obtiene una lista por su ID (sin consultar si ya está cargada en la sesión)"""
+        return self.db.get(ListaDobleEnlazadaCentinelas, lista_id)
+    
+    def obtener_tamanio(self, lista_id: int) -> int:
+        """Lee solo el contador de nodos de una lista"""
+        return self.db.execute(
+            select(ListaDobleEnlazadaCentinelas.tamanio).where(ListaDobleEnlazadaCentinelas.id == lista_id)
+        ).scalar() or 0
+    
+    def contar_nodos(self, lista_id: int) -> int:
+        """Cuenta los nodos regulares de una lista con el índice (lista_id, posicion), sin recorrer los enlaces"""
+        return self.db.execute(
+            select(func.count()).select_from(NodoDobleVuelos).where(
+                NodoDobleVuelos.lista_id == lista_id,
+                NodoDobleVuelos.centinela.is_(None)
+            )
+        ).scalar()
+    
+    def obtener_nodo_en_posicion(self, lista_id: int, posicion: int) -> Optional[NodoDobleVuelos]:
+        """
+        Obtiene el nodo que ocupa un índice (0..n-1) de la lista con una sola consulta sobre el
+        índice (lista_id, posicion): las claves de orden siguen el mismo orden que los enlaces,
+        así que no hace falta recorrerlos desde el cabezon.
+        """
+        if posicion < 0:
+            return None
+        return self.db.query(NodoDobleVuelos).filter(
+            NodoDobleVuelos.lista_id == lista_id,
+            NodoDobleVuelos.centinela.is_(None)
+        ).order_by(NodoDobleVuelos.posicion).offset(posicion).first()
     
     def obtener_lista_por_nombre(self, nombre: str) -> Optional[ListaDobleEnlazadaCentinelas]:
         """Obtiene una lista por su nombre"""
@@ -67,114 +300,85 @@ class ListaDobleEnlazadaCentinelasRepo:
         """Obtiene todas las listas"""
         return self.db.query(ListaDobleEnlazadaCentinelas).all()
     
-    def obtener_nodos_de_lista(self, lista_id: int) -> List[NodoDobleVuelos]:
-        """Obtiene todos los nodos de una lista, ordenados por posición"""
+    def _recorrido_de_lista(self, lista: ListaDobleEnlazadaCentinelas):
+        """
+        CTE recursivo que recorre los enlaces siguiente_id desde el cabezon (orden 0)
+        hasta llegar al colon o a un nodo inactivo. Cada fila trae el id del nodo,
+        su vuelo y su orden dentro de la lista.
+        """
+        # Caso base: el cabezon (orden 0)
+        recorrido = select(
+            NodoDobleVuelos.id.label("id"),
+            NodoDobleVuelos.siguiente_id.label("siguiente_id"),
+            NodoDobleVuelos.vuelo_id.label("vuelo_id"),
+            literal(0).label("orden")
+        ).where(
+            NodoDobleVuelos.id == lista.cabezon_id
+        ).cte("recorrido", recursive=True)
+
+        # Paso recursivo: seguir siguiente_id hasta llegar al colon o a un nodo inactivo
+        nodo = aliased(NodoDobleVuelos)
+        return recorrido.union_all(
+            select(
+                nodo.id,
+                nodo.siguiente_id,
+                nodo.vuelo_id,
+                recorrido.c.orden + 1
+            ).where(
+                nodo.id == recorrido.c.siguiente_id,
+                nodo.id != lista.colon_id,
+                nodo.activo == True
+            )
+        )
+
+    def obtener_nodos_de_lista(self, lista_id: int, cargar_vuelos: bool = False) -> List[NodoDobleVuelos]:
+        """
+        Obtiene todos los nodos de una lista, ordenados por posición.
+
+        El recorrido de los enlaces se hace dentro de la base de datos con un CTE
+        recursivo, así que la lista completa se carga con una sola consulta en lugar
+        de una por nodo. Con cargar_vuelos, la misma consulta trae también el vuelo
+        de cada nodo (joined load) y acceder a nodo.vuelo no vuelve a consultar.
+        """
         lista = self.obtener_lista_por_id(lista_id)
         if not lista:
             return []
-            
-        # Obtener el primer nodo (después del cabezon)
-        primer_nodo = self.db.query(NodoDobleVuelos).filter(
-            NodoDobleVuelos.id == lista.header.siguiente_id,
-            NodoDobleVuelos.activo == True
-        ).first()
-        
-        if not primer_nodo:
-            return []
-            
-        # Recorrer la lista y obtener todos los nodos
-        nodos = []
-        nodo_actual = primer_nodo
-        
-        while nodo_actual and nodo_actual.id != lista.colon_id:
-            nodos.append(nodo_actual)
-            nodo_actual = self.db.query(NodoDobleVuelos).filter(
-                NodoDobleVuelos.id == nodo_actual.siguiente_id,
-                NodoDobleVuelos.activo == True
-            ).first()
-            
-        return nodos
+
+        recorrido = self._recorrido_de_lista(lista)
+        consulta = self.db.query(NodoDobleVuelos).join(
+            recorrido, NodoDobleVuelos.id == recorrido.c.id
+        ).filter(
+            recorrido.c.orden > 0  # Excluir el cabezon
+        ).order_by(recorrido.c.orden)
+        if cargar_vuelos:
+            consulta = consulta.options(joinedload(NodoDobleVuelos.vuelo))
+        return consulta.all()
         
     def insertar_nodo_al_frente(self, lista_id: int, vuelo_id: int) -> Optional[NodoDobleVuelos]:
         """Inserta un nuevo nodo al principio de la lista (después del cabezon)"""
+        if self.usar_core:
+            return self._insertar_en_extremo_core(lista_id, vuelo_id, "cabezon")
+            
         lista = self.obtener_lista_por_id(lista_id)
         if not lista:
             return None
             
-        try:
-            # Obtener los nodos centinela
-            cabezon = self.db.query(NodoDobleVuelos).get(lista.cabezon_id)
-            siguiente_actual = self.db.query(NodoDobleVuelos).get(cabezon.siguiente_id)
-            
-            # Crear el nuevo nodo
-            nuevo_nodo = NodoDobleVuelos(
-                vuelo_id=vuelo_id,
-                anterior_id=cabezon.id,
-                siguiente_id=siguiente_actual.id,
-                posicion=0,
-                creado_en=datetime.now(),
-                activo=True
-            )
-            
-            self.db.add(nuevo_nodo)
-            self.db.flush()  # Para obtener el ID asignado
-            
-            # Actualizar los enlaces
-            cabezon.siguiente_id = nuevo_nodo.id
-            siguiente_actual.anterior_id = nuevo_nodo.id
-            
-            # Actualizar posiciones de los nodos siguientes
-            self._actualizar_posiciones_siguientes(siguiente_actual.id)
-            
-            # Incrementar el tamaño de la lista
-            lista.tamanio += 1
-            
-            self.db.commit()
-            self.db.refresh(nuevo_nodo)
-            return nuevo_nodo
-            
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise e
+        cabezon = self.db.query(NodoDobleVuelos).get(lista.cabezon_id)
+        siguiente_actual = self.db.query(NodoDobleVuelos).get(cabezon.siguiente_id)
+        return self._insertar_entre(lista, vuelo_id, cabezon, siguiente_actual)
     
     def insertar_nodo_al_final(self, lista_id: int, vuelo_id: int) -> Optional[NodoDobleVuelos]:
         """Inserta un nuevo nodo al final de la lista (antes del colon)"""
+        if self.usar_core:
+            return self._insertar_en_extremo_core(lista_id, vuelo_id, "colon")
+            
         lista = self.obtener_lista_por_id(lista_id)
         if not lista:
             return None
             
-        try:
-            # Obtener los nodos centinela
-            colon = self.db.query(NodoDobleVuelos).get(lista.colon_id)
-            anterior_actual = self.db.query(NodoDobleVuelos).get(colon.anterior_id)
-            
-            # Crear el nuevo nodo
-            nuevo_nodo = NodoDobleVuelos(
-                vuelo_id=vuelo_id,
-                anterior_id=anterior_actual.id,
-                siguiente_id=colon.id,
-                posicion=lista.tamanio,  # La posición es el tamaño actual
-                creado_en=datetime.now(),
-                activo=True
-            )
-            
-            self.db.add(nuevo_nodo)
-            self.db.flush()  # Para obtener el ID asignado
-            
-            # Actualizar los enlaces
-            anterior_actual.siguiente_id = nuevo_nodo.id
-            colon.anterior_id = nuevo_nodo.id
-            
-            # Incrementar el tamaño de la lista
-            lista.tamanio += 1
-            
-            self.db.commit()
-            self.db.refresh(nuevo_nodo)
-            return nuevo_nodo
-            
-        except SQLAlchemyError as e:
-            self.db.rollback()
-            raise e
+        colon = self.db.query(NodoDobleVuelos).get(lista.colon_id)
+        anterior_actual = self.db.query(NodoDobleVuelos).get(colon.anterior_id)
+        return self._insertar_entre(lista, vuelo_id, anterior_actual, colon)
     
     def insertar_nodo_en_posicion(self, lista_id: int, vuelo_id: int, posicion: int) -> Optional[NodoDobleVuelos]:
         """Inserta un nuevo nodo en una posición específica de la lista"""
@@ -190,32 +394,94 @@ class ListaDobleEnlazadaCentinelasRepo:
         if posicion >= lista.tamanio:
             return self.insertar_nodo_al_final(lista_id, vuelo_id)
             
+        # El nodo que hoy ocupa la posición pasa a ser el siguiente del nuevo
+        siguiente = self.obtener_nodo_en_posicion(lista_id, posicion)
+        if not siguiente:
+            # Si la posición no existe en la lista, insertar al final
+            return self.insertar_nodo_al_final(lista_id, vuelo_id)
+            
+        anterior = self.db.get(NodoDobleVuelos, siguiente.anterior_id)
+        return self._insertar_entre(lista, vuelo_id, anterior, siguiente)
+    
+    def insertar_nodo_entre(self, lista_id: int, vuelo_id: int, anterior_id: int, siguiente_id: int) -> Optional[NodoDobleVuelos]:
+        """
+        Inserta un nuevo nodo entre dos nodos adyacentes ya conocidos (pueden ser los centinelas).
+        Solo se cargan esos dos nodos, así que no hace falta recorrer la lista.
+        Devuelve None si la lista no existe o si los nodos no son adyacentes.
+        """
+        if self.usar_core:
+            filas = self.db.connection().execute(_ENLACES_POR_ID, {"ids": [anterior_id, siguiente_id]}).all()
+            por_id = {fila.id: fila for fila in filas}
+            anterior, siguiente = por_id.get(anterior_id), por_id.get(siguiente_id)
+            if not anterior or not siguiente or anterior.siguiente_id != siguiente.id:
+                return None
+            return self._insertar_entre_core(lista_id, vuelo_id, anterior, siguiente)
+            
+        lista = self.obtener_lista_por_id(lista_id)
+        if not lista:
+            return None
+            
+        anterior = self.db.query(NodoDobleVuelos).get(anterior_id)
+        siguiente = self.db.query(NodoDobleVuelos).get(siguiente_id)
+        if not anterior or not siguiente or anterior.siguiente_id != siguiente.id:
+            return None
+            
+        return self._insertar_entre(lista, vuelo_id, anterior, siguiente)
+    
+    def insertar_nodo_ordenado(self, lista_id: int, vuelo_id: int) -> Optional[NodoDobleVuelos]:
+        """
+        Inserta un nuevo nodo en su lugar según la clave de orden del vuelo, detrás de los
+        nodos con la misma clave.
+
+        El lugar se resuelve con una sola consulta: el último nodo de la cubeta del vuelo con
+        clave menor o igual (un rango del índice de vuelos.clave_orden) o, si no hay, el último
+        de la cubeta anterior no vacía según UltimoNodoPorPrioridad (o el cabezon), junto con
+        su siguiente. La inserción no depende del largo de la lista ni de los empates.
+        """
+        lista = self.obtener_lista_por_id(lista_id)
+        vuelo = self.db.get(Vuelo, vuelo_id)
+        if not lista or not vuelo:
+            return None
+            
         try:
-            # Obtener los nodos de la lista
-            nodos = self.obtener_nodos_de_lista(lista_id)
-            if not nodos:
-                return self.insertar_nodo_al_final(lista_id, vuelo_id)
-                
-            # Encontrar el nodo en la posición donde queremos insertar
-            nodo_en_posicion = None
-            for nodo in nodos:
-                if nodo.posicion == posicion:
-                    nodo_en_posicion = nodo
-                    break
-                    
-            if not nodo_en_posicion:
-                # Si no se encuentra exactamente la posición, usar el último nodo
-                return self.insertar_nodo_al_final(lista_id, vuelo_id)
+            if not lista.ultimos_validos:
+                self._reconstruir_ultimos_por_prioridad(lista)
                 
-            # Obtener el nodo anterior
-            nodo_anterior = self.db.query(NodoDobleVuelos).get(nodo_en_posicion.anterior_id)
+            filas = self.db.connection().execute(_ENLACES_DEL_LUGAR_ORDENADO, {
+                "lista_id": lista.id,
+                "p_cubeta": UltimoNodoPorPrioridad.cubeta_de(vuelo.clave_orden),
+                "p_clave": vuelo.clave_orden
+            }).all()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
             
+        if len(filas) != 2:
+            return None
+        anterior, siguiente = filas if filas[0].siguiente_id == filas[1].id else reversed(filas)
+        if self.usar_core:
+            return self._insertar_entre_core(lista.id, vuelo_id, anterior, siguiente)
+        return self._insertar_entre(
+            lista, vuelo_id,
+            self.db.get(NodoDobleVuelos, anterior.id),
+            self.db.get(NodoDobleVuelos, siguiente.id)
+        )
+    
+    def _insertar_entre(self, lista: ListaDobleEnlazadaCentinelas, vuelo_id: int,
+                        anterior: NodoDobleVuelos, siguiente: NodoDobleVuelos) -> NodoDobleVuelos:
+        """
+        Crea un nodo para el vuelo y lo enlaza entre dos nodos adyacentes en una sola transacción.
+        Si la inserción respeta el orden de prioridad se actualiza el último nodo de su cubeta;
+        si no, se invalidan los últimos nodos de la lista.
+        """
+        try:
             # Crear el nuevo nodo
             nuevo_nodo = NodoDobleVuelos(
                 vuelo_id=vuelo_id,
-                anterior_id=nodo_anterior.id,
-                siguiente_id=nodo_en_posicion.id,
-                posicion=posicion,
+                lista_id=lista.id,
+                anterior_id=anterior.id,
+                siguiente_id=siguiente.id,
+                posicion=self._clave_entre(lista, anterior, siguiente),
                 creado_en=datetime.now(),
                 activo=True
             )
@@ -223,16 +489,17 @@ class ListaDobleEnlazadaCentinelasRepo:
             self.db.add(nuevo_nodo)
             self.db.flush()  # Para obtener el ID asignado
             
-            # Actualizar enlaces
-            nodo_anterior.siguiente_id = nuevo_nodo.id
-            nodo_en_posicion.anterior_id = nuevo_nodo.id
-            
-            # Actualizar posiciones de los nodos siguientes
-            self._actualizar_posiciones_siguientes(nodo_en_posicion.id)
+            # Actualizar los enlaces
+            anterior.siguiente_id = nuevo_nodo.id
+            siguiente.anterior_id = nuevo_nodo.id
             
             # Incrementar el tamaño de la lista
             lista.tamanio += 1
             
+            if not self._conserva_orden(vuelo_id, anterior, siguiente):
+                lista.ultimos_validos = False
+            self._registrar_ultimo_de_cubeta(lista.id, nuevo_nodo.id, vuelo_id, nuevo_nodo.posicion)
+            
             self.db.commit()
             self.db.refresh(nuevo_nodo)
             return nuevo_nodo
@@ -241,23 +508,179 @@ class ListaDobleEnlazadaCentinelasRepo:
             self.db.rollback()
             raise e
     
-    def _actualizar_posiciones_siguientes(self, nodo_id: int, incremento: int = 1):
-        """Actualiza las posiciones de los nodos a partir del nodo especificado"""
-        nodo_actual = self.db.query(NodoDobleVuelos).get(nodo_id)
+    def _insertar_en_extremo_core(self, lista_id: int, vuelo_id: int, centinela: str) -> Optional[NodoDobleVuelos]:
+        """
+        Inserta un nodo junto a uno de los centinelas de la lista. El centinela y su vecino
+        se leen con una sola consulta, usando subconsultas sobre la lista.
+        """
+        consulta = _ENLACES_DEL_CABEZON if centinela == "cabezon" else _ENLACES_DEL_COLON
+        filas = self.db.connection().execute(consulta, {"lista_id": lista_id}).all()
+        if len(filas) != 2:
+            return None
+        fila_extremo, fila_vecino = filas if filas[0].centinela == centinela else reversed(filas)
         
-        # Si es un nodo centinela o no existe, no hay nada que actualizar
-        if not nodo_actual or nodo_actual.centinela:
-            return
+        if centinela == "cabezon":
+            return self._insertar_entre_core(lista_id, vuelo_id, fila_extremo, fila_vecino)
+        return self._insertar_entre_core(lista_id, vuelo_id, fila_vecino, fila_extremo)
+    
+    def _insertar_entre_core(self, lista_id: int, vuelo_id: int, anterior, siguiente) -> Optional[NodoDobleVuelos]:
+        """
+        Versión Core de _insertar_entre: un INSERT ... RETURNING crea el nodo, un único
+        UPDATE ... WHERE id IN enlaza a sus dos vecinos, otras dos sentencias mantienen el último
+        nodo de su cubeta y un UPDATE ajusta el tamaño de la lista (e invalida los últimos nodos
+        si la inserción no respeta el orden de prioridad). Si entre los vecinos no queda hueco
+        para la clave de orden, se usa el camino ORM, que renumera la lista.
+        """
+        if not anterior.centinela and not siguiente.centinela and siguiente.posicion - anterior.posicion < 2:
+            lista = self.obtener_lista_por_id(lista_id)
+            if not lista:
+                return None
+            return self._insertar_entre(
+                lista, vuelo_id,
+                self.db.get(NodoDobleVuelos, anterior.id),
+                self.db.get(NodoDobleVuelos, siguiente.id)
+            )
             
-        # Actualizar la posición de este nodo y todos los siguientes
-        while nodo_actual and not nodo_actual.centinela:
-            nodo_actual.posicion += incremento
-            nodo_actual = self.db.query(NodoDobleVuelos).get(nodo_actual.siguiente_id)
+        posicion = self._clave_entre(None, anterior, siguiente)
+        creado_en = datetime.now()
+        try:
+            conexion = self.db.connection()
+            nuevo_id = conexion.execute(_INSERTAR_NODO, {
+                "vuelo_id": vuelo_id,
+                "lista_id": lista_id,
+                "anterior_id": anterior.id,
+                "siguiente_id": siguiente.id,
+                "posicion": posicion,
+                "creado_en": creado_en,
+                "activo": True,
+                "version": 1
+            }).scalar_one()
+            
+            # Enlazar a los dos vecinos con una sola sentencia
+            conexion.execute(_ENLAZAR_VECINOS, {
+                "p_anterior": anterior.id,
+                "p_siguiente": siguiente.id,
+                "p_nuevo_siguiente": nuevo_id,
+                "p_nuevo_anterior": nuevo_id
+            })
+            
+            self._registrar_ultimo_de_cubeta(lista_id, nuevo_id, vuelo_id, posicion)
+            
+            if not conexion.execute(_SUMAR_NODO, {
+                "lista_id": lista_id,
+                "p_vuelo": vuelo_id,
+                "p_anterior": anterior.id,
+                "p_siguiente": siguiente.id
+            }).rowcount:
+                self.db.rollback()
+                return None
+                
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+            
+        return NodoDobleVuelos(
+            id=nuevo_id,
+            vuelo_id=vuelo_id,
+            lista_id=lista_id,
+            posicion=posicion,
+            anterior_id=anterior.id,
+            siguiente_id=siguiente.id,
+            creado_en=creado_en,
+            activo=True,
+            version=1
+        )
+    
+    def _clave_entre(self, lista: ListaDobleEnlazadaCentinelas, anterior: NodoDobleVuelos,
+                     siguiente: NodoDobleVuelos, nodos: Optional[List[NodoDobleVuelos]] = None) -> int:
+        """
+        Calcula una clave de orden libre entre dos nodos adyacentes (los centinelas no tienen clave).
+        Si entre ambas claves ya no queda hueco, renumera los nodos de la lista (los recibidos
+        o, si no se reciben, los de la base de datos) y vuelve a calcularla.
+        """
+        if anterior.centinela and siguiente.centinela:
+            return 0
+        if anterior.centinela:
+            return siguiente.posicion - ESPACIO_POSICIONES
+        if siguiente.centinela:
+            return anterior.posicion + ESPACIO_POSICIONES
+        if siguiente.posicion - anterior.posicion < 2:
+            self._rebalancear_posiciones(nodos if nodos is not None else self.obtener_nodos_de_lista(lista.id))
+        return (anterior.posicion + siguiente.posicion) // 2
+    
+    def _reconstruir_ultimos_por_prioridad(self, lista: ListaDobleEnlazadaCentinelas):
+        """
+        Recalcula UltimoNodoPorPrioridad de la lista con un recorrido en SQL: por cada cubeta
+        se queda el nodo con mayor orden dentro de la lista.
+        """
+        ultimos = UltimoNodoPorPrioridad.__table__
+        vuelos = Vuelo.__table__
+        recorrido = self._recorrido_de_lista(lista)
+        
+        cubeta = func.substr(vuelos.c.clave_orden, 1, UltimoNodoPorPrioridad.LARGO_CUBETA)
+        por_cubeta = select(
+            cubeta.label("cubeta"),
+            recorrido.c.id.label("nodo_id"),
+            func.row_number().over(partition_by=cubeta, order_by=recorrido.c.orden.desc()).label("rango")
+        ).select_from(
+            recorrido.join(vuelos, vuelos.c.id == recorrido.c.vuelo_id)
+        ).where(
+            recorrido.c.orden > 0  # Excluir el cabezon
+        ).subquery("por_cubeta")
+        
+        self.db.execute(delete(ultimos).where(ultimos.c.lista_id == lista.id))
+        self.db.execute(
+            insert(ultimos).from_select(
+                ["lista_id", "cubeta", "nodo_id"],
+                select(literal(lista.id), por_cubeta.c.cubeta, por_cubeta.c.nodo_id).where(por_cubeta.c.rango == 1)
+            )
+        )
+        lista.ultimos_validos = True
+    
+    def _conserva_orden(self, vuelo_id: int, anterior: NodoDobleVuelos, siguiente: NodoDobleVuelos) -> bool:
+        """Indica si el vuelo queda entre las claves de orden de sus vecinos (los centinelas no tienen clave)"""
+        claves = dict(self.db.execute(
+            select(Vuelo.id, Vuelo.clave_orden).where(Vuelo.id.in_([vuelo_id, anterior.vuelo_id, siguiente.vuelo_id]))
+        ).all())
+        clave = claves.get(vuelo_id)
+        return clave is not None and \
+            (claves.get(anterior.vuelo_id) or "") <= clave <= (claves.get(siguiente.vuelo_id) or clave)
+    
+    def _registrar_ultimo_de_cubeta(self, lista_id: int, nodo_id: int, vuelo_id: int, posicion: int):
+        """
+        Marca el nodo recién insertado como último de la cubeta de su vuelo si la cubeta no tenía
+        último o si el que tenía queda antes en la lista
+        """
+        parametros = {"p_lista": lista_id, "p_nodo": nodo_id, "p_vuelo": vuelo_id, "p_posicion": posicion}
+        conexion = self.db.connection()
+        conexion.execute(_AVANZAR_ULTIMO, parametros)
+        conexion.execute(_ABRIR_ULTIMO, parametros)
+    
+    def _retirar_ultimo_de_cubeta(self, nodo: NodoDobleVuelos, anterior: NodoDobleVuelos):
+        """Si el nodo que se extrae es el último de su cubeta, pasa a serlo el anterior (o la cubeta queda vacía)"""
+        ultimo = self.db.query(UltimoNodoPorPrioridad).filter(
+            UltimoNodoPorPrioridad.nodo_id == nodo.id
+        ).first()
+        if not ultimo:
+            return
+        if not anterior.centinela and anterior.vuelo and \
+                UltimoNodoPorPrioridad.cubeta_de(anterior.vuelo.clave_orden) == ultimo.cubeta:
+            ultimo.nodo_id = anterior.id
+        else:
+            self.db.delete(ultimo)
     
-    def extraer_nodo(self, nodo_id: int) -> Tuple[Optional[NodoDobleVuelos], bool]:
-        """Extrae un nodo de la lista y lo elimina permanentemente"""
+    def extraer_nodo(self, nodo_id: int, lista_id: Optional[int] = None) -> Tuple[Optional[NodoDobleVuelos], bool]:
+        """
+        Extrae un nodo de la lista y lo elimina permanentemente.
+        La lista cuyo tamaño se descuenta es la que registra el nodo en lista_id; si se recibe
+        lista_id, el nodo debe pertenecer a esa lista.
+        """
+        if self.usar_core:
+            return self._extraer_nodo_core(nodo_id, lista_id)
+            
         nodo = self.db.query(NodoDobleVuelos).get(nodo_id)
-        if not nodo or nodo.centinela:
+        if not nodo or nodo.centinela or (lista_id is not None and nodo.lista_id != lista_id):
             return None, False
             
         try:
@@ -269,23 +692,13 @@ class ListaDobleEnlazadaCentinelasRepo:
             anterior.siguiente_id = siguiente.id
             siguiente.anterior_id = anterior.id
             
-            # Buscar a qué lista pertenece este nodo
-            lista = self.db.query(ListaDobleEnlazadaCentinelas).filter(
-                (ListaDobleEnlazadaCentinelas.cabezon_id == anterior.id) | 
-                (ListaDobleEnlazadaCentinelas.colon_id == siguiente.id)
-            ).first()
-            
-            if not lista:
-                # Buscar otra forma de determinar la lista
-                if anterior.centinela:
-                    lista = anterior.estado_header
-                elif siguiente.centinela:
-                    lista = siguiente.estado_trailer
+            lista = self.obtener_lista_por_id(nodo.lista_id) if nodo.lista_id is not None else None
             
             # Guardar una copia del nodo para devolver
             nodo_copia = NodoDobleVuelos(
                 id=nodo.id,
                 vuelo_id=nodo.vuelo_id,
+                lista_id=nodo.lista_id,
                 posicion=nodo.posicion,
                 anterior_id=nodo.anterior_id,
                 siguiente_id=nodo.siguiente_id,
@@ -293,12 +706,12 @@ class ListaDobleEnlazadaCentinelasRepo:
                 creado_en=nodo.creado_en
             )
             
+            # Mantener el último nodo de su cubeta de prioridad
+            self._retirar_ultimo_de_cubeta(nodo, anterior)
+            
             # Eliminar el nodo permanentemente
             self.db.delete(nodo)
             
-            # Actualizar posiciones de los nodos siguientes
-            self._actualizar_posiciones_siguientes(siguiente.id, -1)
-            
             # Decrementar el tamaño de la lista
             if lista:
                 lista.tamanio -= 1
@@ -310,6 +723,119 @@ class ListaDobleEnlazadaCentinelasRepo:
             self.db.rollback()
             raise e
 
+    def _extraer_nodo_core(self, nodo_id: int, lista_id: Optional[int]) -> Tuple[Optional[NodoDobleVuelos], bool]:
+        """
+        Versión Core de extraer_nodo: un único UPDATE ... WHERE id IN une a los dos vecinos,
+        un DELETE elimina el nodo y otro UPDATE ajusta el tamaño de la lista.
+        """
+        conexion = self.db.connection()
+        nodo = conexion.execute(_ENLACES_POR_ID, {"ids": [nodo_id]}).first()
+        if not nodo or nodo.centinela or (lista_id is not None and nodo.lista_id != lista_id):
+            return None, False
+            
+        try:
+            # Enlazar entre sí a los vecinos del nodo
+            conexion.execute(_ENLAZAR_VECINOS, {
+                "p_anterior": nodo.anterior_id,
+                "p_siguiente": nodo.siguiente_id,
+                "p_nuevo_siguiente": nodo.siguiente_id,
+                "p_nuevo_anterior": nodo.anterior_id
+            })
+            
+            # Si era el último de su cubeta de prioridad, pasa a serlo el anterior si es de la misma cubeta
+            conexion.execute(_CEDER_ULTIMO_AL_ANTERIOR, {"p_nodo": nodo.id, "p_anterior": nodo.anterior_id})
+            conexion.execute(_BORRAR_ULTIMO, {"p_nodo": nodo.id})
+            
+            conexion.execute(_BORRAR_NODO, {"p_nodo": nodo.id})
+            conexion.execute(_AJUSTAR_TAMANIO, {"lista_id": nodo.lista_id, "p_delta": -1})
+            self.db.commit()
+            
+            # Si la sesión tenía cargado el nodo, sacarlo: SQLite puede reutilizar su id
+            cargado = self.db.identity_map.get(identity_key(NodoDobleVuelos, nodo.id))
+            if cargado is not None:
+                self.db.expunge(cargado)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+            
+        return NodoDobleVuelos(
+            id=nodo.id,
+            vuelo_id=nodo.vuelo_id,
+            lista_id=nodo.lista_id,
+            posicion=nodo.posicion,
+            anterior_id=nodo.anterior_id,
+            siguiente_id=nodo.siguiente_id,
+            centinela=nodo.centinela,
+            creado_en=nodo.creado_en
+        ), True
+
+    def obtener_pagina_de_nodos(self, lista_id: int, desde_id: int, limite: int,
+                                hacia_atras: bool = False) -> Optional[List[dict]]:
+        """
+        Obtiene hasta `limite` nodos que siguen (o preceden, con hacia_atras) al nodo desde_id,
+        que puede ser un centinela, con una sola consulta acotada por `limite`.
+
+        Cada nodo se devuelve como diccionario con su id, su clave de orden (posicion), sus
+        enlaces y su vuelo con los campos de VueloDTO. Devuelve None si desde_id ya no está
+        en la lista, para que quien pagina retome la página desde otro nodo.
+        """
+        consulta = _PAGINA_HACIA_ATRAS if hacia_atras else _PAGINA_HACIA_ADELANTE
+        filas = self.db.connection().execute(
+            consulta, {"desde_id": desde_id, "lista_id": lista_id, "limite": limite}
+        ).all()
+        if not filas:
+            return None
+        return [_fila_a_nodo(fila) for fila in filas[1:]]
+
+    def iterar_bloques_de_nodos(self, lista_id: int, tamanio_bloque: int) -> Iterator[List[dict]]:
+        """
+        Recorre todos los nodos de una lista en orden, en bloques de hasta `tamanio_bloque`
+        diccionarios con la forma de obtener_pagina_de_nodos. Es el mismo CTE recursivo de
+        obtener_nodos_de_lista, pero leído con yield_per y sin crear objetos ORM, así que la
+        memoria usada no depende del tamaño de la lista.
+        """
+        lista = self.obtener_lista_por_id(lista_id)
+        if not lista:
+            return
+
+        recorrido = self._recorrido_de_lista(lista)
+        consulta = select(*_columnas_de_nodo_con_vuelo(recorrido.c.orden)).select_from(
+            recorrido.join(_nodos, _nodos.c.id == recorrido.c.id).outerjoin(_vuelos, _vuelos.c.id == _nodos.c.vuelo_id)
+        ).where(
+            recorrido.c.orden > 0  # Excluir el cabezon
+        ).order_by(recorrido.c.orden).execution_options(yield_per=tamanio_bloque)
+        for bloque in self.db.execute(consulta).partitions():
+            yield [_fila_a_nodo(fila) for fila in bloque]
+
+    def obtener_nodo_previo_a_clave(self, lista_id: int, posicion: int, hacia_atras: bool = False) -> Optional[int]:
+        """
+        Id del último nodo con clave de orden menor que `posicion` (o del primero con clave
+        mayor, con hacia_atras), con el índice (lista_id, posicion). Sirve para retomar una
+        página cuando el nodo en el que terminó la anterior ya fue extraído.
+        """
+        consulta = select(NodoDobleVuelos.id).where(
+            NodoDobleVuelos.lista_id == lista_id,
+            NodoDobleVuelos.centinela.is_(None)
+        )
+        if hacia_atras:
+            consulta = consulta.where(NodoDobleVuelos.posicion > posicion).order_by(NodoDobleVuelos.posicion)
+        else:
+            consulta = consulta.where(NodoDobleVuelos.posicion < posicion).order_by(NodoDobleVuelos.posicion.desc())
+        return self.db.execute(consulta.limit(1)).scalar()
+
+    def contar_nodos_antes_de_clave(self, lista_id: int, posicion: int) -> int:
+        """
+        Índice (0..n-1) que ocupa en la lista un nodo con clave de orden `posicion`: la cantidad
+        de nodos con clave menor, contada sobre el índice (lista_id, posicion)
+        """
+        return self.db.execute(
+            select(func.count()).select_from(NodoDobleVuelos).where(
+                NodoDobleVuelos.lista_id == lista_id,
+                NodoDobleVuelos.centinela.is_(None),
+                NodoDobleVuelos.posicion < posicion
+            )
+        ).scalar()
+
     def obtener_primer_nodo(self, lista_id: int) -> Optional[NodoDobleVuelos]:
         """Obtiene el primer nodo (después del cabezon) de la lista"""
         lista = self.obtener_lista_por_id(lista_id)
@@ -357,53 +883,77 @@ class ListaDobleEnlazadaCentinelasRepo:
         return None
 
     def reordenar_lista_por_prioridad(self, lista_id: int) -> bool:
-        """Reordena todos los nodos de la lista según prioridad y estado de emergencia"""
+        """
+        Reordena todos los nodos de la lista según prioridad y estado de emergencia.
+
+        Todo el trabajo ocurre en SQL sin cargar objetos ORM: una ventana
+        ROW_NUMBER/LAG/LEAD sobre los nodos de la lista unidos a sus vuelos calcula el
+        nuevo orden y los nuevos vecinos, un UPDATE ... FROM los aplica a todos los
+        nodos a la vez y otros dos UPDATE enlazan los centinelas.
+        """
         lista = self.obtener_lista_por_id(lista_id)
         if not lista:
             return False
             
         try:
-            # Obtener todos los nodos (excepto centinelas)
-            nodos = self.obtener_nodos_de_lista(lista_id)
-            if not nodos:
-                return True  # No hay nodos que reordenar
-                
-            # Obtener los nodos centinela
-            cabezon = self.db.query(NodoDobleVuelos).get(lista.cabezon_id)
-            colon = self.db.query(NodoDobleVuelos).get(lista.colon_id)
-            
-            # Obtener los vuelos asociados a los nodos
-            vuelos_con_nodos = []
-            for nodo in nodos:
-                vuelo = self.db.query(Vuelo).get(nodo.vuelo_id)
-                if vuelo:
-                    vuelos_con_nodos.append((vuelo, nodo))
-            
-            # Ordenar según criterios: emergencia > prioridad > hora_salida
-            vuelos_con_nodos.sort(key=lambda x: (
-                not x[0].emergencia,  # emergencias primero
-                -x[0].prioridad,      # mayor prioridad primero
-                x[0].hora_salida      # menor hora de salida primero
-            ))
-            
-            # Reordenar los enlaces de la lista
-            nodo_anterior = cabezon
-            posicion = 0
-            
-            for vuelo, nodo in vuelos_con_nodos:
-                # Actualizar posición
-                nodo.posicion = posicion
-                
-                # Actualizar enlaces
-                nodo_anterior.siguiente_id = nodo.id
-                nodo.anterior_id = nodo_anterior.id
-                
-                nodo_anterior = nodo
-                posicion += 1
+            nodos = NodoDobleVuelos.__table__
+            vuelos = Vuelo.__table__
+            recorrido = self._recorrido_de_lista(lista)
+            
+            # Criterios: emergencia > prioridad > hora_salida, ya codificados en la columna indexada
+            # vuelos.clave_orden; a igualdad se conserva el orden actual.
+            # Los nodos cuyo vuelo ya no existe quedan al final.
+            ventana = dict(order_by=[
+                vuelos.c.id.is_(None),
+                vuelos.c.clave_orden,
+                recorrido.c.orden
+            ])
+            ordenados = select(
+                recorrido.c.id.label("id"),
+                func.row_number().over(**ventana).label("orden"),
+                func.lag(recorrido.c.id).over(**ventana).label("anterior_id"),
+                func.lead(recorrido.c.id).over(**ventana).label("siguiente_id")
+            ).select_from(
+                recorrido.outerjoin(vuelos, vuelos.c.id == recorrido.c.vuelo_id)
+            ).where(
+                recorrido.c.orden > 0  # Excluir el cabezon
+            ).subquery("ordenados")
+            
+            # Nuevas posiciones y enlaces de todos los nodos regulares
+            self.db.execute(
+                update(nodos).where(
+                    nodos.c.id == ordenados.c.id
+                ).values(
+                    posicion=(ordenados.c.orden - 1) * ESPACIO_POSICIONES,
+                    anterior_id=func.coalesce(ordenados.c.anterior_id, lista.cabezon_id),
+                    siguiente_id=func.coalesce(ordenados.c.siguiente_id, lista.colon_id)
+                )
+            )
+            
+            # Enlazar los centinelas con el nuevo primer y último nodo
+            primero = select(nodos.c.id).where(
+                nodos.c.anterior_id == lista.cabezon_id,
+                nodos.c.centinela.is_(None),
+                nodos.c.activo == True
+            ).limit(1).scalar_subquery()
+            ultimo = select(nodos.c.id).where(
+                nodos.c.siguiente_id == lista.colon_id,
+                nodos.c.centinela.is_(None),
+                nodos.c.activo == True
+            ).limit(1).scalar_subquery()
+            self.db.execute(
+                update(nodos).where(nodos.c.id == lista.cabezon_id).values(
+                    siguiente_id=func.coalesce(primero, lista.colon_id)
+                )
+            )
+            self.db.execute(
+                update(nodos).where(nodos.c.id == lista.colon_id).values(
+                    anterior_id=func.coalesce(ultimo, lista.cabezon_id)
+                )
+            )
             
-            # Enlazar el último nodo con el colón
-            nodo_anterior.siguiente_id = colon.id
-            colon.anterior_id = nodo_anterior.id
+            # Con la lista ya ordenada, los últimos nodos por cubeta se recalculan en la próxima inserción ordenada
+            lista.ultimos_validos = False
             
             self.db.commit()
             return True
@@ -437,31 +987,12 @@ class ListaDobleEnlazadaCentinelasRepo:
             return True
             
         try:
-            # Obtener todos los nodos
-            nodos = self.obtener_nodos_de_lista(lista_id)
+            # Las posiciones recibidas son índices dentro de la lista
+            nodo_origen = self.obtener_nodo_en_posicion(lista_id, posicion_origen)
+            nodo_destino = self.obtener_nodo_en_posicion(lista_id, posicion_destino)
             
             # Verificar si las posiciones son válidas
-            if not nodos or posicion_origen >= len(nodos) or posicion_destino >= len(nodos):
-                return False
-                
-            # Encontrar el nodo en la posición origen
-            nodo_origen = None
-            for nodo in nodos:
-                if nodo.posicion == posicion_origen:
-                    nodo_origen = nodo
-                    break
-                    
-            if not nodo_origen:
-                return False
-                
-            # Encontrar el nodo en la posición destino
-            nodo_destino = None
-            for nodo in nodos:
-                if nodo.posicion == posicion_destino:
-                    nodo_destino = nodo
-                    break
-                    
-            if not nodo_destino:
+            if not nodo_origen or not nodo_destino:
                 return False
                 
             # Obtener los nodos adyacentes al nodo origen
@@ -495,8 +1026,14 @@ class ListaDobleEnlazadaCentinelasRepo:
                 nodo_destino.siguiente_id = nodo_origen.id
                 siguiente_destino.anterior_id = nodo_origen.id
             
-            # Actualizar todas las posiciones
-            self._actualizar_todas_posiciones(lista_id)
+            # Asignar al nodo movido una clave de orden entre sus nuevos vecinos
+            # (si hay que renumerar, el recorrido de la lista ya lo ve en su nuevo lugar)
+            nodo_origen.posicion = self._clave_entre(
+                lista,
+                self.db.query(NodoDobleVuelos).get(nodo_origen.anterior_id),
+                self.db.query(NodoDobleVuelos).get(nodo_origen.siguiente_id)
+            )
+            lista.ultimos_validos = False
             
             self.db.commit()
             return True
@@ -505,23 +1042,7 @@ class ListaDobleEnlazadaCentinelasRepo:
             self.db.rollback()
             raise e
 
-    def _actualizar_todas_posiciones(self, lista_id: int):
-        """Actualiza las posiciones de todos los nodos en la lista"""
-        lista = self.obtener_lista_por_id(lista_id)
-        if not lista:
-            return
-            
-        # Obtener el primer nodo (después del cabezon)
-        cabezon = self.db.query(NodoDobleVuelos).get(lista.cabezon_id)
-        nodo_actual = self.db.query(NodoDobleVuelos).get(cabezon.siguiente_id)
-        
-        # Si el primer nodo es el colon, no hay nodos que actualizar
-        if nodo_actual.id == lista.colon_id:
-            return
-            
-        # Actualizar las posiciones secuencialmente
-        posicion = 0
-        while nodo_actual and nodo_actual.id != lista.colon_id:
-            nodo_actual.posicion = posicion
-            posicion += 1
-            nodo_actual = self.db.query(NodoDobleVuelos).get(nodo_actual.siguiente_id)
+    def _rebalancear_posiciones(self, nodos: List[NodoDobleVuelos]):
+        """Vuelve a espaciar uniformemente las claves de orden de los nodos recibidos (ya ordenados)"""
+        for indice, nodo in enumerate(nodos):
+            nodo.posicion = indice * ESPACIO_POSICIONES
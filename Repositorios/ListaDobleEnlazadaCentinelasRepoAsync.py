@@ -0,0 +1,44 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from typing import Optional
+from Dominio.Modelos.Vuelo import Vuelo
+from Dominio.Modelos.ListaDobleEnlCent import ListaDobleEnlazadaCentinelas
+from Dominio.Modelos.NodoDobleVuelos import NodoDobleVuelos
+
+class ListaDobleEnlazadaCentinelasRepoAsync:
+    """Consultas de lectura de ListaDobleEnlazadaCentinelasRepo sobre una AsyncSession"""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        
+    async def obtener_id_de_lista(self, nombre: str) -> Optional[int]:
+        """Obtiene el id de una lista por su nombre"""
+        return await self.db.scalar(
+            select(ListaDobleEnlazadaCentinelas.id).where(ListaDobleEnlazadaCentinelas.nombre == nombre)
+        )
+        
+    async def obtener_tamanio(self, lista_id: int) -> int:
+        """Lee solo el contador de nodos de una lista"""
+        return await self.db.scalar(
+            select(ListaDobleEnlazadaCentinelas.tamanio).where(ListaDobleEnlazadaCentinelas.id == lista_id)
+        ) or 0
+        
+    async def obtener_vuelo_en_extremo(self, lista_id: int, centinela: str) -> Optional[Vuelo]:
+        """
+        Obtiene con una sola consulta el vuelo del nodo que está junto a un centinela:
+        el primero de la lista ("cabezon") o el último ("colon").
+        """
+        centinela_nodo = aliased(NodoDobleVuelos)
+        if centinela == "cabezon":
+            extremo = select(ListaDobleEnlazadaCentinelas.cabezon_id).where(ListaDobleEnlazadaCentinelas.id == lista_id)
+            vecino = select(centinela_nodo.siguiente_id).where(centinela_nodo.id == extremo.scalar_subquery())
+        else:
+            extremo = select(ListaDobleEnlazadaCentinelas.colon_id).where(ListaDobleEnlazadaCentinelas.id == lista_id)
+            vecino = select(centinela_nodo.anterior_id).where(centinela_nodo.id == extremo.scalar_subquery())
+            
+        # Si la lista está vacía, el vecino es el otro centinela, que no tiene vuelo
+        return await self.db.scalar(
+            select(Vuelo).join(NodoDobleVuelos, NodoDobleVuelos.vuelo_id == Vuelo.id).where(
+                NodoDobleVuelos.id == vecino.scalar_subquery()
+            )
+        )
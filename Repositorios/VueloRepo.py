@@ -1,13 +1,30 @@
+from datetime import datetime
+from sqlalchemy import func, literal, select, tuple_, union_all
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from Dominio.Modelos.Vuelo import Vuelo
+from Dominio.Modelos.ListaDobleEnlCent import ListaDobleEnlazadaCentinelas
 from sqlalchemy.exc import SQLAlchemyError
 
+# Columnas de VueloDTO, para las lecturas que no necesitan objetos ORM
+_FILAS_DE_VUELOS = select(
+    Vuelo.id,
+    Vuelo.numero_vuelo,
+    Vuelo.origen,
+    Vuelo.destino,
+    Vuelo.hora_salida,
+    Vuelo.hora_llegada,
+    Vuelo.prioridad,
+    Vuelo.estado,
+    Vuelo.emergencia
+)
+
 class VueloRepo:
     def __init__(self, db: Session):
         self.db = db
         
     def crear_vuelo(self, vuelo: Vuelo) -> Vuelo:
+        vuelo.actualizar_clave_orden()
         try:
             self.db.add(vuelo)
             self.db.commit()
@@ -20,8 +37,41 @@ class VueloRepo:
     def obtener_vuelos(self) -> List[Vuelo]:
         return self.db.query(Vuelo).all()
         
+    def obtener_filas_de_vuelos(self) -> List[dict]:
+        """Obtiene todos los vuelos como diccionarios con los campos de VueloDTO, sin crear objetos ORM"""
+        return self._filas(self.db.execute(_FILAS_DE_VUELOS))
+        
+    def obtener_pagina_de_vuelos(self, limite: int, hora_salida: Optional[datetime] = None,
+                                 vuelo_id: Optional[int] = None) -> List[dict]:
+        """
+        Obtiene hasta `limite` vuelos en orden de (hora_salida, id), empezando después de la
+        clave recibida (o desde el principio sin ella). Es un rango del índice
+        ix_vuelos_hora_salida_id, así que el costo no depende de cuántas páginas se saltaron.
+        """
+        consulta = _FILAS_DE_VUELOS.order_by(Vuelo.hora_salida, Vuelo.id).limit(limite)
+        if hora_salida is not None:
+            consulta = consulta.where(tuple_(Vuelo.hora_salida, Vuelo.id) > tuple_(hora_salida, vuelo_id))
+        return self._filas(self.db.execute(consulta))
+        
+    def iterar_bloques_de_vuelos(self, tamanio_bloque: int) -> Iterator[List[dict]]:
+        """
+        Recorre todos los vuelos, en el mismo orden que obtener_filas_de_vuelos, en bloques de
+        hasta `tamanio_bloque` diccionarios. Con yield_per el resultado se lee de a un bloque,
+        así que la memoria usada no depende de la cantidad de vuelos.
+        """
+        resultado = self.db.execute(_FILAS_DE_VUELOS.execution_options(yield_per=tamanio_bloque))
+        campos = tuple(resultado.keys())
+        for bloque in resultado.partitions():
+            yield [dict(zip(campos, fila)) for fila in bloque]
+        
+    @staticmethod
+    def _filas(resultado) -> List[dict]:
+        campos = tuple(resultado.keys())
+        return [dict(zip(campos, fila)) for fila in resultado]
+        
     def obtener_vuelo_por_id(self, vuelo_id: int) -> Optional[Vuelo]:
-        return self.db.query(Vuelo).filter(Vuelo.id == vuelo_id).first()
+        # Session.get no consulta si el vuelo ya está en el mapa de identidad de la sesión
+        return self.db.get(Vuelo, vuelo_id)
         
     def obtener_vuelo_por_numero(self, numero_vuelo: str) -> Optional[Vuelo]:
         return self.db.query(Vuelo).filter(Vuelo.numero_vuelo == numero_vuelo).first()
@@ -34,6 +84,16 @@ class VueloRepo:
         for key, value in vuelo_data.items():
             setattr(vuelo, key, value)
             
+        # Mantener la clave de orden si cambió la prioridad, la emergencia o la hora de salida
+        if {"prioridad", "emergencia", "hora_salida"} & vuelo_data.keys():
+            vuelo.actualizar_clave_orden()
+            # Si el vuelo está en una lista puede cambiar de cubeta de prioridad: solo esa lista
+            # deja de tener vigentes sus últimos nodos por cubeta
+            if vuelo.lista_item is not None:
+                self.db.query(ListaDobleEnlazadaCentinelas).filter(
+                    ListaDobleEnlazadaCentinelas.id == vuelo.lista_item.lista_id
+                ).update({ListaDobleEnlazadaCentinelas.ultimos_validos: False})
+            
         try:
             self.db.commit()
             self.db.refresh(vuelo)
@@ -42,6 +102,22 @@ class VueloRepo:
             self.db.rollback()
             raise e
             
+    def contar_vuelos_por_estado(self) -> List[tuple]:
+        """
+        (estado, vuelos, emergencias) de cada estado, incluido None, en una sola consulta.
+        Cada estado se cuenta sobre su rango del índice ix_vuelos_estado_emergencia, sin leer
+        la tabla de vuelos ni ordenarla para agruparla.
+        """
+        conteos = [
+            select(
+                literal(estado, Vuelo.estado.type).label("estado"),
+                func.count(),
+                func.count().filter(Vuelo.emergencia.is_(True))
+            ).where(Vuelo.estado.is_(None) if estado is None else Vuelo.estado == estado)
+            for estado in (*Vuelo.estado.type.enums, None)
+        ]
+        return self.db.execute(union_all(*conteos)).all()
+            
     def vuelo_esta_en_lista(self, vuelo_id: int) -> bool:
         """Verifica si un vuelo está asociado a un nodo en la lista doble"""
         vuelo = self.obtener_vuelo_por_id(vuelo_id)
@@ -0,0 +1,16 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from Dominio.Modelos.Vuelo import Vuelo
+from Repositorios.VueloRepo import _FILAS_DE_VUELOS, VueloRepo
+
+class VueloRepoAsync:
+    """Consultas de lectura de VueloRepo sobre una AsyncSession"""
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        
+    async def obtener_filas_de_vuelos(self) -> List[dict]:
+        """Obtiene todos los vuelos como diccionarios con los campos de VueloDTO, sin crear objetos ORM"""
+        return VueloRepo._filas(await self.db.execute(_FILAS_DE_VUELOS))
+        
+    async def obtener_vuelo_por_id(self, vuelo_id: int) -> Optional[Vuelo]:
+        return await self.db.get(Vuelo, vuelo_id)
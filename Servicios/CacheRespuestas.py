@@ -0,0 +1,88 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, Optional
+from Config.cache import CACHE_MAX_ENTRADAS, CACHE_TTL_SEGUNDOS
+from Servicios.VersionesDatos import versiones_datos
+
+class CacheRespuestas:
+    """
+    Caché LRU con TTL de respuestas ya serializadas, local al proceso.
+
+    Cada entrada guarda el recurso de VersionesDatos del que depende y el ETag de la versión
+    con la que se calculó. Solo se entrega mientras ese ETag sigue siendo el actual, así que
+    una respuesta calculada mientras otro hilo modificaba los datos nunca se sirve como
+    vigente. Además, al incrementarse la versión de un recurso se descartan en el momento
+    sus entradas (VersionesDatos.suscribir), para no ocupar lugar con respuestas viejas.
+
+    Los contadores (aciertos, fallos, expulsiones por tamaño e invalidaciones) sirven para
+    dimensionar max_entradas y ttl_segundos.
+    """
+    def __init__(self, max_entradas: int = CACHE_MAX_ENTRADAS, ttl_segundos: float = CACHE_TTL_SEGUNDOS):
+        self.max_entradas = max_entradas
+        self.ttl_segundos = ttl_segundos
+        self._bloqueo = threading.Lock()
+        # clave -> (recurso, etag, cuerpo, instante en que vence)
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self.invalidaciones = 0
+
+    @property
+    def activa(self) -> bool:
+        return self.max_entradas > 0 and self.ttl_segundos > 0
+
+    def obtener(self, clave: Hashable, etag: str) -> Optional[bytes]:
+        """Cuerpo guardado para la clave si se calculó con la versión `etag` y no venció"""
+        with self._bloqueo:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada[1] == etag and entrada[3] > time.monotonic():
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return entrada[2]
+            if entrada is not None:
+                del self._entradas[clave]
+            self.fallos += 1
+            return None
+
+    def guardar(self, clave: Hashable, recurso: str, etag: str, cuerpo: bytes):
+        """Guarda el cuerpo calculado con la versión `etag` del recurso, expulsando el menos usado si no cabe"""
+        if not self.activa:
+            return
+        with self._bloqueo:
+            self._entradas[clave] = (recurso, etag, cuerpo, time.monotonic() + self.ttl_segundos)
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+                self.expulsiones += 1
+
+    def invalidar(self, recurso: str):
+        """Descarta las entradas que dependen del recurso"""
+        with self._bloqueo:
+            claves = [clave for clave, entrada in self._entradas.items() if entrada[0] == recurso]
+            for clave in claves:
+                del self._entradas[clave]
+            self.invalidaciones += len(claves)
+
+    def vaciar(self):
+        with self._bloqueo:
+            self._entradas.clear()
+
+    def estadisticas(self) -> dict:
+        with self._bloqueo:
+            consultas = self.aciertos + self.fallos
+            return {
+                "entradas": len(self._entradas),
+                "max_entradas": self.max_entradas,
+                "ttl_segundos": self.ttl_segundos,
+                "aciertos": self.aciertos,
+                "fallos": self.fallos,
+                "tasa_aciertos": self.aciertos / consultas if consultas else 0.0,
+                "expulsiones": self.expulsiones,
+                "invalidaciones": self.invalidaciones,
+            }
+
+# Caché compartida por todas las rutas del proceso; se invalida con cada cambio de versión
+cache_respuestas = CacheRespuestas()
+versiones_datos.suscribir(cache_respuestas.invalidar)
@@ -0,0 +1,29 @@
+import base64
+import json
+from typing import Any, Dict
+
+# Tamaño de página por defecto y máximo de las rutas paginadas
+LIMITE_PAGINA_POR_DEFECTO = 50
+LIMITE_PAGINA_MAXIMO = 500
+
+def codificar_cursor(clave: Dict[str, Any]) -> str:
+    """
+    Convierte la clave en la que terminó una página en un cursor opaco para el cliente
+    (JSON en base64 apto para URL, sin relleno). Los valores deben ser serializables a JSON.
+    """
+    texto = json.dumps(clave, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(texto).rstrip(b"=").decode("ascii")
+
+def decodificar_cursor(cursor: str, campos: tuple) -> Dict[str, Any]:
+    """
+    Recupera la clave guardada en un cursor. Lanza ValueError si el cursor no es uno
+    generado por codificar_cursor o le falta alguno de los campos esperados.
+    """
+    try:
+        relleno = "=" * (-len(cursor) % 4)
+        clave = json.loads(base64.urlsafe_b64decode(cursor + relleno))
+    except (ValueError, TypeError):
+        raise ValueError("Cursor inválido")
+    if not isinstance(clave, dict) or any(campo not in clave for campo in campos):
+        raise ValueError("Cursor inválido")
+    return clave
@@ -0,0 +1,172 @@
+import threading
+from bisect import bisect_right
+from typing import List, Optional, Tuple
+from Dominio.Estructuras.MotorLista import crear_lista_vuelos
+from Dominio.Modelos.Vuelo import Vuelo
+from Presentacion.DTOs.ListaDobleEnlazadaCentinelasDTO import ListaDobleEnlazadaCentinelasDTO
+from Presentacion.DTOs.VueloDTO import VueloDTO
+
+def clave_de_orden(vuelo) -> str:
+    """Clave con la que se ordena la cola, la misma que se persiste en vuelos.clave_orden"""
+    return Vuelo.calcular_clave_orden(vuelo.emergencia, vuelo.prioridad, vuelo.hora_salida)
+
+class VueloEnLista:
+    """Elemento guardado en el espejo: el id del nodo persistido y su vuelo"""
+    __slots__ = 'nodo_id', 'vuelo'
+    def __init__(self, nodo_id: int, vuelo: VueloDTO):
+        self.nodo_id = nodo_id
+        self.vuelo = vuelo
+
+    # Atributos que usa el TDA para ordenar y buscar vuelos
+    @property
+    def id(self):
+        return self.vuelo.id
+
+    @property
+    def emergencia(self):
+        return self.vuelo.emergencia
+
+    @property
+    def prioridad(self):
+        return self.vuelo.prioridad
+
+    @property
+    def hora_salida(self):
+        return self.vuelo.hora_salida
+
+class EspejoListaPrincipal:
+    """
+    Copia en memoria de la lista principal, respaldada por el TDA de Dominio/Estructuras.
+
+    Se reconstruye desde la base de datos al arrancar (o en el primer uso) y el servicio
+    le aplica cada mutación después de escribirla en la base de datos (write-through),
+    de modo que las lecturas no necesitan consultar SQLite. El espejo es local al
+    proceso: con varios procesos escribiendo sobre la misma base cada uno ve solo sus
+    propios cambios hasta que se recarga.
+
+    Los metadatos de la lista (id, nombre y centinelas) se resuelven una sola vez por
+    proceso con `fijar_lista` y sobreviven a `invalidar`, porque solo cambian si la
+    lista se vuelve a crear.
+
+    Además del TDA se mantiene `_claves`, la clave de orden de cada vuelo en el mismo
+    orden que la lista, para ubicar por búsqueda binaria dónde va un vuelo nuevo, y
+    `ordenada`, que indica si esas claves siguen en orden. Cada mutación lo comprueba
+    solo contra los vecinos del elemento que cambia; una vez desordenada, la lista
+    vuelve a considerarse ordenada cuando se recarga.
+
+    Las mutaciones deben hacerse con `bloqueo` tomado durante la escritura en la base
+    de datos y la actualización del espejo, para que ambas se apliquen en el mismo orden.
+    """
+    def __init__(self):
+        self.bloqueo = threading.RLock()
+        self.lista_id = None
+        self.nombre = None
+        self.cabezon_id = None
+        self.colon_id = None
+        self._lista = None
+        self._claves = []
+        self.ordenada = True
+
+    @property
+    def cargado(self) -> bool:
+        return self._lista is not None
+
+    def fijar_lista(self, lista: ListaDobleEnlazadaCentinelasDTO):
+        """Guarda los metadatos de la lista principal; si es otra lista se descarta el contenido"""
+        if lista.id != self.lista_id:
+            self.invalidar()
+        self.lista_id = lista.id
+        self.nombre = lista.nombre
+        self.cabezon_id = lista.cabezon_id
+        self.colon_id = lista.colon_id
+
+    def cargar(self, elementos: List[Tuple[int, VueloDTO]]):
+        """Reemplaza el contenido del espejo por los (nodo_id, vuelo) recibidos, en orden (tras fijar_lista)"""
+        nueva = crear_lista_vuelos()
+        claves = []
+        for nodo_id, vuelo in elementos:
+            nueva.insertar_al_final(VueloEnLista(nodo_id, vuelo))
+            claves.append(clave_de_orden(vuelo))
+        self._lista = nueva
+        self._claves = claves
+        self.ordenada = all(anterior <= siguiente for anterior, siguiente in zip(claves, claves[1:]))
+
+    def invalidar(self):
+        """Descarta el contenido para que se vuelva a cargar desde la base de datos"""
+        self._lista = None
+        self._claves = []
+        self.ordenada = True
+
+    def __len__(self):
+        return len(self._lista)
+
+    def __iter__(self):
+        return iter(self._lista)
+
+    def primero(self) -> Optional[VueloEnLista]:
+        return self._lista.obtener_primero()
+
+    def ultimo(self) -> Optional[VueloEnLista]:
+        return self._lista.obtener_ultimo()
+
+    def en_posicion(self, posicion: int) -> Optional[VueloEnLista]:
+        return self._lista.obtener_en_posicion(posicion)
+
+    def posicion_ordenada(self, vuelo) -> int:
+        """
+        Posición en la que debe insertarse un vuelo para respetar el orden de la cola,
+        detrás de los vuelos con la misma clave. Búsqueda binaria sobre `_claves`: solo
+        tiene sentido mientras `ordenada` sea True.
+        """
+        return bisect_right(self._claves, clave_de_orden(vuelo))
+
+    def insertar(self, posicion: int, nodo_id: int, vuelo: VueloDTO):
+        """Inserta un nodo en la misma posición (índice denso) en la que quedó en la base de datos"""
+        posicion = min(max(posicion, 0), len(self._lista))
+        self._lista.insertar_en_posicion(VueloEnLista(nodo_id, vuelo), posicion)
+        self._claves.insert(posicion, clave_de_orden(vuelo))
+        self._comprobar_orden(posicion)
+
+    def extraer(self, posicion: int) -> Optional[VueloEnLista]:
+        elemento = self._lista.extraer_de_posicion(posicion)
+        if elemento:
+            del self._claves[posicion]
+        return elemento
+
+    def mover(self, posicion_origen: int, posicion_destino: int):
+        """
+        Mueve un nodo para que termine en posicion_destino, igual que
+        ListaDobleEnlazadaCentinelasRepo.mover_nodo_entre_posiciones.
+        """
+        elemento = self._lista.extraer_de_posicion(posicion_origen)
+        self._lista.insertar_en_posicion(elemento, posicion_destino)
+        self._claves.insert(posicion_destino, self._claves.pop(posicion_origen))
+        self._comprobar_orden(posicion_destino)
+
+    def actualizar_vuelo(self, vuelo: VueloDTO) -> bool:
+        """
+        Reemplaza los datos del vuelo si está en la lista; devuelve si estaba. El elemento se
+        ubica por el índice de ids del TDA y su posición solo se busca si cambió su clave de orden.
+        """
+        elemento = self._lista.obtener_por_id(vuelo.id)
+        if elemento is None:
+            return False
+        clave = clave_de_orden(vuelo)
+        clave_anterior = clave_de_orden(elemento.vuelo)
+        elemento.vuelo = vuelo
+        if clave != clave_anterior:
+            posicion = self._lista.posicion_de_id(vuelo.id)
+            self._claves[posicion] = clave
+            self._comprobar_orden(posicion)
+        return True
+
+    def _comprobar_orden(self, posicion: int):
+        """Marca la lista como desordenada si la clave de `posicion` no queda entre las de sus vecinos"""
+        clave = self._claves[posicion]
+        if posicion > 0 and self._claves[posicion - 1] > clave:
+            self.ordenada = False
+        elif posicion + 1 < len(self._claves) and clave > self._claves[posicion + 1]:
+            self.ordenada = False
+
+# Espejo compartido por todas las instancias del servicio dentro del proceso
+espejo_lista_principal = EspejoListaPrincipal()
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+from typing import Optional
+
+# Eventos que una suscripción acumula sin leer antes de considerarse atrasada
+MAX_EVENTOS_PENDIENTES = 1000
+
+# Evento que reemplaza a los pendientes de una suscripción atrasada: el cliente debe volver
+# a leer la lista completa
+EVENTO_RECARGAR = "recargar"
+
+class SuscripcionEventos:
+    """
+    Cola de eventos de un cliente conectado, atada al event loop que la lee. Los servicios
+    publican desde los hilos del threadpool, así que los eventos se encolan con
+    call_soon_threadsafe. Si el cliente no lee y se acumulan más de `max_pendientes`, se
+    descartan y queda un único evento EVENTO_RECARGAR.
+    """
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pendientes: int = MAX_EVENTOS_PENDIENTES):
+        self._loop = loop
+        self._cola = asyncio.Queue()
+        self._max_pendientes = max_pendientes
+
+    def entregar(self, evento: dict):
+        """Encola el evento; se puede llamar desde cualquier hilo"""
+        try:
+            self._loop.call_soon_threadsafe(self._encolar, evento)
+        except RuntimeError:
+            pass  # El loop ya se cerró: la conexión terminó
+
+    def _encolar(self, evento: dict):
+        if self._cola.qsize() >= self._max_pendientes:
+            while not self._cola.empty():
+                self._cola.get_nowait()
+            evento = {"tipo": EVENTO_RECARGAR}
+        self._cola.put_nowait(evento)
+
+    async def siguiente(self, espera: float) -> Optional[dict]:
+        """Próximo evento, o None si no llega ninguno en `espera` segundos"""
+        try:
+            return await asyncio.wait_for(self._cola.get(), espera)
+        except asyncio.TimeoutError:
+            return None
+
+class EventosDatos:
+    """
+    Gancho de publicación de los servicios: cada mutación de la lista principal o de los
+    vuelos publica un evento compacto (un dict con "tipo" y los datos para aplicar el cambio
+    sobre una copia local), que se reparte entre las suscripciones abiertas por
+    GET /lista/eventos. Los servicios publican después de que el cambio queda visible y,
+    en los eventos de la lista, con el bloqueo del espejo tomado, así que los eventos salen
+    en el mismo orden en que se aplicaron los cambios.
+
+    Igual que las versiones, los eventos son locales al proceso.
+    """
+    def __init__(self):
+        self._bloqueo = threading.Lock()
+        self._suscripciones = set()
+
+    def suscribir(self, suscripcion: SuscripcionEventos):
+        """Registra una suscripción (o cualquier objeto con `entregar(evento)`)"""
+        with self._bloqueo:
+            self._suscripciones.add(suscripcion)
+
+    def cancelar(self, suscripcion: SuscripcionEventos):
+        with self._bloqueo:
+            self._suscripciones.discard(suscripcion)
+
+    def publicar(self, tipo: str, **datos):
+        """Reparte el evento `tipo` entre las suscripciones abiertas"""
+        with self._bloqueo:
+            suscripciones = list(self._suscripciones)
+        if not suscripciones:
+            return
+        evento = {"tipo": tipo, **datos}
+        for suscripcion in suscripciones:
+            suscripcion.entregar(evento)
+
+# Publicador compartido por todos los servicios dentro del proceso
+eventos_datos = EventosDatos()
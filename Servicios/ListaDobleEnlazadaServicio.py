@@ -1,5 +1,6 @@
+from contextlib import contextmanager
 from sqlalchemy.orm import Session
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 from Repositorios.ListaDobleEnlazadaCentinelasRepo import ListaDobleEnlazadaCentinelasRepo
 from Repositorios.VueloRepo import VueloRepo
 from Dominio.Modelos.NodoDobleVuelos import NodoDobleVuelos
@@ -8,20 +9,101 @@ from Presentacion.DTOs.ListaDobleEnlazadaCentinelasDTO import ListaDobleEnlazada
 from Presentacion.DTOs.NodoDobleVueloDTO import NodoDobleVueloDTO
 from Presentacion.DTOs.VueloDTO import VueloDTO
 from Servicios.VueloServicio import VueloServicio
+from Servicios.CursorPaginacion import codificar_cursor, decodificar_cursor
+from Servicios.EspejoListaPrincipal import EspejoListaPrincipal, espejo_lista_principal
+from Servicios.EventosDatos import EVENTO_RECARGAR, eventos_datos
+from Servicios.RegistroCambios import registro_cambios_lista
+from Servicios.VersionesDatos import recurso_lista, versiones_datos
 
 class ListaDobleEnlazadaServicio:
     def __init__(self, db: Session):
         self.lista_repo = ListaDobleEnlazadaCentinelasRepo(db)
         self.vuelo_repo = VueloRepo(db)
         self.vuelo_servicio = VueloServicio(db)
+        self.espejo = espejo_lista_principal
         self.db = db
         
+    def cargar_espejo(self):
+        """Reconstruye desde la base de datos la copia en memoria de la lista principal"""
+        with self.espejo.bloqueo:
+            nodos = self.lista_repo.obtener_nodos_de_lista(self._id_lista_principal(), cargar_vuelos=True)
+            self.espejo.cargar([
+                (nodo.id, self.vuelo_servicio._vuelo_a_dto(nodo.vuelo)) for nodo in nodos
+            ])
+            
+    def _obtener_espejo(self) -> EspejoListaPrincipal:
+        """Devuelve el espejo de la lista principal, cargándolo si todavía no existe"""
+        if not self.espejo.cargado:
+            self.cargar_espejo()
+        return self.espejo
+        
+    def _id_lista_principal(self) -> int:
+        """Id de la lista principal, que se resuelve contra la base de datos una sola vez por proceso"""
+        if self.espejo.lista_id is None:
+            self.obtener_o_crear_lista_principal()
+        return self.espejo.lista_id
+        
+    @contextmanager
+    def _mutando_espejo(self):
+        """
+        Bloquea el espejo mientras se escribe en la base de datos y se aplica el mismo cambio
+        en memoria. Si algo falla a mitad de camino el espejo se descarta y se recarga en el
+        siguiente uso, así nunca queda desincronizado con la base de datos.
+        """
+        with self.espejo.bloqueo:
+            espejo = self._obtener_espejo()
+            try:
+                yield espejo
+            except Exception:
+                espejo.invalidar()
+                # La base de datos pudo cambiar antes del error
+                self._marcar_cambio(EVENTO_RECARGAR)
+                raise
+        
+    def _marcar_cambio(self, tipo: str, **datos):
+        """
+        Registra un cambio en la lista principal, ya visible en la base de datos y en el espejo,
+        y lo publica como evento `tipo` con la nueva versión de la lista (GET /lista/eventos)
+        """
+        recurso = recurso_lista(self.espejo.lista_id)
+        versiones_datos.incrementar(recurso)
+        eventos_datos.publicar(tipo, lista_id=self.espejo.lista_id, version=versiones_datos.version(recurso), **datos)
+        
+    def recurso_de_lista(self) -> str:
+        """Recurso de VersionesDatos con la versión de la lista principal (ETag y caché de sus lecturas)"""
+        return recurso_lista(self._id_lista_principal())
+        
+    def obtener_cambios_desde(self, desde_version: int, epoca: Optional[str] = None) -> dict:
+        """
+        Cambios de la lista principal posteriores a `desde_version` (la versión del ETag de la
+        copia que tiene el cliente), con la versión en la que queda. Si el registro ya no los
+        tiene todos, o la versión es de otra época (un arranque anterior del proceso), se
+        devuelve recargar=True y ningún cambio.
+        """
+        lista_id = self._id_lista_principal()
+        # Con el bloqueo del espejo la versión y el registro no pueden estar a mitad de un cambio
+        with self.espejo.bloqueo:
+            version = versiones_datos.version(recurso_lista(lista_id))
+            cambios = None
+            if epoca is None or epoca == versiones_datos.epoca:
+                cambios = registro_cambios_lista.desde(lista_id, desde_version, version)
+        return {
+            "lista_id": lista_id,
+            "epoca": versiones_datos.epoca,
+            "version": version,
+            "recargar": cambios is None,
+            "cambios": cambios or []
+        }
+        
     def obtener_o_crear_lista_principal(self) -> ListaDobleEnlazadaCentinelasDTO:
-        """Obtiene la lista principal o la crea si no existe"""
+        """Obtiene la lista principal o la crea si no existe, y guarda sus metadatos en el espejo"""
         lista = self.lista_repo.obtener_lista_por_nombre("principal")
         if not lista:
             lista = self.lista_repo.crear_lista("principal")
-        return self._lista_a_dto(lista)
+        lista_dto = self._lista_a_dto(lista)
+        with self.espejo.bloqueo:
+            self.espejo.fijar_lista(lista_dto)
+        return lista_dto
         
     def obtener_lista_por_id(self, lista_id: int) -> Optional[ListaDobleEnlazadaCentinelasDTO]:
         """Obtiene una lista por su ID"""
@@ -36,148 +118,229 @@ class ListaDobleEnlazadaServicio:
         return [self._lista_a_dto(lista) for lista in listas]
         
     def obtener_lista_con_nodos(self) -> Optional[ListaConNodosDTO]:
-        """Obtiene la lista principal con todos sus nodos"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
+        """Obtiene la lista principal con todos sus nodos (desde el espejo en memoria)"""
+        with self.espejo.bloqueo:
+            espejo = self._obtener_espejo()
+            elementos = list(espejo)
+            
+            # Los enlaces de cada nodo son sus vecinos en el espejo, o los centinelas en los extremos
+            enlaces = [espejo.cabezon_id] + [elemento.nodo_id for elemento in elementos] + [espejo.colon_id]
+            
+            # Crear el DTO completo con los nodos
+            lista_con_nodos = ListaConNodosDTO(
+                id=espejo.lista_id,
+                nombre=espejo.nombre,
+                tamanio=len(elementos),
+                cabezon_id=espejo.cabezon_id,
+                colon_id=espejo.colon_id,
+                nodos=[
+                    NodoDobleVueloDTO(
+                        id=elemento.nodo_id,
+                        vuelo=elemento.vuelo,
+                        posicion=posicion,
+                        lista_id=espejo.lista_id,
+                        anterior_id=enlaces[posicion],
+                        siguiente_id=enlaces[posicion + 2]
+                    )
+                    for posicion, elemento in enumerate(elementos)
+                ]
+            )
+            
+        return lista_con_nodos
         
-        # Obtenemos los nodos de la lista
-        nodos = self.lista_repo.obtener_nodos_de_lista(lista_dto.id)
+    def obtener_lista_con_nodos_plana(self) -> dict:
+        """
+        Obtiene la lista principal con todos sus nodos como diccionarios con la forma de
+        ListaConNodosDTO. Los vuelos del espejo ya son DTOs validados, así que se toman
+        sus campos tal cual en lugar de construir y validar un DTO por nodo.
+        """
+        with self.espejo.bloqueo:
+            espejo = self._obtener_espejo()
+            elementos = list(espejo)
+            enlaces = [espejo.cabezon_id] + [elemento.nodo_id for elemento in elementos] + [espejo.colon_id]
+            
+            return {
+                "id": espejo.lista_id,
+                "nombre": espejo.nombre,
+                "tamanio": len(elementos),
+                "cabezon_id": espejo.cabezon_id,
+                "colon_id": espejo.colon_id,
+                "nodos": [
+                    {
+                        "id": elemento.nodo_id,
+                        "vuelo": elemento.vuelo.__dict__,
+                        "posicion": posicion,
+                        "lista_id": espejo.lista_id,
+                        "anterior_id": enlaces[posicion],
+                        "siguiente_id": enlaces[posicion + 2]
+                    }
+                    for posicion, elemento in enumerate(elementos)
+                ]
+            }
         
-        # Crear el DTO completo con los nodos
-        lista_con_nodos = ListaConNodosDTO(
-            id=lista_dto.id,
-            nombre=lista_dto.nombre,
-            tamanio=lista_dto.tamanio,
-            cabezon_id=lista_dto.cabezon_id,
-            colon_id=lista_dto.colon_id,
-            nodos=[self._nodo_a_dto(nodo) for nodo in nodos]
-        )
+    def iterar_nodos_planos(self, tamanio_bloque: int) -> Iterator[List[dict]]:
+        """
+        Recorre los nodos de la lista principal en bloques de diccionarios con la forma de
+        NodoDobleVueloDTO, leídos de la base de datos a medida que se consumen (no del espejo,
+        que obligaría a copiar la lista entera bajo el bloqueo).
+        """
+        lista_id = self._id_lista_principal()
+        posicion = 0
+        for bloque in self.lista_repo.iterar_bloques_de_nodos(lista_id, tamanio_bloque):
+            for nodo in bloque:
+                nodo["posicion"] = posicion
+                nodo["lista_id"] = lista_id
+                posicion += 1
+            yield bloque
         
-        return lista_con_nodos
+    def obtener_pagina_de_lista(self, limite: int, cursor: Optional[str] = None,
+                                direccion: str = "adelante") -> dict:
+        """
+        Obtiene una página de la lista principal con la forma de PaginaNodosDTO, leída de la
+        base de datos siguiendo los enlaces: la primera desde el cabezon ("adelante") o desde
+        el colon ("atras") y las siguientes desde el nodo en el que terminó la anterior, que
+        viaja en el cursor junto con la dirección. Lanza ValueError si el cursor no es válido.
+
+        La posición de cada nodo se cuenta desde el extremo en el que empezó el recorrido; si
+        la lista cambia entre dos páginas, las posiciones de las siguientes pueden desfasarse.
+        """
+        lista_id = self._id_lista_principal()
+        if cursor:
+            clave = decodificar_cursor(cursor, ("nodo_id", "clave", "indice", "direccion"))
+            try:
+                desde_id, indice = int(clave["nodo_id"]), int(clave["indice"])
+                clave_desde = int(clave["clave"]) if clave["clave"] is not None else None
+            except (TypeError, ValueError):
+                raise ValueError("Cursor inválido")
+            direccion = clave["direccion"]
+        else:
+            desde_id = clave_desde = None
+        if direccion not in ("adelante", "atras"):
+            raise ValueError("Cursor inválido")
+        hacia_atras = direccion == "atras"
+        
+        if desde_id is None:
+            desde_id = self.espejo.colon_id if hacia_atras else self.espejo.cabezon_id
+            indice = self.lista_repo.obtener_tamanio(lista_id) if hacia_atras else -1
+        
+        # Se pide un nodo de más para saber si hay otra página
+        nodos = self.lista_repo.obtener_pagina_de_nodos(lista_id, desde_id, limite + 1, hacia_atras)
+        if nodos is None and clave_desde is not None:
+            # El nodo del cursor fue extraído: retomar desde su vecino por clave de orden
+            desde_id = self.lista_repo.obtener_nodo_previo_a_clave(lista_id, clave_desde, hacia_atras)
+            if desde_id is None:
+                desde_id = self.espejo.colon_id if hacia_atras else self.espejo.cabezon_id
+            nodos = self.lista_repo.obtener_pagina_de_nodos(lista_id, desde_id, limite + 1, hacia_atras)
+        nodos = nodos or []
+        
+        hay_mas = len(nodos) > limite
+        del nodos[limite:]
+
+        # La clave de orden dispersa solo viaja en el cursor; la API expone el índice denso
+        paso = -1 if hacia_atras else 1
+        clave_ultimo = None
+        for nodo in nodos:
+            indice += paso
+            clave_ultimo = nodo["posicion"]
+            nodo["posicion"] = indice
+            nodo["lista_id"] = lista_id
+
+        siguiente_cursor = None
+        if hay_mas:
+            siguiente_cursor = codificar_cursor({
+                "nodo_id": nodos[-1]["id"],
+                "clave": clave_ultimo,
+                "indice": indice,
+                "direccion": direccion
+            })
+        return {"lista_id": lista_id, "direccion": direccion, "nodos": nodos, "siguiente_cursor": siguiente_cursor}
         
     def insertar_vuelo_al_frente(self, vuelo_id: int) -> Optional[NodoDobleVueloDTO]:
         """Inserta un vuelo al principio de la lista principal"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        # Insertamos el vuelo al frente
-        nodo = self.lista_repo.insertar_nodo_al_frente(lista_dto.id, vuelo_id)
-        if not nodo:
-            return None
-        return self._nodo_a_dto(nodo)
+        with self._mutando_espejo() as espejo:
+            # Insertamos el vuelo al frente
+            nodo = self.lista_repo.insertar_nodo_al_frente(espejo.lista_id, vuelo_id)
+            if not nodo:
+                return None
+            return self._aplicar_insercion(espejo, nodo, 0)
         
     def insertar_vuelo_al_final(self, vuelo_id: int) -> Optional[NodoDobleVueloDTO]:
         """Inserta un vuelo al final de la lista principal"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        # Insertamos el vuelo al final
-        nodo = self.lista_repo.insertar_nodo_al_final(lista_dto.id, vuelo_id)
-        if not nodo:
-            return None
-        return self._nodo_a_dto(nodo)
+        with self._mutando_espejo() as espejo:
+            # Insertamos el vuelo al final
+            nodo = self.lista_repo.insertar_nodo_al_final(espejo.lista_id, vuelo_id)
+            if not nodo:
+                return None
+            return self._aplicar_insercion(espejo, nodo, len(espejo))
         
     def extraer_vuelo_de_posicion(self, posicion: int) -> Optional[VueloDTO]:
         """Extrae un vuelo de una posición específica de la lista principal"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        # Obtener todos los nodos
-        nodos = self.lista_repo.obtener_nodos_de_lista(lista_dto.id)
-        
-        # Buscar el nodo en la posición indicada
-        nodo_a_extraer = None
-        for nodo in nodos:
-            if nodo.posicion == posicion:
-                nodo_a_extraer = nodo
-                break
+        with self._mutando_espejo() as espejo:
+            # Buscar en el espejo el nodo en la posición indicada
+            elemento = espejo.en_posicion(posicion)
+            if not elemento:
+                return None
                 
-        if not nodo_a_extraer:
-            return None
-            
-        # Extraer el nodo
-        nodo_extraido, exito = self.lista_repo.extraer_nodo(nodo_a_extraer.id)
-        if not exito or not nodo_extraido:
-            return None
-            
-        # Obtener y devolver el vuelo
-        vuelo = self.vuelo_repo.obtener_vuelo_por_id(nodo_extraido.vuelo_id)
-        if not vuelo:
-            return None
-            
-        return VueloDTO(
-            id=vuelo.id,
-            numero_vuelo=vuelo.numero_vuelo,
-            origen=vuelo.origen,
-            destino=vuelo.destino,
-            hora_salida=vuelo.hora_salida,
-            hora_llegada=vuelo.hora_llegada,
-            prioridad=vuelo.prioridad,
-            estado=vuelo.estado,
-            emergencia=vuelo.emergencia
-        )
+            # Extraer el nodo
+            nodo_extraido, exito = self.lista_repo.extraer_nodo(elemento.nodo_id, espejo.lista_id)
+            if not exito or not nodo_extraido:
+                return None
+                
+            espejo.extraer(posicion)
+            self._marcar_cambio("extraido", nodo_id=elemento.nodo_id, posicion=posicion, vuelo_id=elemento.vuelo.id)
+            return elemento.vuelo
         
     def insertar_vuelo_ordenado_por_prioridad(self, vuelo_id: int) -> Optional[NodoDobleVueloDTO]:
         """
         Inserta un vuelo en la posición correcta según su prioridad y estado de emergencia.
-        Los vuelos de emergencia van al frente de la lista principal.
-        """
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        vuelo = self.vuelo_repo.obtener_vuelo_por_id(vuelo_id)
-        if not vuelo:
-            return None
-            
-        # Si es emergencia, insertar al frente
-        if vuelo.emergencia:
-            return self._nodo_a_dto(self.lista_repo.insertar_nodo_al_frente(lista_dto.id, vuelo_id))
-            
-        # Obtener todos los nodos para determinar la posición correcta
-        nodos = self.lista_repo.obtener_nodos_de_lista(lista_dto.id)
+        Los vuelos de emergencia van al frente de la lista principal, luego los de mayor
+        prioridad y, a igual prioridad, los de menor hora de salida.
         
-        # Si no hay nodos o todos son de emergencia, insertar al final
-        if not nodos:
-            return self._nodo_a_dto(self.lista_repo.insertar_nodo_al_final(lista_dto.id, vuelo_id))
-            
-        # Determinar la posición correcta según la prioridad
-        posicion_insercion = 0
-        for nodo in nodos:
-            nodo_vuelo = self.vuelo_repo.obtener_vuelo_por_id(nodo.vuelo_id)
-            
-            # Primero pasar todos los vuelos de emergencia
-            if nodo_vuelo.emergencia:
-                posicion_insercion += 1
-                continue
+        El lugar lo decide la base de datos, donde el nodo se enlaza detrás del último nodo
+        de su cubeta con clave menor o igual. Para replicarlo en el espejo hace falta el índice
+        de ese lugar: mientras el espejo esté ordenado es la búsqueda binaria sobre sus claves;
+        si no, se cuentan en la base de datos los nodos con clave de orden (posicion) menor.
+        Si el espejo ya no coincide con la base de datos en ese lugar, se descarta y se vuelve
+        a cargar en la próxima lectura.
+        """
+        with self._mutando_espejo() as espejo:
+            vuelo = self.vuelo_repo.obtener_vuelo_por_id(vuelo_id)
+            if not vuelo:
+                return None
                 
-            # Luego ordenar por prioridad (mayor primero)
-            if not nodo_vuelo.emergencia and nodo_vuelo.prioridad > vuelo.prioridad:
-                posicion_insercion += 1
-                continue
+            nodo = self.lista_repo.insertar_nodo_ordenado(espejo.lista_id, vuelo_id)
+            if not nodo:
+                return None
                 
-            # Si tienen misma prioridad, ordenar por hora de salida
-            if (not nodo_vuelo.emergencia and 
-                nodo_vuelo.prioridad == vuelo.prioridad and 
-                nodo_vuelo.hora_salida < vuelo.hora_salida):
-                posicion_insercion += 1
-                continue
+            if espejo.ordenada:
+                posicion = espejo.posicion_ordenada(vuelo)
+            else:
+                posicion = self.lista_repo.contar_nodos_antes_de_clave(espejo.lista_id, nodo.posicion)
+            anterior = espejo.en_posicion(posicion - 1) if posicion > 0 else None
+            siguiente = espejo.en_posicion(posicion)
+            if nodo.anterior_id == (anterior.nodo_id if anterior else espejo.cabezon_id) and \
+                    nodo.siguiente_id == (siguiente.nodo_id if siguiente else espejo.colon_id):
+                return self._aplicar_insercion(espejo, nodo, posicion)
                 
-            # Encontramos la posición correcta
-            break
-            
-        # TODO: Implementar la inserción en una posición específica
-        # Por ahora, insertamos al frente o al final según corresponda
-        if posicion_insercion == 0:
-            return self._nodo_a_dto(self.lista_repo.insertar_nodo_al_frente(lista_dto.id, vuelo_id))
-        else:
-            return self._nodo_a_dto(self.lista_repo.insertar_nodo_al_final(lista_dto.id, vuelo_id))
+            # El espejo no refleja la base de datos (por ejemplo, otro proceso cambió la lista)
+            espejo.invalidar()
+            nodo_dto = self._nodo_a_dto(
+                nodo, self.lista_repo.contar_nodos_antes_de_clave(espejo.lista_id, nodo.posicion), espejo.lista_id
+            )
+            self._marcar_insercion(nodo_dto)
+            return nodo_dto
     
     def reordenar_lista_por_prioridad(self) -> bool:
         """Reordena todos los nodos de la lista principal según prioridad y estado de emergencia"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        return self.lista_repo.reordenar_lista_por_prioridad(lista_dto.id)
+        with self._mutando_espejo() as espejo:
+            reordenada = self.lista_repo.reordenar_lista_por_prioridad(espejo.lista_id)
+            
+            # El nuevo orden se toma de la base de datos; el evento lleva los nodos en ese orden
+            espejo.invalidar()
+            if reordenada:
+                self.cargar_espejo()
+                self._marcar_cambio("reordenado", nodos=[elemento.nodo_id for elemento in self.espejo])
+            return reordenada
 
     def insertar_vuelo_en_posicion(self, vuelo_id: int, posicion: int) -> Optional[NodoDobleVueloDTO]:
         """
@@ -185,54 +348,39 @@ class ListaDobleEnlazadaServicio:
         Si la posición es negativa, inserta al frente.
         Si la posición es mayor que el tamaño de la lista, inserta al final.
         """
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        # Insertamos el vuelo en la posición especificada
-        nodo = self.lista_repo.insertar_nodo_en_posicion(lista_dto.id, vuelo_id, posicion)
-        if not nodo:
-            return None
-        return self._nodo_a_dto(nodo)
+        with self._mutando_espejo() as espejo:
+            # Insertamos el vuelo en la posición especificada
+            posicion = min(max(posicion, 0), len(espejo))
+            return self._insertar_en_posicion_del_espejo(espejo, espejo.lista_id, vuelo_id, posicion)
 
     def obtener_cantidad_nodos(self) -> int:
-        """Obtiene la cantidad de nodos en la lista principal"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        return lista_dto.tamanio
+        """
+        Obtiene la cantidad de nodos en la lista principal: del espejo si está cargado o,
+        si no, del contador tamanio de la lista, sin cargar sus nodos.
+        """
+        with self.espejo.bloqueo:
+            if self.espejo.cargado:
+                return len(self.espejo)
+            return self.lista_repo.obtener_tamanio(self._id_lista_principal())
 
     def obtener_primer_vuelo(self) -> Optional[VueloDTO]:
         """Obtiene el primer vuelo de la lista principal"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        # Obtener el primer nodo 
-        primer_nodo = self.lista_repo.obtener_primer_nodo(lista_dto.id)
-        if not primer_nodo:
-            return None
-            
-        # Obtener el vuelo asociado al primer nodo
-        vuelo = self.vuelo_repo.obtener_vuelo_por_id(primer_nodo.vuelo_id)
-        if not vuelo:
-            return None
-            
-        return self.vuelo_servicio._vuelo_a_dto(vuelo)
+        with self.espejo.bloqueo:
+            primero = self._obtener_espejo().primero()
+        return primero.vuelo if primero else None
 
     def obtener_ultimo_vuelo(self) -> Optional[VueloDTO]:
         """Obtiene el último vuelo de la lista principal"""
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        # Obtener el último nodo 
-        ultimo_nodo = self.lista_repo.obtener_ultimo_nodo(lista_dto.id)
-        if not ultimo_nodo:
-            return None
-            
-        # Obtener el vuelo asociado al último nodo
-        vuelo = self.vuelo_repo.obtener_vuelo_por_id(ultimo_nodo.vuelo_id)
-        if not vuelo:
-            return None
-            
-        return self.vuelo_servicio._vuelo_a_dto(vuelo)
+        with self.espejo.bloqueo:
+            ultimo = self._obtener_espejo().ultimo()
+        return ultimo.vuelo if ultimo else None
+
+    def obtener_extremos(self) -> Tuple[int, Optional[VueloDTO], Optional[VueloDTO]]:
+        """Cantidad de nodos y primer y último vuelo de la lista principal, leídos juntos del espejo"""
+        with self.espejo.bloqueo:
+            espejo = self._obtener_espejo()
+            primero, ultimo = espejo.primero(), espejo.ultimo()
+            return len(espejo), primero.vuelo if primero else None, ultimo.vuelo if ultimo else None
 
     def mover_nodo_entre_posiciones(self, posicion_origen: int, posicion_destino: int) -> bool:
         """
@@ -245,10 +393,43 @@ class ListaDobleEnlazadaServicio:
         Returns:
             bool: True si el movimiento se realizó correctamente, False en caso contrario
         """
-        # Obtenemos o creamos la lista principal
-        lista_dto = self.obtener_o_crear_lista_principal()
-        
-        return self.lista_repo.mover_nodo_entre_posiciones(lista_dto.id, posicion_origen, posicion_destino)
+        with self._mutando_espejo() as espejo:
+            if not self.lista_repo.mover_nodo_entre_posiciones(espejo.lista_id, posicion_origen, posicion_destino):
+                return False
+            if posicion_origen != posicion_destino:
+                nodo_id = espejo.en_posicion(posicion_origen).nodo_id
+                espejo.mover(posicion_origen, posicion_destino)
+                self._marcar_cambio("movido", nodo_id=nodo_id, origen=posicion_origen, destino=posicion_destino)
+            return True
+
+    def _insertar_en_posicion_del_espejo(self, espejo: EspejoListaPrincipal, lista_id: int,
+                                         vuelo_id: int, posicion: int) -> Optional[NodoDobleVueloDTO]:
+        """Inserta el vuelo en la base de datos entre los nodos que el espejo tiene alrededor de la posición"""
+        anterior = espejo.en_posicion(posicion - 1) if posicion > 0 else None
+        siguiente = espejo.en_posicion(posicion)
+        nodo = self.lista_repo.insertar_nodo_entre(
+            lista_id,
+            vuelo_id,
+            anterior.nodo_id if anterior else espejo.cabezon_id,
+            siguiente.nodo_id if siguiente else espejo.colon_id
+        )
+        if not nodo:
+            return None
+        return self._aplicar_insercion(espejo, nodo, posicion)
+
+    def _aplicar_insercion(self, espejo: EspejoListaPrincipal, nodo: NodoDobleVuelos, posicion: int) -> NodoDobleVueloDTO:
+        """Construye el DTO del nodo recién insertado y replica la inserción en el espejo"""
+        nodo_dto = self._nodo_a_dto(nodo, posicion, espejo.lista_id)
+        espejo.insertar(posicion, nodo.id, nodo_dto.vuelo)
+        self._marcar_insercion(nodo_dto)
+        return nodo_dto
+
+    def _marcar_insercion(self, nodo_dto: NodoDobleVueloDTO):
+        """Publica la inserción con los datos del vuelo, para agregarlo a una copia local sin releerla"""
+        self._marcar_cambio(
+            "insertado", nodo_id=nodo_dto.id, posicion=nodo_dto.posicion,
+            vuelo=nodo_dto.vuelo.model_dump(mode="json")
+        )
 
     def _lista_a_dto(self, lista: ListaDobleEnlazadaCentinelas) -> ListaDobleEnlazadaCentinelasDTO:
         """Convierte un modelo Lista a un DTO"""
@@ -260,26 +441,22 @@ class ListaDobleEnlazadaServicio:
             colon_id=lista.colon_id
         )
         
-    def _nodo_a_dto(self, nodo: NodoDobleVuelos) -> NodoDobleVueloDTO:
-        """Convierte un modelo Nodo a un DTO"""
-        vuelo = self.vuelo_repo.obtener_vuelo_por_id(nodo.vuelo_id)
-        vuelo_dto = VueloDTO(
-            id=vuelo.id,
-            numero_vuelo=vuelo.numero_vuelo,
-            origen=vuelo.origen,
-            destino=vuelo.destino,
-            hora_salida=vuelo.hora_salida,
-            hora_llegada=vuelo.hora_llegada,
-            prioridad=vuelo.prioridad,
-            estado=vuelo.estado,
-            emergencia=vuelo.emergencia
-        ) if vuelo else None
+    def _nodo_a_dto(self, nodo: NodoDobleVuelos, posicion: int, lista_id: int) -> NodoDobleVueloDTO:
+        """
+        Convierte un modelo Nodo a un DTO.
+        La posición se recibe aparte porque nodo.posicion es una clave de orden dispersa;
+        la API expone siempre el índice denso (0..n-1) dentro de la lista.
+        El vuelo se toma de la relación nodo.vuelo, que no consulta si ya fue cargada; los nodos
+        que devuelven las sentencias Core del repositorio no la tienen y se busca por vuelo_id.
+        """
+        vuelo = nodo.vuelo or self.vuelo_repo.obtener_vuelo_por_id(nodo.vuelo_id)
+        vuelo_dto = self.vuelo_servicio._vuelo_a_dto(vuelo) if vuelo else None
         
         return NodoDobleVueloDTO(
             id=nodo.id,
             vuelo=vuelo_dto,
-            posicion=nodo.posicion,
-            lista_id=nodo.estado_header.id if nodo.estado_header else nodo.estado_trailer.id if nodo.estado_trailer else 0,
+            posicion=posicion,
+            lista_id=lista_id,
             anterior_id=nodo.anterior_id,
             siguiente_id=nodo.siguiente_id
         )
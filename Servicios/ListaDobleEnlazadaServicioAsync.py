@@ -0,0 +1,72 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Optional
+from Repositorios.ListaDobleEnlazadaCentinelasRepoAsync import ListaDobleEnlazadaCentinelasRepoAsync
+from Presentacion.DTOs.VueloDTO import VueloDTO
+from Servicios.VueloServicio import VueloServicio
+from Servicios.EspejoListaPrincipal import EspejoListaPrincipal, espejo_lista_principal
+from Servicios.VersionesDatos import recurso_lista
+
+# Resultado de _leer_espejo cuando el espejo no se puede leer sin esperar
+_SIN_ESPEJO = object()
+
+class ListaDobleEnlazadaServicioAsync:
+    """
+    Lecturas de ListaDobleEnlazadaServicio sobre una AsyncSession.
+
+    Se responde desde el espejo en memoria cuando está cargado y libre. El bloqueo del
+    espejo es un threading.RLock que las mutaciones mantienen mientras escriben en la base
+    de datos, así que aquí nunca se espera por él (bloquearía el event loop): si está tomado
+    o el espejo no está cargado, la respuesta se lee de la base de datos con consultas async.
+    Este servicio no modifica la lista ni carga el espejo; de eso se encarga el servicio síncrono.
+    """
+    def __init__(self, db: AsyncSession):
+        self.lista_repo = ListaDobleEnlazadaCentinelasRepoAsync(db)
+        self.espejo = espejo_lista_principal
+        
+    def _leer_espejo(self, lectura: Callable[[EspejoListaPrincipal], object]):
+        """Aplica la lectura al espejo si está cargado y nadie lo está modificando"""
+        if not self.espejo.bloqueo.acquire(blocking=False):
+            return _SIN_ESPEJO
+        try:
+            if not self.espejo.cargado:
+                return _SIN_ESPEJO
+            return lectura(self.espejo)
+        finally:
+            self.espejo.bloqueo.release()
+            
+    async def _id_lista_principal(self) -> Optional[int]:
+        """Id de la lista principal: el que ya resolvió el espejo o, si no, el de la base de datos"""
+        if self.espejo.lista_id is not None:
+            return self.espejo.lista_id
+        return await self.lista_repo.obtener_id_de_lista("principal")
+        
+    async def recurso_de_lista(self) -> str:
+        """Recurso de VersionesDatos con la versión de la lista principal (ver ListaDobleEnlazadaServicio)"""
+        return recurso_lista(await self._id_lista_principal())
+        
+    async def obtener_cantidad_nodos(self) -> int:
+        """Obtiene la cantidad de nodos en la lista principal"""
+        cantidad = self._leer_espejo(len)
+        if cantidad is not _SIN_ESPEJO:
+            return cantidad
+        lista_id = await self._id_lista_principal()
+        return await self.lista_repo.obtener_tamanio(lista_id) if lista_id is not None else 0
+        
+    async def obtener_primer_vuelo(self) -> Optional[VueloDTO]:
+        """Obtiene el primer vuelo de la lista principal"""
+        return await self._obtener_vuelo_en_extremo(EspejoListaPrincipal.primero, "cabezon")
+        
+    async def obtener_ultimo_vuelo(self) -> Optional[VueloDTO]:
+        """Obtiene el último vuelo de la lista principal"""
+        return await self._obtener_vuelo_en_extremo(EspejoListaPrincipal.ultimo, "colon")
+        
+    async def _obtener_vuelo_en_extremo(self, lectura, centinela: str) -> Optional[VueloDTO]:
+        elemento = self._leer_espejo(lectura)
+        if elemento is not _SIN_ESPEJO:
+            return elemento.vuelo if elemento else None
+            
+        lista_id = await self._id_lista_principal()
+        if lista_id is None:
+            return None
+        vuelo = await self.lista_repo.obtener_vuelo_en_extremo(lista_id, centinela)
+        return VueloServicio._vuelo_a_dto(vuelo) if vuelo else None
@@ -0,0 +1,50 @@
+import threading
+from collections import deque
+from typing import List, Optional
+from Servicios.EventosDatos import EVENTO_RECARGAR, eventos_datos
+
+# Cambios de la lista que se conservan; los más viejos se descartan
+MAX_CAMBIOS_REGISTRADOS = 1000
+
+class RegistroCambios:
+    """
+    Registro acotado de los últimos cambios de la lista principal: los eventos de EventosDatos
+    que llevan `version` de lista, en el orden en que se publicaron. Como cada cambio
+    incrementa la versión en uno, los eventos guardados cubren un rango continuo de versiones
+    y sirven para que un cliente que tiene la lista en la versión N la ponga al día sin
+    volver a descargarla (GET /lista/cambios).
+    """
+    def __init__(self, max_cambios: int = MAX_CAMBIOS_REGISTRADOS):
+        self._bloqueo = threading.Lock()
+        self._cambios = deque(maxlen=max_cambios)
+
+    def entregar(self, evento: dict):
+        """Guarda el evento si es un cambio de lista (se suscribe a EventosDatos)"""
+        if "version" not in evento:
+            return
+        with self._bloqueo:
+            self._cambios.append(evento)
+
+    def desde(self, lista_id: int, desde_version: int, version_actual: int) -> Optional[List[dict]]:
+        """
+        Cambios de la lista posteriores a `desde_version`, o None si el registro ya no los
+        tiene todos (o alguno obliga a recargar) y el cliente debe volver a leer la lista completa
+        """
+        if desde_version == version_actual:
+            return []
+        if desde_version > version_actual:
+            return None
+        with self._bloqueo:
+            cambios = [
+                cambio for cambio in self._cambios
+                if cambio["lista_id"] == lista_id and desde_version < cambio["version"] <= version_actual
+            ]
+        if len(cambios) != version_actual - desde_version:
+            return None
+        if any(cambio["tipo"] == EVENTO_RECARGAR for cambio in cambios):
+            return None
+        return cambios
+
+# Registro compartido por todos los servicios dentro del proceso
+registro_cambios_lista = RegistroCambios()
+eventos_datos.suscribir(registro_cambios_lista)
@@ -0,0 +1,34 @@
+from sqlalchemy.orm import Session
+from Dominio.Modelos.Vuelo import Vuelo
+from Repositorios.VueloRepo import VueloRepo
+from Presentacion.DTOs.ResumenDTO import ResumenDTO
+from Servicios.ListaDobleEnlazadaServicio import ListaDobleEnlazadaServicio
+
+class ResumenServicio:
+    def __init__(self, db: Session):
+        self.vuelo_repo = VueloRepo(db)
+        self.lista_servicio = ListaDobleEnlazadaServicio(db)
+        
+    def obtener_resumen(self) -> ResumenDTO:
+        """
+        Resumen para el dashboard: los conteos de vuelos salen de una sola consulta sobre el
+        índice (estado, emergencia) y los datos de la lista principal del espejo en memoria, sin
+        descargar la tabla de vuelos ni recorrer la lista.
+        """
+        vuelos_por_estado = {estado: 0 for estado in Vuelo.estado.type.enums}
+        total_vuelos = emergencias = 0
+        for estado, cantidad, emergencias_del_estado in self.vuelo_repo.contar_vuelos_por_estado():
+            if estado is not None:
+                vuelos_por_estado[estado] = cantidad
+            total_vuelos += cantidad
+            emergencias += emergencias_del_estado
+            
+        tamanio_lista, primer_vuelo, ultimo_vuelo = self.lista_servicio.obtener_extremos()
+        return ResumenDTO(
+            total_vuelos=total_vuelos,
+            vuelos_por_estado=vuelos_por_estado,
+            emergencias=emergencias,
+            tamanio_lista=tamanio_lista,
+            primer_vuelo=primer_vuelo,
+            ultimo_vuelo=ultimo_vuelo
+        )
@@ -0,0 +1,56 @@
+import threading
+import uuid
+from typing import Callable
+
+# Recurso con la versión de la tabla de vuelos
+RECURSO_VUELOS = "vuelos"
+
+def recurso_lista(lista_id: int) -> str:
+    """Nombre del recurso con la versión de una lista"""
+    return f"lista-{lista_id}"
+
+def recurso_vuelo(vuelo_id: int) -> str:
+    """Nombre del recurso con la versión de un vuelo"""
+    return f"vuelo-{vuelo_id}"
+
+class VersionesDatos:
+    """
+    Contadores de versión, crecientes, de los datos que exponen las rutas de lectura: uno por
+    lista, uno por vuelo y uno para la tabla de vuelos. Los servicios incrementan el de cada
+    recurso que cambian después de que el cambio queda visible (en la base de datos y en el
+    espejo), así que una lectura que toma la versión antes de leer los datos nunca asocia una
+    versión nueva a datos viejos; en el peor caso asocia una versión vieja a datos nuevos y
+    el cliente vuelve a descargarlos.
+
+    Igual que el espejo, los contadores son locales al proceso y empiezan en 0 al arrancar;
+    por eso los ETag incluyen `epoca`, que cambia en cada arranque, y un ETag de un proceso
+    anterior nunca coincide.
+    """
+    def __init__(self):
+        self._bloqueo = threading.Lock()
+        self._versiones = {}
+        self._suscriptores = []
+        self.epoca = uuid.uuid4().hex[:8]
+
+    def suscribir(self, funcion: Callable[[str], None]):
+        """Registra una función que se llama con el nombre de cada recurso que cambia"""
+        self._suscriptores.append(funcion)
+
+    def version(self, recurso: str) -> int:
+        return self._versiones.get(recurso, 0)
+
+    def incrementar(self, *recursos: str):
+        """Registra un cambio en cada uno de los recursos recibidos"""
+        with self._bloqueo:
+            for recurso in recursos:
+                self._versiones[recurso] = self._versiones.get(recurso, 0) + 1
+        for recurso in recursos:
+            for funcion in self._suscriptores:
+                funcion(recurso)
+
+    def etag(self, recurso: str) -> str:
+        """ETag (entre comillas, como va en la cabecera) de la versión actual del recurso"""
+        return f'"{recurso}-{self.epoca}-{self.version(recurso)}"'
+
+# Versiones compartidas por todos los servicios dentro del proceso
+versiones_datos = VersionesDatos()
@@ -1,9 +1,14 @@
+from datetime import datetime
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any, Union
+from typing import Iterator, List, Optional, Dict, Any, Union
 from Repositorios.VueloRepo import VueloRepo
 from Dominio.Modelos.Vuelo import Vuelo
 from Presentacion.DTOs.VueloDTO import VueloDTO
 from Presentacion.DTOs.VueloCreadoDTO import VueloCreadoDTO
+from Servicios.CursorPaginacion import codificar_cursor, decodificar_cursor
+from Servicios.EspejoListaPrincipal import espejo_lista_principal
+from Servicios.EventosDatos import eventos_datos
+from Servicios.VersionesDatos import RECURSO_VUELOS, recurso_lista, recurso_vuelo, versiones_datos
 
 class VueloServicio:
     def __init__(self, db: Session):
@@ -23,13 +28,52 @@ class VueloServicio:
         )
         
         vuelo_creado = self.repo.crear_vuelo(vuelo)
-        return self._vuelo_a_dto(vuelo_creado)
+        # SQLite puede reutilizar el id de un vuelo eliminado: también cambia la versión de ese id
+        versiones_datos.incrementar(RECURSO_VUELOS, recurso_vuelo(vuelo_creado.id))
+        vuelo_creado_dto = self._vuelo_a_dto(vuelo_creado)
+        eventos_datos.publicar("vuelo_creado", vuelo=vuelo_creado_dto.model_dump(mode="json"))
+        return vuelo_creado_dto
         
     def obtener_vuelos(self) -> List[VueloDTO]:
         """Obtiene todos los vuelos"""
         vuelos = self.repo.obtener_vuelos()
         return [self._vuelo_a_dto(vuelo) for vuelo in vuelos]
         
+    def obtener_vuelos_planos(self) -> List[dict]:
+        """
+        Obtiene todos los vuelos como diccionarios con los campos de VueloDTO.
+        Los datos vienen de la base de datos, así que se entregan sin validar.
+        """
+        return self.repo.obtener_filas_de_vuelos()
+        
+    def iterar_vuelos_planos(self, tamanio_bloque: int) -> Iterator[List[dict]]:
+        """Recorre todos los vuelos en bloques de diccionarios con los campos de VueloDTO, sin validarlos"""
+        return self.repo.iterar_bloques_de_vuelos(tamanio_bloque)
+        
+    def obtener_pagina_de_vuelos(self, limite: int, cursor: Optional[str] = None) -> dict:
+        """
+        Obtiene una página de vuelos ordenados por hora de salida (y por id entre vuelos con la
+        misma hora), con la forma de PaginaVuelosDTO. El cursor es el `siguiente_cursor` de la
+        página anterior; lanza ValueError si no es válido.
+        """
+        hora_salida = vuelo_id = None
+        if cursor:
+            clave = decodificar_cursor(cursor, ("hora_salida", "id"))
+            try:
+                hora_salida = datetime.fromisoformat(clave["hora_salida"])
+                vuelo_id = int(clave["id"])
+            except (TypeError, ValueError):
+                raise ValueError("Cursor inválido")
+        
+        # Se pide un vuelo de más para saber si hay otra página sin contar los restantes
+        vuelos = self.repo.obtener_pagina_de_vuelos(limite + 1, hora_salida, vuelo_id)
+        siguiente_cursor = None
+        if len(vuelos) > limite:
+            del vuelos[limite:]
+            ultimo = vuelos[-1]
+            siguiente_cursor = codificar_cursor({"hora_salida": ultimo["hora_salida"].isoformat(), "id": ultimo["id"]})
+        return {"vuelos": vuelos, "siguiente_cursor": siguiente_cursor}
+        
     def obtener_vuelo_por_id(self, vuelo_id: int) -> Optional[VueloDTO]:
         """Obtiene un vuelo por su ID"""
         vuelo = self.repo.obtener_vuelo_por_id(vuelo_id)
@@ -47,10 +91,33 @@ class VueloServicio:
     def actualizar_vuelo(self, vuelo_id: int, vuelo_dto: VueloDTO) -> Optional[VueloDTO]:
         """Actualiza un vuelo existente"""
         vuelo_data = vuelo_dto.dict(exclude_unset=True)
-        vuelo_actualizado = self.repo.actualizar_vuelo(vuelo_id, vuelo_data)
-        if not vuelo_actualizado:
-            return None
-        return self._vuelo_a_dto(vuelo_actualizado)
+        with espejo_lista_principal.bloqueo:
+            vuelo_actualizado = self.repo.actualizar_vuelo(vuelo_id, vuelo_data)
+            if not vuelo_actualizado:
+                return None
+            vuelo_actualizado_dto = self._vuelo_a_dto(vuelo_actualizado)
+            
+            # Mantener al día la copia en memoria de la lista principal. Sin ella cargada,
+            # la lista del vuelo sale de su nodo.
+            if espejo_lista_principal.cargado:
+                en_espejo = espejo_lista_principal.actualizar_vuelo(vuelo_actualizado_dto)
+                lista_id = espejo_lista_principal.lista_id if en_espejo else None
+            else:
+                nodo = vuelo_actualizado.lista_item
+                lista_id = nodo.lista_id if nodo is not None else None
+            
+            vuelo_json = vuelo_actualizado_dto.model_dump(mode="json")
+            if lista_id is None:
+                versiones_datos.incrementar(RECURSO_VUELOS, recurso_vuelo(vuelo_id))
+                eventos_datos.publicar("vuelo_actualizado", vuelo=vuelo_json)
+            else:
+                # Las respuestas de la lista incluyen los datos de sus vuelos
+                recurso = recurso_lista(lista_id)
+                versiones_datos.incrementar(RECURSO_VUELOS, recurso_vuelo(vuelo_id), recurso)
+                eventos_datos.publicar(
+                    "vuelo_actualizado", lista_id=lista_id, version=versiones_datos.version(recurso), vuelo=vuelo_json
+                )
+        return vuelo_actualizado_dto
         
     def vuelo_esta_en_lista(self, vuelo_id: int) -> bool:
         """Verifica si un vuelo está actualmente en la lista doble"""
@@ -62,10 +129,15 @@ class VueloServicio:
         if self.vuelo_esta_en_lista(vuelo_id):
             return False
         
-        return self.repo.eliminar_vuelo(vuelo_id)
+        eliminado = self.repo.eliminar_vuelo(vuelo_id)
+        if eliminado:
+            versiones_datos.incrementar(RECURSO_VUELOS, recurso_vuelo(vuelo_id))
+            eventos_datos.publicar("vuelo_eliminado", vuelo_id=vuelo_id)
+        return eliminado
         
-    def _vuelo_a_dto(self, vuelo: Vuelo) -> VueloDTO:
-        """Convierte un modelo Vuelo a un DTO"""
+    @staticmethod
+    def _vuelo_a_dto(vuelo: Vuelo) -> VueloDTO:
+        """Convierte un modelo Vuelo a un DTO (no usa la sesión, así que sirve también para el servicio async)"""
         return VueloDTO(
             id=vuelo.id,
             numero_vuelo=vuelo.numero_vuelo,
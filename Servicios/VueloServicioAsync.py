@@ -0,0 +1,21 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from Repositorios.VueloRepoAsync import VueloRepoAsync
+from Presentacion.DTOs.VueloDTO import VueloDTO
+from Servicios.VueloServicio import VueloServicio
+
+class VueloServicioAsync:
+    """Lecturas de VueloServicio sobre una AsyncSession (ver AEROPUERTO_DB_ASYNC en Config/db.py)"""
+    def __init__(self, db: AsyncSession):
+        self.repo = VueloRepoAsync(db)
+        
+    async def obtener_vuelos_planos(self) -> List[dict]:
+        """Obtiene todos los vuelos como diccionarios con los campos de VueloDTO, sin validarlos"""
+        return await self.repo.obtener_filas_de_vuelos()
+        
+    async def obtener_vuelo_por_id(self, vuelo_id: int) -> Optional[VueloDTO]:
+        """Obtiene un vuelo por su ID"""
+        vuelo = await self.repo.obtener_vuelo_por_id(vuelo_id)
+        if not vuelo:
+            return None
+        return VueloServicio._vuelo_a_dto(vuelo)
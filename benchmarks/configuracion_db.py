@@ -0,0 +1,110 @@
+"""
+Operaciones por segundo con varios hilos según la configuración del engine de SQLite.
+
+Cada hilo abre una sesión por operación, igual que get_db: las lecturas buscan un vuelo por
+id y las escrituras crean un vuelo. Se compara SQLite sin PRAGMA (journal DELETE,
+synchronous=FULL) con el pool por defecto de SQLAlchemy, los PRAGMA de la aplicación
+(PRAGMAS_SQLITE: WAL, NORMAL, caché, mmap y busy_timeout) y esos mismos PRAGMA con
+expire_on_commit=False.
+
+    python benchmarks/configuracion_db.py
+    python benchmarks/configuracion_db.py --hilos 4 --operaciones 500 --escrituras 0 0.5
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sqlalchemy.exc import OperationalError
+from Config.db import crear_engine, crear_sessionmaker
+from Config.migraciones import aplicar_migraciones
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+# Registran sus tablas en Base.metadata para create_all
+from Dominio.Modelos.ListaDobleEnlCent import ListaDobleEnlazadaCentinelas
+from Dominio.Modelos.NodoDobleVuelos import NodoDobleVuelos
+from Dominio.Modelos.UltimoNodoPorPrioridad import UltimoNodoPorPrioridad
+from Repositorios.VueloRepo import VueloRepo
+
+VUELOS_PRECARGADOS = 500
+SIN_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+# Nombre -> PRAGMA (None: los de la aplicación), opciones del pool y expire_on_commit
+CONFIGURACIONES = [
+    ("DELETE, FULL, pool 5+10", SIN_PRAGMAS, dict(pool_size=5, max_overflow=10), True),
+    ("WAL, NORMAL, caché, mmap", None, {}, True),
+    ("WAL + expire_on_commit=False", None, {}, False),
+]
+
+def _vuelo(numero_vuelo, prioridad):
+    vuelo = Vuelo(numero_vuelo=numero_vuelo, origen="AEP", destino="COR", hora_salida=datetime(2026, 1, 1),
+                  hora_llegada=datetime(2026, 1, 2), prioridad=prioridad, estado="programado", emergencia=False)
+    vuelo.actualizar_clave_orden()
+    return vuelo
+
+def medir(ruta, pragmas, pool, expirar, hilos, operaciones, escrituras):
+    """Operaciones por segundo y cantidad de errores "database is locked" """
+    engine = crear_engine(f"sqlite:///{ruta}", pragmas=pragmas, **pool)
+    Base.metadata.create_all(engine)
+    aplicar_migraciones(engine)
+    fabrica = crear_sessionmaker(engine, expire_on_commit=expirar)
+    with fabrica() as db:
+        db.add_all(_vuelo(f"P{numero}", numero % 100) for numero in range(VUELOS_PRECARGADOS))
+        db.commit()
+
+    errores = []
+    def trabajo(hilo):
+        aleatorio = random.Random(hilo)
+        for operacion in range(operaciones):
+            db = fabrica()
+            try:
+                repo = VueloRepo(db)
+                if aleatorio.random() < escrituras:
+                    repo.crear_vuelo(_vuelo(f"H{hilo}-{operacion}", 5))
+                else:
+                    vuelo = repo.obtener_vuelo_por_id(aleatorio.randint(1, VUELOS_PRECARGADOS))
+                    vuelo.numero_vuelo, vuelo.prioridad
+            except OperationalError:
+                errores.append(hilo)
+            finally:
+                db.close()
+
+    trabajadores = [threading.Thread(target=trabajo, args=(hilo,)) for hilo in range(hilos)]
+    inicio = time.perf_counter()
+    for trabajador in trabajadores:
+        trabajador.start()
+    for trabajador in trabajadores:
+        trabajador.join()
+    duracion = time.perf_counter() - inicio
+    engine.dispose()
+    return hilos * operaciones / duracion, len(errores)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--hilos", type=int, default=8)
+    parser.add_argument("--operaciones", type=int, default=300, help="operaciones por hilo")
+    parser.add_argument("--escrituras", type=float, nargs="+", default=[0, 0.2, 0.5],
+                        help="fracciones de operaciones que escriben")
+    argumentos = parser.parse_args()
+
+    directorio = tempfile.mkdtemp(prefix="bench_configuracion_db_")
+    try:
+        for escrituras in argumentos.escrituras:
+            print(f"-- {escrituras:.0%} escrituras")
+            for indice, (nombre, pragmas, pool, expirar) in enumerate(CONFIGURACIONES):
+                ruta = os.path.join(directorio, f"{escrituras}_{indice}.db")
+                por_segundo, errores = medir(
+                    ruta, pragmas, pool, expirar, argumentos.hilos, argumentos.operaciones, escrituras
+                )
+                print(f"{nombre:30} {por_segundo:7.0f} ops/s  errores {errores}")
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
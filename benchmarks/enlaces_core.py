@@ -0,0 +1,107 @@
+"""
+Inserciones y extracciones por segundo de ListaDobleEnlazadaCentinelasRepo con sentencias Core
+(usar_core=True) y con el camino ORM (usar_core=False).
+
+Inserta n nodos alternando frente y final y después extrae la mitad, con una sesión y una
+transacción por operación, igual que la API. Se mide con tres configuraciones de SQLite:
+la de la aplicación (crear_engine con PRAGMAS_SQLITE: WAL y synchronous=NORMAL), la de
+SQLite sin PRAGMA (journal DELETE y synchronous=FULL, un fsync por commit) y en memoria.
+
+    python benchmarks/enlaces_core.py
+    python benchmarks/enlaces_core.py --nodos 500 --configuraciones aplicacion memoria
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from Config.db import crear_engine
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+# Registran sus tablas en Base.metadata para create_all
+from Dominio.Modelos.ListaDobleEnlCent import ListaDobleEnlazadaCentinelas
+from Dominio.Modelos.NodoDobleVuelos import NodoDobleVuelos
+from Dominio.Modelos.UltimoNodoPorPrioridad import UltimoNodoPorPrioridad
+from Repositorios.ListaDobleEnlazadaCentinelasRepo import ListaDobleEnlazadaCentinelasRepo
+
+# Nombre de la configuración -> PRAGMA de crear_engine (None: los de la aplicación) y si la base es un archivo
+CONFIGURACIONES = {
+    "aplicacion": (None, True),
+    "sin_pragmas": ({}, True),
+    "memoria": ({}, False),
+}
+
+def _crear_vuelos(db, cantidad):
+    vuelos = [
+        Vuelo(numero_vuelo=f"V{numero}", origen="AEP", destino="COR", hora_salida=datetime(2026, 1, 1),
+              hora_llegada=datetime(2026, 1, 2), prioridad=numero % 100, estado="programado", emergencia=False)
+        for numero in range(cantidad)
+    ]
+    for vuelo in vuelos:
+        vuelo.actualizar_clave_orden()
+    db.add_all(vuelos)
+    db.commit()
+
+def medir(configuracion, usar_core, nodos, directorio):
+    """Inserciones y extracciones por segundo y sentencias SQL por operación"""
+    pragmas, en_archivo = CONFIGURACIONES[configuracion]
+    ruta = os.path.join(directorio, f"{configuracion}_{usar_core}.db")
+    engine = crear_engine(f"sqlite:///{ruta}" if en_archivo else "sqlite://", pragmas=pragmas)
+    Base.metadata.create_all(engine)
+    sentencias = [0]
+    event.listen(engine, "before_cursor_execute", lambda *argumentos: sentencias.__setitem__(0, sentencias[0] + 1))
+
+    db = sessionmaker(bind=engine)()
+    _crear_vuelos(db, nodos)
+    repo = ListaDobleEnlazadaCentinelasRepo(db, usar_core=usar_core)
+    lista_id = repo.crear_lista("benchmark").id
+
+    sentencias[0] = 0
+    inicio = time.perf_counter()
+    for vuelo_id in range(1, nodos + 1):
+        if vuelo_id % 2:
+            repo.insertar_nodo_al_final(lista_id, vuelo_id)
+        else:
+            repo.insertar_nodo_al_frente(lista_id, vuelo_id)
+    insercion = time.perf_counter() - inicio
+    sentencias_insercion = sentencias[0] / nodos
+
+    a_extraer = [nodo.id for nodo in repo.obtener_nodos_de_lista(lista_id)][:nodos // 2]
+    sentencias[0] = 0
+    inicio = time.perf_counter()
+    for nodo_id in a_extraer:
+        repo.extraer_nodo(nodo_id, lista_id)
+    extraccion = time.perf_counter() - inicio
+    sentencias_extraccion = sentencias[0] / len(a_extraer)
+
+    db.close()
+    engine.dispose()
+    return nodos / insercion, len(a_extraer) / extraccion, sentencias_insercion, sentencias_extraccion
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nodos", type=int, default=1000)
+    parser.add_argument("--configuraciones", nargs="+", choices=list(CONFIGURACIONES), default=list(CONFIGURACIONES))
+    argumentos = parser.parse_args()
+
+    directorio = tempfile.mkdtemp(prefix="bench_enlaces_")
+    try:
+        for configuracion in argumentos.configuraciones:
+            orm = medir(configuracion, False, argumentos.nodos, directorio)
+            core = medir(configuracion, True, argumentos.nodos, directorio)
+            print(
+                f"{configuracion:12} inserciones/s {orm[0]:7.0f} -> {core[0]:7.0f} ({core[0] / orm[0]:4.1f}x)  "
+                f"extracciones/s {orm[1]:7.0f} -> {core[1]:7.0f} ({core[1] / orm[1]:4.1f}x)  "
+                f"sentencias por inserción {orm[2]:4.1f} -> {core[2]:4.1f}, por extracción {orm[3]:4.1f} -> {core[3]:4.1f}"
+            )
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Inserción ordenada y reubicación por prioridad en los motores de la lista en memoria.
+
+Precarga n vuelos ya ordenados y mide, por operación, `insertar_ordenado_por_prioridad`
+de vuelos nuevos y `actualizar_posicion_por_prioridad` de esos mismos vuelos con otra
+prioridad. Se repite con horas de salida casi crecientes (los empates de cubeta se
+resuelven con pocos pasos) y con horas aleatorias (desempates largos).
+
+    python benchmarks/motores_lista.py
+    python benchmarks/motores_lista.py --tamanios 1000 10000 --motores enlazada cubetas saltos
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from Dominio.Estructuras.MotorLista import MOTORES, crear_lista_vuelos
+
+INICIO = datetime(2026, 1, 1)
+
+class VueloMedido:
+    """Lo que los motores leen de un vuelo: id y los campos del orden de la cola"""
+    __slots__ = "id", "emergencia", "prioridad", "hora_salida"
+
+    def __init__(self, id, emergencia, prioridad, hora_salida):
+        self.id = id
+        self.emergencia = emergencia
+        self.prioridad = prioridad
+        self.hora_salida = hora_salida
+
+def _vuelo(aleatorio, vuelo_id, dispersion_minutos):
+    return VueloMedido(
+        vuelo_id,
+        aleatorio.random() < 0.01,
+        aleatorio.randint(0, 100),
+        INICIO + timedelta(minutes=vuelo_id + aleatorio.randint(-dispersion_minutos, dispersion_minutos))
+    )
+
+def _orden_de_la_cola(vuelo):
+    # Las emergencias van al frente sin importar su prioridad, igual que en los motores
+    return (False,) if vuelo.emergencia else (True, -vuelo.prioridad, vuelo.hora_salida)
+
+def _operaciones(motor, tamanio):
+    # La lista enlazada recorre en O(n): con listas grandes se mide sobre menos operaciones
+    if motor != "enlazada" or tamanio <= 10**4:
+        return 1000
+    return 200 if tamanio <= 10**5 else 20
+
+def medir(motor, tamanio, dispersion_minutos):
+    """Microsegundos por inserción ordenada y por reubicación, con n vuelos precargados"""
+    aleatorio = random.Random(tamanio)
+    lista = crear_lista_vuelos(motor)
+    for vuelo in sorted((_vuelo(aleatorio, i, dispersion_minutos) for i in range(tamanio)), key=_orden_de_la_cola):
+        lista.insertar_al_final(vuelo)
+
+    operaciones = _operaciones(motor, tamanio)
+    nuevos = [_vuelo(aleatorio, tamanio + i, dispersion_minutos) for i in range(operaciones)]
+    inicio = time.perf_counter()
+    for vuelo in nuevos:
+        lista.insertar_ordenado_por_prioridad(vuelo)
+    insertar = (time.perf_counter() - inicio) / operaciones
+
+    inicio = time.perf_counter()
+    for vuelo in nuevos:
+        vuelo.prioridad = aleatorio.randint(0, 100)
+        lista.actualizar_posicion_por_prioridad(vuelo)
+    actualizar = (time.perf_counter() - inicio) / operaciones
+    return insertar * 1e6, actualizar * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tamanios", type=int, nargs="+", default=[10**3, 10**4, 10**5, 10**6])
+    parser.add_argument("--motores", nargs="+", choices=sorted(MOTORES), default=["enlazada", "cubetas"])
+    argumentos = parser.parse_args()
+
+    for nombre, dispersion in (("hora de salida casi creciente", 30), ("hora de salida aleatoria", 10**7)):
+        print(f"-- {nombre}")
+        for tamanio in argumentos.tamanios:
+            for motor in argumentos.motores:
+                insertar, actualizar = medir(motor, tamanio, dispersion)
+                print(f"n={tamanio:>8} {motor:9} insertar {insertar:10.1f} us  actualizar {actualizar:10.1f} us")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Costo por elemento de GET /vuelos/ y GET /lista/ con y sin la validación de los DTOs.
+
+Las rutas de la aplicación serializan diccionarios planos con RespuestaJSONRapida. Para
+comparar, el script agrega a la misma aplicación dos rutas con el camino anterior: el
+servicio construye un VueloDTO (o un NodoDobleVueloDTO) por elemento y FastAPI los vuelve
+a validar contra response_model. Ambas versiones deben devolver el mismo JSON.
+
+La caché de respuestas se desactiva y la base de datos es un archivo temporal.
+
+    python benchmarks/serializacion.py
+    python benchmarks/serializacion.py --vuelos 2000 --repeticiones 20
+"""
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+DIRECTORIO = tempfile.mkdtemp(prefix="bench_serializacion_")
+os.environ["AEROPUERTO_DB_URL"] = f"sqlite:///{os.path.join(DIRECTORIO, 'aeropuerto.db')}"
+os.environ["AEROPUERTO_CACHE_TTL"] = "0"
+os.environ["AEROPUERTO_DB_ASYNC"] = "0"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import Depends
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+import main
+from Config.db import SessionLocal, get_db
+from Dominio.Modelos.Vuelo import Vuelo
+from Presentacion.DTOs.ListaDobleEnlazadaCentinelasDTO import ListaConNodosDTO
+from Presentacion.DTOs.VueloDTO import VueloDTO
+from Repositorios.ListaDobleEnlazadaCentinelasRepo import ListaDobleEnlazadaCentinelasRepo
+from Servicios.ListaDobleEnlazadaServicio import ListaDobleEnlazadaServicio
+from Servicios.VueloServicio import VueloServicio
+
+@main.app.get("/benchmark/vuelos-validados", response_model=List[VueloDTO])
+def vuelos_validados(db: Session = Depends(get_db)):
+    return VueloServicio(db).obtener_vuelos()
+
+@main.app.get("/benchmark/lista-validada", response_model=ListaConNodosDTO)
+def lista_validada(db: Session = Depends(get_db)):
+    return ListaDobleEnlazadaServicio(db).obtener_lista_con_nodos()
+
+def cargar_datos(cantidad):
+    """Crea `cantidad` vuelos y los encola todos en la lista principal"""
+    db = SessionLocal()
+    for numero in range(cantidad):
+        vuelo = Vuelo(
+            numero_vuelo=f"B{numero}", origen="SCL", destino="LIM",
+            hora_salida=datetime(2026, 1, 1) + timedelta(minutes=numero, microseconds=numero),
+            hora_llegada=datetime(2026, 1, 2), prioridad=numero % 100, estado="programado",
+            emergencia=numero % 50 == 0
+        )
+        vuelo.actualizar_clave_orden()
+        db.add(vuelo)
+    db.commit()
+    servicio = ListaDobleEnlazadaServicio(db)
+    lista_id = servicio.obtener_o_crear_lista_principal().id
+    repo = ListaDobleEnlazadaCentinelasRepo(db)
+    for vuelo_id in range(1, cantidad + 1):
+        repo.insertar_nodo_al_final(lista_id, vuelo_id)
+    servicio.cargar_espejo()
+    db.close()
+
+def medir(cliente, ruta, repeticiones):
+    """Segundos por petición y cuerpo de la última respuesta"""
+    cliente.get(ruta)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        respuesta = cliente.get(ruta)
+    return (time.perf_counter() - inicio) / repeticiones, respuesta.content
+
+def ejecutar():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--vuelos", type=int, default=10000)
+    parser.add_argument("--repeticiones", type=int, default=10)
+    argumentos = parser.parse_args()
+
+    cargar_datos(argumentos.vuelos)
+    cliente = TestClient(main.app)
+    for nombre, validada, rapida in (
+        ("GET /vuelos/", "/benchmark/vuelos-validados", "/vuelos/"),
+        ("GET /lista/", "/benchmark/lista-validada", "/lista/"),
+    ):
+        antes, cuerpo_antes = medir(cliente, validada, argumentos.repeticiones)
+        despues, cuerpo_despues = medir(cliente, rapida, argumentos.repeticiones)
+        identico = "idénticos" if cuerpo_antes == cuerpo_despues else (
+            "mismo JSON" if json.loads(cuerpo_antes) == json.loads(cuerpo_despues) else "DISTINTOS"
+        )
+        por_elemento = 1e6 / argumentos.vuelos
+        print(
+            f"{nombre:13} validando {antes * 1000:7.1f} ms ({antes * por_elemento:5.1f} us/elemento)  "
+            f"directo {despues * 1000:7.1f} ms ({despues * por_elemento:5.1f} us/elemento)  "
+            f"{antes / despues:4.1f}x  cuerpos {identico}"
+        )
+
+if __name__ == "__main__":
+    try:
+        ejecutar()
+    finally:
+        shutil.rmtree(DIRECTORIO, ignore_errors=True)
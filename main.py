@@ -1,13 +1,20 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from Config.db import engine
+from Config.db import USAR_ASYNC, engine, engine_async, SessionLocal
+from Config.migraciones import aplicar_migraciones
 from Dominio.Modelos.Base import Base
-from Presentacion.API.Rutas import ListaDoble_Rutas, Vuelo_Rutas
+from Presentacion.API.Rutas import ListaDoble_Rutas, Resumen_Rutas, Vuelo_Rutas
+from Presentacion.API.Rutas import ListaDoble_Rutas_Async, Vuelo_Rutas_Async
+from Servicios.CacheRespuestas import cache_respuestas
+from Servicios.ListaDobleEnlazadaServicio import ListaDobleEnlazadaServicio
 
 # Crear las tablas en la base de datos
 Base.metadata.create_all(bind=engine)
 
+# Aplicar a las bases existentes los cambios de esquema pendientes
+aplicar_migraciones(engine)
+
 # Crear la aplicación FastAPI
 app = FastAPI(
     title="API del Aeropuerto",
@@ -24,14 +31,38 @@ app.add_middleware(
     allow_headers=["*"],  # Permitir todos los headers
 )
 
-# Incluir rutas
+# Cargar en memoria la lista principal al arrancar
+@app.on_event("startup")
+def cargar_lista_principal():
+    db = SessionLocal()
+    try:
+        ListaDobleEnlazadaServicio(db).cargar_espejo()
+    finally:
+        db.close()
+
+# Cerrar las conexiones del engine asyncio al apagar
+@app.on_event("shutdown")
+async def cerrar_engine_async():
+    if engine_async is not None:
+        await engine_async.dispose()
+
+# Incluir rutas (las async primero, para que atiendan las lecturas que también definen las síncronas)
+if USAR_ASYNC:
+    app.include_router(Vuelo_Rutas_Async.router)
+    app.include_router(ListaDoble_Rutas_Async.router)
 app.include_router(Vuelo_Rutas.router)
 app.include_router(ListaDoble_Rutas.router)
+app.include_router(Resumen_Rutas.router)
 
 @app.get("/")
 def read_root():
     return {"message": "Bienvenido a la API del Aeropuerto!"}
 
+# Aciertos, fallos y ocupación de la caché de respuestas de lectura
+@app.get("/cache/estadisticas")
+def obtener_estadisticas_cache():
+    return cache_respuestas.estadisticas()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
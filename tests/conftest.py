@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Las pruebas importan los paquetes del proyecto (Dominio, Servicios, ...) desde la raíz del repositorio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,44 @@
+import asyncio
+import sys
+from datetime import datetime
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+from Config.db import crear_engine, crear_engine_async
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+from Dominio.Modelos.NodoDobleVuelos import NodoDobleVuelos
+from Dominio.Modelos.UltimoNodoPorPrioridad import UltimoNodoPorPrioridad
+from Repositorios.VueloRepo import VueloRepo
+from Repositorios.VueloRepoAsync import VueloRepoAsync
+
+def test_sin_aiosqlite_el_engine_async_explica_que_falta(monkeypatch):
+    monkeypatch.setitem(sys.modules, "aiosqlite", None)
+    with pytest.raises(RuntimeError, match="pip install aiosqlite"):
+        crear_engine_async("sqlite:///aeropuerto.db")
+
+def test_el_repo_async_devuelve_las_mismas_filas_que_el_sincronico(tmp_path):
+    pytest.importorskip("aiosqlite")
+    url = f"sqlite:///{tmp_path / 'aeropuerto.db'}"
+    engine = crear_engine(url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for numero in range(3):
+        vuelo = Vuelo(
+            numero_vuelo=f"AR{numero}", origen="AEP", destino="COR", hora_salida=datetime(2026, 1, 1, numero),
+            hora_llegada=datetime(2026, 1, 2), prioridad=numero, estado="programado", emergencia=numero == 1
+        )
+        vuelo.actualizar_clave_orden()
+        db.add(vuelo)
+    db.commit()
+    esperadas = VueloRepo(db).obtener_filas_de_vuelos()
+    db.close()
+    engine.dispose()
+
+    async def leer():
+        engine_async = crear_engine_async(url)
+        async with AsyncSession(engine_async) as sesion:
+            filas = await VueloRepoAsync(sesion).obtener_filas_de_vuelos()
+        await engine_async.dispose()
+        return filas
+    assert asyncio.run(leer()) == esperadas
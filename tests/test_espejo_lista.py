@@ -0,0 +1,118 @@
+import random
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy.orm import sessionmaker
+from Config.db import crear_engine
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+from Presentacion.DTOs.VueloDTO import VueloDTO
+from Servicios.EspejoListaPrincipal import EspejoListaPrincipal, clave_de_orden
+from Servicios.ListaDobleEnlazadaServicio import ListaDobleEnlazadaServicio
+
+def _vuelo_dto(vuelo_id, prioridad, hora=0):
+    return VueloDTO(
+        id=vuelo_id, numero_vuelo=f"AR{vuelo_id}", origen="AEP", destino="COR",
+        hora_salida=datetime(2026, 1, 1, hora), hora_llegada=datetime(2026, 1, 2),
+        prioridad=prioridad, estado="programado", emergencia=False
+    )
+
+def test_el_espejo_detecta_cuando_deja_de_estar_ordenado():
+    espejo = EspejoListaPrincipal()
+    espejo.cargar([(10, _vuelo_dto(1, 90)), (11, _vuelo_dto(2, 50)), (12, _vuelo_dto(3, 10))])
+    assert espejo.ordenada
+
+    # Insertar respetando el orden y extraer no lo cambian
+    espejo.insertar(1, 13, _vuelo_dto(4, 70))
+    espejo.extraer(0)
+    assert espejo.ordenada
+
+    # Un vuelo de baja prioridad al frente desordena la lista hasta que se recarga
+    espejo.insertar(0, 14, _vuelo_dto(5, 0))
+    assert not espejo.ordenada
+    espejo.extraer(0)
+    assert not espejo.ordenada
+    espejo.cargar([(nodo.nodo_id, nodo.vuelo) for nodo in espejo])
+    assert espejo.ordenada
+
+    # También al mover un vuelo o cambiar su prioridad
+    espejo.mover(0, 2)
+    assert not espejo.ordenada
+    espejo.cargar([(10, _vuelo_dto(1, 90)), (11, _vuelo_dto(2, 50))])
+    espejo.actualizar_vuelo(_vuelo_dto(2, 100))
+    assert not espejo.ordenada
+
+def test_el_espejo_carga_desordenado():
+    espejo = EspejoListaPrincipal()
+    espejo.cargar([(10, _vuelo_dto(1, 10)), (11, _vuelo_dto(2, 50))])
+    assert not espejo.ordenada
+
+def test_actualizar_un_vuelo_solo_busca_su_posicion_si_cambia_la_clave(monkeypatch):
+    espejo = EspejoListaPrincipal()
+    espejo.cargar([(10 + vuelo_id, _vuelo_dto(vuelo_id, 50)) for vuelo_id in range(1, 5)])
+    buscadas = []
+    posicion_de_id = espejo._lista.posicion_de_id
+    monkeypatch.setattr(espejo._lista, "posicion_de_id", lambda vuelo_id: buscadas.append(vuelo_id) or posicion_de_id(vuelo_id))
+
+    # Otro destino no cambia la clave: se reemplaza el vuelo sin buscar su posición
+    assert espejo.actualizar_vuelo(_vuelo_dto(3, 50).model_copy(update={"destino": "MDZ"}))
+    assert buscadas == [] and espejo.en_posicion(2).vuelo.destino == "MDZ"
+
+    # Con otra prioridad se actualiza la clave de su posición, entre vuelos con la misma clave
+    assert espejo.actualizar_vuelo(_vuelo_dto(3, 90))
+    assert buscadas == [3]
+    assert espejo._claves == [clave_de_orden(elemento.vuelo) for elemento in espejo]
+    assert not espejo.ordenada
+
+    assert not espejo.actualizar_vuelo(_vuelo_dto(9, 90))
+
+@pytest.fixture
+def servicio():
+    engine = crear_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    servicio = ListaDobleEnlazadaServicio(db)
+    # Cada prueba usa su propio espejo en lugar del compartido por el proceso
+    servicio.espejo = EspejoListaPrincipal()
+    yield servicio
+    db.close()
+    engine.dispose()
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_la_insercion_ordenada_no_recarga_el_espejo(servicio, monkeypatch, semilla):
+    aleatorio = random.Random(semilla)
+    vuelos = []
+    for numero in range(150):
+        vuelo = Vuelo(
+            numero_vuelo=f"AR{numero}", origen="AEP", destino="COR",
+            hora_salida=datetime(2026, 1, 1) + timedelta(hours=aleatorio.randrange(6)),
+            hora_llegada=datetime(2026, 1, 2), prioridad=aleatorio.choice([0, 10, 50]),
+            estado="programado", emergencia=aleatorio.random() < 0.1
+        )
+        vuelo.actualizar_clave_orden()
+        vuelos.append(vuelo)
+    servicio.db.add_all(vuelos)
+    servicio.db.commit()
+    libres = [vuelo.id for vuelo in vuelos]
+    aleatorio.shuffle(libres)
+
+    servicio.obtener_o_crear_lista_principal()
+    servicio.cargar_espejo()
+    cargas = []
+    cargar_espejo = servicio.cargar_espejo
+    monkeypatch.setattr(servicio, "cargar_espejo", lambda: cargas.append(1) or cargar_espejo())
+
+    while libres:
+        operacion = aleatorio.choice("ooooofex")
+        if operacion == "f":
+            servicio.insertar_vuelo_al_frente(libres.pop())
+        elif operacion == "e":
+            servicio.insertar_vuelo_al_final(libres.pop())
+        elif operacion == "x" and len(servicio.espejo):
+            servicio.extraer_vuelo_de_posicion(aleatorio.randrange(len(servicio.espejo)))
+        else:
+            nodo = servicio.insertar_vuelo_ordenado_por_prioridad(libres.pop())
+            assert servicio.espejo.en_posicion(nodo.posicion).nodo_id == nodo.id
+        en_base = [nodo.id for nodo in servicio.lista_repo.obtener_nodos_de_lista(servicio.espejo.lista_id)]
+        assert [elemento.nodo_id for elemento in servicio.espejo] == en_base
+
+    assert not cargas
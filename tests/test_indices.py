@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+from Config.db import crear_engine
+from Config.migraciones import aplicar_migraciones
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+from Repositorios.ListaDobleEnlazadaCentinelasRepo import ESPACIO_POSICIONES, ListaDobleEnlazadaCentinelasRepo
+from Repositorios.VueloRepo import VueloRepo
+
+@pytest.fixture
+def db():
+    # La base se arma igual que al iniciar la aplicación: create_all y después las migraciones
+    engine = crear_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    aplicar_migraciones(engine)
+    sesion = sessionmaker(bind=engine)()
+    for numero in range(20):
+        vuelo = Vuelo(
+            numero_vuelo=f"AR{numero}", origen="AEP", destino="COR",
+            hora_salida=datetime(2026, 1, 1) + timedelta(hours=numero), hora_llegada=datetime(2026, 1, 2),
+            prioridad=numero % 3, estado=Vuelo.estado.type.enums[numero % 3], emergencia=numero % 5 == 0
+        )
+        vuelo.actualizar_clave_orden()
+        sesion.add(vuelo)
+    sesion.commit()
+    yield sesion
+    sesion.close()
+    engine.dispose()
+
+def _planes(db, operacion):
+    """Ejecuta la operación y devuelve el plan (EXPLAIN QUERY PLAN) de cada consulta que hizo"""
+    conexion = db.connection()
+    sentencias = []
+    def registrar(conexion, cursor, sentencia, parametros, contexto, executemany):
+        sentencias.append((sentencia, parametros))
+    event.listen(conexion, "before_cursor_execute", registrar)
+    try:
+        operacion()
+    finally:
+        event.remove(conexion, "before_cursor_execute", registrar)
+    assert sentencias
+    return [
+        [fila[-1] for fila in conexion.exec_driver_sql(f"EXPLAIN QUERY PLAN {sentencia}", parametros)]
+        for sentencia, parametros in sentencias
+    ]
+
+def _comprobar_busquedas(planes):
+    """Cada consulta busca por un índice y ninguna recorre una tabla ni un índice completo"""
+    for plan in planes:
+        assert any(paso.startswith("SEARCH") and "USING" in paso and "INDEX" in paso for paso in plan), plan
+        assert not any(paso.startswith("SCAN") for paso in plan), plan
+        assert not any("TEMP B-TREE" in paso for paso in plan), plan
+
+def test_el_recorrido_por_posicion_usa_el_indice_de_lista_y_posicion(db):
+    repo = ListaDobleEnlazadaCentinelasRepo(db)
+    lista_id = repo.crear_lista("principal").id
+    for vuelo_id in range(1, 11):
+        repo.insertar_nodo_al_final(lista_id, vuelo_id)
+
+    planes = _planes(db, lambda: (
+        repo.obtener_nodo_en_posicion(lista_id, 4),
+        repo.obtener_nodo_previo_a_clave(lista_id, 3 * ESPACIO_POSICIONES),
+        repo.obtener_nodo_previo_a_clave(lista_id, 3 * ESPACIO_POSICIONES, hacia_atras=True),
+        repo.contar_nodos_antes_de_clave(lista_id, 5 * ESPACIO_POSICIONES),
+        repo.contar_nodos(lista_id),
+    ))
+    _comprobar_busquedas(planes)
+    assert all("ix_NodoDobleVuelos_lista_posicion" in " ".join(plan) for plan in planes)
+
+def test_los_vuelos_por_estado_usan_el_indice_de_estado(db):
+    repo = VueloRepo(db)
+    planes = _planes(db, repo.contar_vuelos_por_estado)
+    _comprobar_busquedas(planes)
+    # Un rango del índice por cada estado y por los vuelos sin estado; el índice cubre la consulta
+    busquedas = [paso for plan in planes for paso in plan if paso.startswith("SEARCH")]
+    assert len(busquedas) == len(Vuelo.estado.type.enums) + 1
+    assert all("COVERING INDEX ix_vuelos_estado_emergencia" in paso for paso in busquedas)
+
+    conteos = {estado: (cantidad, emergencias) for estado, cantidad, emergencias in repo.contar_vuelos_por_estado()}
+    assert conteos == {"programado": (7, 2), "retrasado": (7, 1), "cancelado": (6, 1), None: (0, 0)}
+
+def test_las_paginas_de_vuelos_usan_el_indice_de_hora_de_salida(db):
+    repo = VueloRepo(db)
+    primera = repo.obtener_pagina_de_vuelos(5)
+    ultimo = primera[-1]
+
+    planes = _planes(db, lambda: repo.obtener_pagina_de_vuelos(5, ultimo["hora_salida"], ultimo["id"]))
+    _comprobar_busquedas(planes)
+    assert all("ix_vuelos_hora_salida_id" in " ".join(plan) for plan in planes)
+
+    # La primera página no tiene clave desde la que buscar: lee el índice en orden y corta en el límite,
+    # sin recorrer la tabla ni ordenarla
+    plan, = _planes(db, lambda: repo.obtener_pagina_de_vuelos(5))
+    assert plan == ["SCAN vuelos USING INDEX ix_vuelos_hora_salida_id"]
@@ -0,0 +1,164 @@
+import bisect
+import random
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import sessionmaker
+from Config.db import crear_engine
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+from Dominio.Modelos.ListaDobleEnlCent import ListaDobleEnlazadaCentinelas
+from Dominio.Modelos.UltimoNodoPorPrioridad import UltimoNodoPorPrioridad
+from Repositorios.ListaDobleEnlazadaCentinelasRepo import ListaDobleEnlazadaCentinelasRepo
+from Repositorios.VueloRepo import VueloRepo
+
+@pytest.fixture
+def engine():
+    engine = crear_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+@pytest.fixture(params=[True, False], ids=["core", "orm"])
+def repo(request, engine):
+    db = sessionmaker(bind=engine)()
+    yield ListaDobleEnlazadaCentinelasRepo(db, usar_core=request.param)
+    db.close()
+
+def _crear_vuelos(db, cantidad, aleatorio):
+    # Pocas prioridades y horas en punto, para que haya muchos empates de cubeta y de clave
+    vuelos = []
+    for numero in range(cantidad):
+        vuelo = Vuelo(
+            numero_vuelo=f"AR{numero}",
+            origen="AEP",
+            destino="COR",
+            hora_salida=datetime(2026, 1, 1) + timedelta(hours=aleatorio.randrange(6)),
+            hora_llegada=datetime(2026, 1, 2),
+            prioridad=aleatorio.choice([0, 10, 50]),
+            emergencia=aleatorio.random() < 0.1
+        )
+        vuelo.actualizar_clave_orden()
+        vuelos.append(vuelo)
+    db.add_all(vuelos)
+    db.commit()
+    return {vuelo.id: vuelo.clave_orden for vuelo in vuelos}
+
+def _ids_en_lista(repo, lista_id):
+    return [nodo.vuelo_id for nodo in repo.obtener_nodos_de_lista(lista_id)]
+
+def _comprobar_ultimos(repo, lista_id, claves):
+    """Si la tabla está vigente, cada cubeta apunta al último nodo de la lista con esa cubeta"""
+    repo.db.expire_all()
+    if not repo.obtener_lista_por_id(lista_id).ultimos_validos:
+        return
+    esperados = {}
+    for nodo in repo.obtener_nodos_de_lista(lista_id):
+        esperados[UltimoNodoPorPrioridad.cubeta_de(claves[nodo.vuelo_id])] = nodo.id
+    registrados = dict(repo.db.execute(
+        select(UltimoNodoPorPrioridad.cubeta, UltimoNodoPorPrioridad.nodo_id).where(
+            UltimoNodoPorPrioridad.lista_id == lista_id
+        )
+    ).all())
+    assert registrados == esperados
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_insercion_ordenada_va_detras_de_los_empates(repo, semilla):
+    aleatorio = random.Random(semilla)
+    claves = _crear_vuelos(repo.db, 120, aleatorio)
+    lista = repo.crear_lista()
+    esperados, libres = [], list(claves)
+    aleatorio.shuffle(libres)
+    for _ in range(200):
+        if libres and (not esperados or aleatorio.random() < 0.8):
+            vuelo_id = libres.pop()
+            assert repo.insertar_nodo_ordenado(lista.id, vuelo_id) is not None
+            indice = bisect.bisect_right([claves[i] for i in esperados], claves[vuelo_id])
+            esperados.insert(indice, vuelo_id)
+        else:
+            posicion = aleatorio.randrange(len(esperados))
+            nodo = repo.obtener_nodo_en_posicion(lista.id, posicion)
+            assert repo.extraer_nodo(nodo.id, lista.id)[1]
+            libres.append(esperados.pop(posicion))
+        assert _ids_en_lista(repo, lista.id) == esperados
+    _comprobar_ultimos(repo, lista.id, claves)
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_las_inserciones_que_respetan_el_orden_mantienen_los_ultimos(repo, semilla):
+    aleatorio = random.Random(semilla)
+    claves = _crear_vuelos(repo.db, 90, aleatorio)
+    lista = repo.crear_lista()
+    por_clave = sorted(claves, key=lambda vuelo_id: claves[vuelo_id])
+    # Parte de los vuelos del medio entran ordenados y el resto por posición; los de los extremos,
+    # al frente o al final
+    medio, menores, mayores = por_clave[30:60], por_clave[:30], por_clave[60:]
+    en_lista, intermedios = medio[::2], medio[1::2]
+    for vuelo_id in en_lista:
+        repo.insertar_nodo_ordenado(lista.id, vuelo_id)
+    while menores or mayores or intermedios:
+        operacion = aleatorio.choice("fep")
+        if operacion == "f" and menores:
+            vuelo_id = menores.pop()
+            repo.insertar_nodo_al_frente(lista.id, vuelo_id)
+            en_lista.insert(0, vuelo_id)
+        elif operacion == "e" and mayores:
+            vuelo_id = mayores.pop(0)
+            repo.insertar_nodo_al_final(lista.id, vuelo_id)
+            en_lista.append(vuelo_id)
+        elif operacion == "p" and intermedios:
+            vuelo_id = intermedios.pop(aleatorio.randrange(len(intermedios)))
+            posicion = bisect.bisect_left([claves[i] for i in en_lista], claves[vuelo_id])
+            repo.insertar_nodo_en_posicion(lista.id, vuelo_id, posicion)
+            en_lista.insert(posicion, vuelo_id)
+        else:
+            continue
+        assert _ids_en_lista(repo, lista.id) == en_lista
+        assert repo.obtener_lista_por_id(lista.id).ultimos_validos
+        _comprobar_ultimos(repo, lista.id, claves)
+
+    # Un vuelo que va después de todos insertado al frente desordena la lista
+    repo.extraer_nodo(repo.obtener_ultimo_nodo(lista.id).id, lista.id)
+    repo.insertar_nodo_al_frente(lista.id, en_lista[-1])
+    repo.db.expire_all()
+    assert not repo.obtener_lista_por_id(lista.id).ultimos_validos
+
+def test_actualizar_un_vuelo_solo_invalida_los_ultimos_de_su_lista(repo):
+    claves = _crear_vuelos(repo.db, 8, random.Random(0))
+    listas = [repo.crear_lista("principal").id, repo.crear_lista("secundaria").id]
+    for vuelo_id in claves:
+        repo.insertar_nodo_ordenado(listas[vuelo_id % 2], vuelo_id)
+    repo.db.expire_all()
+    assert all(repo.obtener_lista_por_id(lista_id).ultimos_validos for lista_id in listas)
+
+    # El vuelo 2 está en la primera lista
+    VueloRepo(repo.db).actualizar_vuelo(2, {"prioridad": 90})
+    repo.db.expire_all()
+    assert not repo.obtener_lista_por_id(listas[0]).ultimos_validos
+    assert repo.obtener_lista_por_id(listas[1]).ultimos_validos
+
+def test_insercion_ordenada_no_depende_de_los_empates(engine):
+    db = sessionmaker(bind=engine)()
+    repo = ListaDobleEnlazadaCentinelasRepo(db)
+    vuelos = [
+        Vuelo(numero_vuelo=f"AR{numero}", origen="AEP", destino="COR", prioridad=50,
+              hora_salida=datetime(2026, 1, 1) + timedelta(minutes=numero),
+              hora_llegada=datetime(2026, 1, 2))
+        for numero in range(200)
+    ]
+    for vuelo in vuelos:
+        vuelo.actualizar_clave_orden()
+    db.add_all(vuelos)
+    db.commit()
+    lista = repo.crear_lista()
+
+    sentencias = []
+    event.listen(engine, "before_cursor_execute", lambda *argumentos: sentencias.append(1))
+    cantidades = []
+    # Cada vuelo sale antes que los ya insertados de su cubeta, así que va delante de todos ellos
+    for vuelo in sorted(vuelos, key=lambda vuelo: vuelo.hora_salida, reverse=True):
+        sentencias.clear()
+        repo.insertar_nodo_ordenado(lista.id, vuelo.id)
+        cantidades.append(len(sentencias))
+    db.close()
+
+    assert max(cantidades[1:]) == min(cantidades[1:]) <= 10
@@ -0,0 +1,66 @@
+from datetime import datetime
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.orm import sessionmaker
+from Config.db import crear_engine
+from Config.migraciones import _agregar_lista_a_nodos
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+from Dominio.Modelos.NodoDobleVuelos import NodoDobleVuelos
+from Repositorios.ListaDobleEnlazadaCentinelasRepo import ESPACIO_POSICIONES, ListaDobleEnlazadaCentinelasRepo
+
+CANTIDAD = 6
+
+@pytest.fixture
+def repo():
+    engine = crear_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for numero in range(CANTIDAD + 1):
+        vuelo = Vuelo(
+            numero_vuelo=f"AR{numero}", origen="AEP", destino="COR", hora_salida=datetime(2026, 1, 1, numero),
+            hora_llegada=datetime(2026, 1, 2), prioridad=10
+        )
+        vuelo.actualizar_clave_orden()
+        db.add(vuelo)
+    db.commit()
+    yield ListaDobleEnlazadaCentinelasRepo(db)
+    db.close()
+    engine.dispose()
+
+def _lista_heredada(repo, posiciones):
+    """Lista con CANTIDAD vuelos cuyos nodos quedan como en una base anterior a la migración 3"""
+    lista_id = repo.crear_lista("principal").id
+    for vuelo_id in range(1, CANTIDAD + 1):
+        repo.insertar_nodo_al_final(lista_id, vuelo_id)
+    nodos = NodoDobleVuelos.__table__
+    regulares = [nodo.id for nodo in repo.obtener_nodos_de_lista(lista_id)]
+    for nodo_id, posicion in zip(regulares, posiciones):
+        repo.db.execute(update(nodos).where(nodos.c.id == nodo_id).values(posicion=posicion))
+    repo.db.execute(update(nodos).values(lista_id=None))
+    repo.db.commit()
+    return lista_id, regulares
+
+@pytest.mark.parametrize("posiciones", [
+    list(range(CANTIDAD)),
+    [0, 0, 1, 1, 1, 2],
+    [5, 4, 3, 2, 1, 0],
+], ids=["densas", "repetidas", "invertidas"])
+def test_la_migracion_renumera_las_posiciones_en_el_orden_de_los_enlaces(repo, posiciones):
+    lista_id, regulares = _lista_heredada(repo, posiciones)
+    with repo.db.get_bind().begin() as conexion:
+        _agregar_lista_a_nodos(conexion)
+    repo.db.expire_all()
+
+    nodos = NodoDobleVuelos.__table__
+    filas = repo.db.execute(select(nodos.c.id, nodos.c.posicion, nodos.c.lista_id, nodos.c.centinela)).all()
+    assert all(fila.lista_id == lista_id for fila in filas)
+    assert all(fila.posicion is None for fila in filas if fila.centinela)
+    assert {fila.id: fila.posicion for fila in filas if not fila.centinela} == {
+        nodo_id: indice * ESPACIO_POSICIONES for indice, nodo_id in enumerate(regulares)
+    }
+
+    # El índice (lista_id, posicion) vuelve a seguir los enlaces y los huecos admiten inserciones
+    assert repo.obtener_nodo_en_posicion(lista_id, 2).id == regulares[2]
+    repo.insertar_nodo_en_posicion(lista_id, CANTIDAD + 1, 3)
+    assert [nodo.vuelo_id for nodo in repo.obtener_nodos_de_lista(lista_id)] == [1, 2, 3, CANTIDAD + 1, 4, 5, 6]
@@ -0,0 +1,138 @@
+import random
+from datetime import datetime, timedelta
+import pytest
+from Dominio.Estructuras.TDA_Lista_doblemente_enlazada import ListaDoblementeEnlazadaCentinela
+from Dominio.Estructuras.TDA_Lista_con_saltos import ListaIndexadaConSaltos
+from Dominio.Estructuras.TDA_Lista_por_cubetas import ListaPorCubetasDePrioridad
+
+SEMILLAS = range(20)
+OPERACIONES = 400
+
+class VueloPrueba:
+    """Lo que los motores leen de un vuelo: id y los campos del orden de la cola"""
+    def __init__(self, id, emergencia, prioridad, hora_salida):
+        self.id = id
+        self.emergencia = emergencia
+        self.prioridad = prioridad
+        self.hora_salida = hora_salida
+
+def _vuelo_aleatorio(aleatorio, vuelo_id):
+    # Pocas prioridades y horas en punto, para que haya muchos empates
+    return VueloPrueba(
+        vuelo_id,
+        aleatorio.random() < 0.1,
+        aleatorio.randrange(5),
+        datetime(2026, 1, 1) + timedelta(hours=aleatorio.randrange(12))
+    )
+
+def _crear_motores(semilla):
+    return [
+        ListaDoblementeEnlazadaCentinela(),
+        ListaIndexadaConSaltos(semilla),
+        ListaPorCubetasDePrioridad(),
+    ]
+
+def _comprobar_enlaces_de_saltos(lista):
+    """En cada nivel, los enlaces hacia atrás y los anchos coinciden con los enlaces hacia adelante"""
+    posiciones = {id(nodo): posicion for posicion, nodo in enumerate(lista._nodos[vuelo.id] for vuelo in lista)}
+    posiciones[id(lista._cabezon)] = -1
+    for nivel in range(lista._nivel):
+        actual = lista._cabezon
+        while actual._siguientes[nivel] is not None:
+            siguiente = actual._siguientes[nivel]
+            assert siguiente._anteriores[nivel] is actual
+            assert actual._anchos[nivel] == posiciones[id(siguiente)] - posiciones[id(actual)]
+            actual = siguiente
+
+def _comparar(motores):
+    referencia = [vuelo.id for vuelo in motores[0]]
+    for motor in motores:
+        assert [motor.posicion_de_id(vuelo_id) for vuelo_id in referencia] == list(range(len(referencia)))
+        assert motor.posicion_de_id(-1) is None
+    for motor in motores[1:]:
+        assert [vuelo.id for vuelo in motor] == referencia, type(motor).__name__
+        assert len(motor) == len(referencia)
+        assert getattr(motor.obtener_primero(), "id", None) == (referencia[0] if referencia else None)
+        assert getattr(motor.obtener_ultimo(), "id", None) == (referencia[-1] if referencia else None)
+        if isinstance(motor, ListaIndexadaConSaltos):
+            _comprobar_enlaces_de_saltos(motor)
+
+def _mismo_resultado(motores, operacion):
+    resultados = [operacion(motor) for motor in motores]
+    ids = [getattr(resultado, "id", resultado) for resultado in resultados]
+    assert ids.count(ids[0]) == len(ids), ids
+
+@pytest.mark.parametrize("semilla", SEMILLAS)
+def test_operaciones_por_posicion_dan_el_mismo_contenido(semilla):
+    """Inserciones, extracciones y movimientos por posición o por id en cualquier orden"""
+    aleatorio = random.Random(semilla)
+    motores = _crear_motores(semilla)
+    siguiente_id = 0
+    for _ in range(OPERACIONES):
+        tamanio = len(motores[0])
+        operacion = aleatorio.random()
+        if operacion < 0.4 or tamanio == 0:
+            vuelo = _vuelo_aleatorio(aleatorio, siguiente_id)
+            siguiente_id += 1
+            posicion = aleatorio.randrange(-1, tamanio + 2)
+            forma = aleatorio.randrange(3)
+            for motor in motores:
+                if forma == 0:
+                    motor.insertar_al_frente(vuelo)
+                elif forma == 1:
+                    motor.insertar_al_final(vuelo)
+                else:
+                    motor.insertar_en_posicion(vuelo, posicion)
+        elif operacion < 0.6:
+            posicion = aleatorio.randrange(-1, tamanio + 1)
+            _mismo_resultado(motores, lambda motor: motor.extraer_de_posicion(posicion))
+        elif operacion < 0.75:
+            origen, destino = aleatorio.randrange(-1, tamanio + 1), aleatorio.randrange(-1, tamanio + 1)
+            _mismo_resultado(motores, lambda motor: motor.mover_vuelo(origen, destino))
+        elif operacion < 0.85:
+            vuelo_id = aleatorio.randrange(siguiente_id + 1)
+            _mismo_resultado(motores, lambda motor: motor.extraer_por_id(vuelo_id))
+        else:
+            posicion = aleatorio.randrange(-1, tamanio + 1)
+            _mismo_resultado(motores, lambda motor: motor.obtener_en_posicion(posicion))
+        _comparar(motores)
+
+@pytest.mark.parametrize("semilla", SEMILLAS)
+def test_operaciones_ordenadas_dan_el_mismo_contenido(semilla):
+    """
+    Inserciones ordenadas, extracciones y cambios de prioridad. La lista se mantiene
+    ordenada, que es cuando los motores prometen el mismo lugar para cada vuelo.
+    """
+    aleatorio = random.Random(semilla)
+    motores = _crear_motores(semilla)
+    vuelos = {}
+    for vuelo_id in range(OPERACIONES):
+        operacion = aleatorio.random()
+        if operacion < 0.55 or not vuelos:
+            vuelo = _vuelo_aleatorio(aleatorio, vuelo_id)
+            vuelos[vuelo.id] = vuelo
+            for motor in motores:
+                motor.insertar_ordenado_por_prioridad(vuelo)
+        elif operacion < 0.75:
+            posicion = aleatorio.randrange(len(motores[0]))
+            vuelo = motores[0].obtener_en_posicion(posicion)
+            _mismo_resultado(motores, lambda motor: motor.extraer_de_posicion(posicion))
+            vuelos.pop(vuelo.id)
+        else:
+            vuelo = vuelos[aleatorio.choice(list(vuelos))]
+            vuelo.prioridad = aleatorio.randrange(5)
+            vuelo.hora_salida = datetime(2026, 1, 1) + timedelta(hours=aleatorio.randrange(12))
+            _mismo_resultado(motores, lambda motor: motor.actualizar_posicion_por_prioridad(vuelo))
+        _comparar(motores)
+
+def test_lista_con_saltos_no_depende_del_estado_global_de_random():
+    """Con la misma semilla, la estructura interna es la misma aunque cambie random global"""
+    def alturas(semilla_global):
+        random.seed(semilla_global)
+        lista = ListaIndexadaConSaltos(7)
+        for vuelo_id in range(200):
+            random.random()
+            lista.insertar_al_final(VueloPrueba(vuelo_id, False, 0, datetime(2026, 1, 1)))
+        return [len(lista._nodos[vuelo_id]._siguientes) for vuelo_id in range(200)]
+
+    assert alturas(1) == alturas(2)
@@ -0,0 +1,49 @@
+from datetime import datetime
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from Config.db import crear_engine
+from Config.migraciones import _acotar_prioridades
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+from Presentacion.DTOs.VueloCreadoDTO import VueloCreadoDTO
+from Presentacion.DTOs.VueloDTO import VueloDTO
+
+SALIDA = datetime(2026, 1, 1, 8)
+
+def _datos_vuelo(prioridad):
+    return dict(
+        numero_vuelo="AR1", origen="AEP", destino="COR",
+        hora_salida=SALIDA, hora_llegada=datetime(2026, 1, 1, 10), prioridad=prioridad
+    )
+
+@pytest.mark.parametrize("prioridad", [-1, 101, 1000])
+def test_los_dtos_rechazan_prioridades_fuera_de_rango(prioridad):
+    with pytest.raises(ValidationError):
+        VueloCreadoDTO(**_datos_vuelo(prioridad))
+    with pytest.raises(ValidationError):
+        VueloDTO(id=1, **_datos_vuelo(prioridad))
+
+@pytest.mark.parametrize("prioridad", [0, 100, None])
+def test_los_dtos_aceptan_el_rango_completo(prioridad):
+    assert VueloCreadoDTO(**_datos_vuelo(prioridad)).prioridad == prioridad
+
+def test_la_clave_de_orden_no_acota_la_prioridad():
+    assert Vuelo.calcular_clave_orden(False, 100, SALIDA) < Vuelo.calcular_clave_orden(False, 99, SALIDA)
+    assert Vuelo.calcular_clave_orden(False, None, SALIDA) == Vuelo.calcular_clave_orden(False, 0, SALIDA)
+    with pytest.raises(ValueError):
+        Vuelo.calcular_clave_orden(False, 101, SALIDA)
+    with pytest.raises(ValueError):
+        Vuelo.calcular_clave_orden(False, -1, SALIDA)
+
+def test_la_migracion_acota_las_prioridades_guardadas():
+    engine = crear_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    vuelos = Vuelo.__table__
+    with engine.begin() as conexion:
+        for numero, prioridad in enumerate([-5, 50, 150, None]):
+            conexion.execute(insert(vuelos).values(**{**_datos_vuelo(prioridad), "numero_vuelo": f"AR{numero}"}))
+        _acotar_prioridades(conexion)
+        prioridades = conexion.execute(select(vuelos.c.prioridad).order_by(vuelos.c.id)).scalars().all()
+    engine.dispose()
+    assert prioridades == [0, 50, 100, None]
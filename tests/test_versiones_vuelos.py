@@ -0,0 +1,79 @@
+from datetime import datetime
+import pytest
+from sqlalchemy.orm import sessionmaker
+from Config.db import crear_engine
+from Dominio.Modelos.Base import Base
+from Dominio.Modelos.Vuelo import Vuelo
+from Presentacion.DTOs.VueloDTO import VueloDTO
+from Repositorios.ListaDobleEnlazadaCentinelasRepo import ListaDobleEnlazadaCentinelasRepo
+from Servicios import VueloServicio as modulo_vuelos
+from Servicios.EspejoListaPrincipal import EspejoListaPrincipal
+from Servicios.ListaDobleEnlazadaServicio import ListaDobleEnlazadaServicio
+from Servicios.VersionesDatos import RECURSO_VUELOS, VersionesDatos, recurso_lista, recurso_vuelo
+
+class EventosRegistrados:
+    def __init__(self):
+        self.publicados = []
+
+    def publicar(self, tipo, **datos):
+        self.publicados.append((tipo, datos))
+
+@pytest.fixture
+def entorno(monkeypatch):
+    """Servicios sobre una base en memoria, con espejo, versiones y eventos propios de la prueba"""
+    engine = crear_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    for numero in range(2):
+        vuelo = Vuelo(
+            numero_vuelo=f"AR{numero}", origen="AEP", destino="COR", hora_salida=datetime(2026, 1, 1, numero),
+            hora_llegada=datetime(2026, 1, 2), prioridad=10
+        )
+        vuelo.actualizar_clave_orden()
+        db.add(vuelo)
+    db.commit()
+
+    espejo, versiones, eventos = EspejoListaPrincipal(), VersionesDatos(), EventosRegistrados()
+    monkeypatch.setattr(modulo_vuelos, "espejo_lista_principal", espejo)
+    monkeypatch.setattr(modulo_vuelos, "versiones_datos", versiones)
+    monkeypatch.setattr(modulo_vuelos, "eventos_datos", eventos)
+    lista_servicio = ListaDobleEnlazadaServicio(db)
+    lista_servicio.espejo = espejo
+    lista_id = lista_servicio.obtener_o_crear_lista_principal().id
+    # Solo el vuelo 1 está en la lista
+    ListaDobleEnlazadaCentinelasRepo(db).insertar_nodo_al_final(lista_id, 1)
+    yield db, lista_servicio, espejo, versiones, eventos, lista_id
+    db.close()
+    engine.dispose()
+
+def _actualizar(db, vuelo_id, prioridad):
+    return modulo_vuelos.VueloServicio(db).actualizar_vuelo(vuelo_id, VueloDTO.model_construct(prioridad=prioridad))
+
+@pytest.mark.parametrize("espejo_cargado", [False, True], ids=["sin_espejo", "con_espejo"])
+def test_actualizar_un_vuelo_de_la_lista_cambia_la_version_de_la_lista(entorno, espejo_cargado):
+    db, lista_servicio, espejo, versiones, eventos, lista_id = entorno
+    if espejo_cargado:
+        lista_servicio.cargar_espejo()
+
+    _actualizar(db, 1, 80)
+    assert versiones.version(recurso_lista(lista_id)) == 1
+    assert versiones.version(RECURSO_VUELOS) == versiones.version(recurso_vuelo(1)) == 1
+    (tipo, datos), = eventos.publicados
+    assert tipo == "vuelo_actualizado"
+    assert datos["lista_id"] == lista_id and datos["version"] == 1 and datos["vuelo"]["prioridad"] == 80
+    if espejo_cargado:
+        assert next(iter(espejo)).vuelo.prioridad == 80
+
+@pytest.mark.parametrize("espejo_cargado", [False, True], ids=["sin_espejo", "con_espejo"])
+def test_actualizar_un_vuelo_fuera_de_la_lista_no_cambia_la_version_de_la_lista(entorno, espejo_cargado):
+    db, lista_servicio, espejo, versiones, eventos, lista_id = entorno
+    if espejo_cargado:
+        lista_servicio.cargar_espejo()
+
+    _actualizar(db, 2, 80)
+    assert versiones.version(recurso_lista(lista_id)) == 0
+    assert versiones.version(recurso_lista(None)) == 0
+    assert versiones.version(RECURSO_VUELOS) == versiones.version(recurso_vuelo(2)) == 1
+    (tipo, datos), = eventos.publicados
+    assert tipo == "vuelo_actualizado"
+    assert "version" not in datos and "lista_id" not in datos and datos["vuelo"]["id"] == 2